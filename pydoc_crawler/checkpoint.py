@@ -0,0 +1,148 @@
+"""재개 가능한 크롤링을 위한 체크포인트."""
+
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO, Any, ClassVar
+
+from scrapy.settings import BaseSettings
+
+from pydoc_crawler.urls import canonicalize_url
+
+
+class CrawlCheckpoint:
+    """작업 디렉토리 기반 크롤링 체크포인트.
+
+    작업 디렉토리 구조::
+
+        <job_dir>/
+            checkpoint.json        출력 파일 오프셋, 크롤링별 수집 URL, 완료 목록
+            <spider>-<version>/    Scrapy JOBDIR (스케줄러 큐, requests.seen)
+
+    프런티어(대기 요청)와 요청 중복 필터는 Scrapy ``JOBDIR``가 보존하고,
+    이 클래스는 출력 파일의 유효 범위와 파이프라인의 URL 중복 집합을 보존합니다.
+    """
+
+    FILENAME = "checkpoint.json"
+
+    _instances: ClassVar[dict[Path, "CrawlCheckpoint"]] = {}
+
+    def __init__(self, job_dir: str | Path) -> None:
+        self.job_dir = Path(job_dir)
+        self.path = self.job_dir / self.FILENAME
+        self.outputs: dict[str, int] = {}
+        self.seen_urls: dict[str, set[str]] = {}
+        self.finished: set[str] = set()
+
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.outputs = data.get("outputs", {})
+            self.seen_urls = {
+                key: set(urls) for key, urls in data.get("seen_urls", {}).items()
+            }
+            self.finished = set(data.get("finished", []))
+
+    @classmethod
+    def for_job_dir(cls, job_dir: str | Path) -> "CrawlCheckpoint":
+        """작업 디렉토리별 공유 인스턴스 (파이프라인 간 상태 공유)."""
+        key = Path(job_dir).resolve()
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    @classmethod
+    def from_settings(cls, settings: BaseSettings) -> "CrawlCheckpoint | None":
+        """``CRAWL_JOB_DIR`` 또는 ``JOBDIR`` 설정으로 체크포인트 로드."""
+        job_dir = settings.get("CRAWL_JOB_DIR") or settings.get("JOBDIR")
+        if not job_dir:
+            return None
+        return cls.for_job_dir(job_dir)
+
+    @staticmethod
+    def crawl_key(spider_name: str, version: str) -> str:
+        """크롤링 식별자 (JOBDIR 하위 디렉토리 이름)."""
+        return f"{spider_name}-{version}"
+
+    @staticmethod
+    def key_for(settings: BaseSettings, spider_name: str) -> str:
+        """실행 중인 크롤링의 식별자 (JOBDIR 이름, 없으면 스파이더 이름)."""
+        return Path(settings.get("JOBDIR") or spider_name).name
+
+    def jobdir_for(self, spider_name: str, version: str) -> Path:
+        """크롤링별 Scrapy JOBDIR 경로."""
+        return self.job_dir / self.crawl_key(spider_name, version)
+
+    def is_finished(self, key: str) -> bool:
+        """정상 완료된 크롤링인지 확인."""
+        return key in self.finished
+
+    def mark_finished(self, key: str) -> None:
+        """크롤링 완료 기록."""
+        self.finished.add(key)
+        self.save()
+
+    def seen_urls_for(self, key: str) -> set[str]:
+        """크롤링별 수집 URL 집합 (파이프라인과 공유되는 같은 객체)."""
+        return self.seen_urls.setdefault(key, set())
+
+    def save(self) -> None:
+        """체크포인트를 원자적으로 저장."""
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "outputs": self.outputs,
+            "seen_urls": {key: sorted(urls) for key, urls in self.seen_urls.items()},
+            "finished": sorted(self.finished),
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def recover_output(
+        self,
+        filepath: Path,
+        key: str,
+        canonicalize: Callable[[str], str] = canonicalize_url,
+    ) -> int:
+        """출력 파일을 이어 쓸 수 있는 상태로 복구하고 오프셋 반환.
+
+        - 처음 쓰는 파일이면 비우고 시작
+        - 마지막 체크포인트 이후 기록된 완전한 줄은 유지하고 정규화된 URL을
+          수집 집합에 추가
+        - 중단으로 잘린 마지막 줄은 잘라냄
+        """
+        name = str(filepath)
+        if name not in self.outputs or not filepath.exists():
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            filepath.write_bytes(b"")
+            self.outputs[name] = 0
+            self.save()
+            return 0
+
+        offset = min(self.outputs[name], filepath.stat().st_size)
+        seen = self.seen_urls_for(key)
+
+        with open(filepath, "r+b") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record: dict[str, Any] = json.loads(line)
+                except ValueError:
+                    break
+                offset += len(line)
+                if "url" in record:
+                    seen.add(canonicalize(record["url"]))
+            f.truncate(offset)
+
+        self.outputs[name] = offset
+        self.save()
+        return offset
+
+    def commit_output(self, filepath: Path, file: IO[Any]) -> None:
+        """출력 파일을 디스크에 반영한 뒤 오프셋 저장."""
+        file.flush()
+        os.fsync(file.fileno())
+        self.outputs[str(filepath)] = os.fstat(file.fileno()).st_size
+        self.save()
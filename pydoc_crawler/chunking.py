@@ -0,0 +1,142 @@
+"""RAG용 Markdown 청킹."""
+
+import math
+import re
+from typing import Any
+
+from pydoc_crawler.items import ChunkItem
+
+# ATX 헤딩 (# ~ ######)
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+# 코드 펜스 시작/종료 (``` 또는 ~~~)
+FENCE_PATTERN = re.compile(r"^\s*(`{3,}|~{3,})")
+
+# 토큰 추정용 평균 문자 수 (영문 기준 약 4자 = 1토큰)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 수 기반 토큰 수 추정."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+class MarkdownChunker:
+    """헤딩 단위로 Markdown을 청크로 분할.
+
+    - 헤딩을 만나면 새 섹션 시작 (코드 펜스 내부의 ``#``는 무시)
+    - 섹션이 ``max_tokens``를 넘으면 빈 줄 기준 블록 단위로 재분할
+    - 코드 블록은 절대 분할하지 않음 (단독으로 한도를 넘어도 하나의 청크)
+    """
+
+    def __init__(self, max_tokens: int = 512) -> None:
+        self.max_tokens = max_tokens
+
+    def chunk(self, document: dict[str, Any]) -> list[ChunkItem]:
+        """문서 dict를 ChunkItem 목록으로 변환."""
+        chunks: list[ChunkItem] = []
+        parts_per_path: dict[tuple[str, ...], int] = {}
+
+        for heading_path, text in self.split(document["content_markdown"]):
+            part = parts_per_path.get(heading_path, 0)
+            parts_per_path[heading_path] = part + 1
+
+            chunks.append(
+                ChunkItem(
+                    document_id=document["id"],
+                    source=document["source"],
+                    version=document["version"],
+                    url=document["url"],
+                    title=document["title"],
+                    heading_path=list(heading_path),
+                    part=part,
+                    ordinal=len(chunks),
+                    content_markdown=text,
+                    token_estimate=estimate_tokens(text),
+                )
+            )
+
+        return chunks
+
+    def split(self, markdown: str) -> list[tuple[tuple[str, ...], str]]:
+        """Markdown을 (헤딩 경로, 본문) 목록으로 분할."""
+        result: list[tuple[tuple[str, ...], str]] = []
+        for heading_path, blocks in self._sections(markdown):
+            for text in self._pack(blocks):
+                result.append((heading_path, text))
+        return result
+
+    def _sections(self, markdown: str) -> list[tuple[tuple[str, ...], list[str]]]:
+        """헤딩 기준 섹션 분리. 각 섹션은 블록(문단/코드) 목록."""
+        sections: list[tuple[tuple[str, ...], list[str]]] = []
+        stack: list[tuple[int, str]] = []
+        blocks: list[str] = []
+        current: list[str] = []
+        fence: str | None = None
+
+        def end_block() -> None:
+            if current:
+                blocks.append("\n".join(current))
+                current.clear()
+
+        def end_section() -> None:
+            end_block()
+            if blocks:
+                sections.append((tuple(title for _, title in stack), blocks[:]))
+                blocks.clear()
+
+        for line in markdown.split("\n"):
+            fence_match = FENCE_PATTERN.match(line)
+
+            if fence is not None:
+                # 코드 블록 내부: 닫는 펜스까지 한 블록으로 유지
+                current.append(line)
+                if fence_match and fence_match.group(1).startswith(fence):
+                    fence = None
+                    end_block()
+                continue
+
+            if fence_match:
+                end_block()
+                fence = fence_match.group(1)
+                current.append(line)
+                continue
+
+            heading_match = HEADING_PATTERN.match(line)
+            if heading_match:
+                end_section()
+                level = len(heading_match.group(1))
+                while stack and stack[-1][0] >= level:
+                    stack.pop()
+                stack.append((level, heading_match.group(2).rstrip("¶").strip()))
+                blocks.append(line)
+                continue
+
+            if not line.strip():
+                end_block()
+                continue
+
+            current.append(line)
+
+        end_section()
+        return sections
+
+    def _pack(self, blocks: list[str]) -> list[str]:
+        """블록을 토큰 한도 내에서 순서대로 묶기."""
+        packed: list[str] = []
+        current: list[str] = []
+        current_tokens = 0
+
+        for block in blocks:
+            tokens = estimate_tokens(block)
+            if current and current_tokens + tokens > self.max_tokens:
+                packed.append("\n\n".join(current))
+                current = []
+                current_tokens = 0
+            current.append(block)
+            current_tokens += tokens
+
+        if current:
+            packed.append("\n\n".join(current))
+
+        return packed
@@ -1,18 +1,33 @@
 """CLI 엔트리포인트."""
 
 import argparse
+import json
 import sys
-from typing import NoReturn
+import time
+from collections.abc import Callable
+from typing import Any, NoReturn
 
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
 
 
 def main() -> NoReturn:
-    """크롤러 CLI 메인 함수."""
+    """크롤러 CLI 메인 함수.
+
+    첫 인자가 서브커맨드(``search`` 등)이면 해당 명령을, 아니면 크롤링을 실행합니다.
+    """
+    argv = sys.argv[1:]
+    if argv and argv[0] in COMMANDS:
+        sys.exit(COMMANDS[argv[0]](argv[1:]))
+    sys.exit(run_crawl(argv))
+
+
+def run_crawl(argv: list[str]) -> int:
+    """크롤링 실행."""
     parser = argparse.ArgumentParser(
         description="PyDoc Crawler - Python 문서 크롤러",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"기타 명령: {', '.join(COMMANDS)}",
     )
 
     parser.add_argument(
@@ -39,7 +54,52 @@ def main() -> NoReturn:
     parser.add_argument(
         "-o",
         "--output",
-        help="출력 파일 경로 (기본값: data/<spider>_output.jsonl)",
+        help=(
+            "출력 파일 경로 (기본값: data/<spider>_<version>_output.jsonl). "
+            "--all-versions면 경로에 %%(version)s 필요"
+        ),
+    )
+
+    parser.add_argument(
+        "--job-dir",
+        help=(
+            "재개 가능한 크롤링 작업 디렉토리. 중단 후 같은 경로로 다시 실행하면 "
+            "이어서 수집 (버전은 순차 실행)"
+        ),
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="변경 이력 기반 재수집 (자주 바뀌는 페이지 우선, 안정 페이지 생략)",
+    )
+
+    parser.add_argument(
+        "--changed",
+        nargs="+",
+        metavar="URL",
+        help=(
+            "변경된 페이지 (URL 또는 섹션 기준 상대 경로). "
+            "이 페이지와 이를 링크하는 페이지만 수집"
+        ),
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help="재수집 모드 요청 상한 (기본값: RECRAWL_REQUEST_BUDGET)",
+    )
+
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="HTTP/2로 다운로드 (호스트당 연결 하나에 요청 다중화, h2 필요)",
+    )
+
+    parser.add_argument(
+        "--streaming-parse",
+        action="store_true",
+        help="다운로드 중 본문 조각을 증분 파싱 (큰 페이지의 파싱을 전송과 겹침)",
     )
 
     parser.add_argument(
@@ -49,13 +109,33 @@ def main() -> NoReturn:
         help="로그 레벨 (기본값: INFO)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    # 재개 모드가 아니면 버전별 크롤러가 동시에 실행되어 한 파일을 서로 덮어씀
+    if (
+        args.output
+        and args.all_versions
+        and not args.job_dir
+        and "%(version)s" not in args.output
+    ):
+        parser.error("--all-versions의 --output에는 %(version)s가 필요합니다")
 
     # Scrapy 설정 로드
     settings = get_project_settings()
     settings.set("LOG_LEVEL", args.log_level)
 
-    if args.output:
+    if args.http2:
+        settings.set("HTTP2_ENABLED", True)
+
+    if args.streaming_parse:
+        settings.set("STREAMING_PARSE", True)
+
+    if args.output and args.job_dir:
+        # 재개 모드에서는 피드 대신 체크포인트 기준으로 이어쓰는 JSONL 파이프라인이
+        # 출력 (피드 내보내기는 오프셋 복구 없이 이어써서 재개 시 중복 기록)
+        settings.set("JSONL_OUTPUT_PATH", args.output)
+        settings.set("FEEDS", {})
+    elif args.output:
         settings.set(
             "FEEDS",
             {
@@ -67,18 +147,606 @@ def main() -> NoReturn:
             },
         )
 
+    if args.job_dir:
+        settings.set("CRAWL_JOB_DIR", args.job_dir)
+
+    if args.budget is not None:
+        settings.set("RECRAWL_REQUEST_BUDGET", args.budget)
+
+    spider_kwargs: dict[str, Any] = {"refresh": True} if args.refresh else {}
+    if args.changed:
+        spider_kwargs["changed"] = args.changed
+
     # 크롤러 실행
     process = CrawlerProcess(settings)
 
-    if args.all_versions:
-        versions = ["3.10", "3.11", "3.12", "3.13"]
-        for version in versions:
-            process.crawl(args.spider, version=version)
+    versions = ["3.10", "3.11", "3.12", "3.13"] if args.all_versions else [args.version]
+
+    if args.job_dir:
+        _crawl_resumable(process, args.spider, versions, args.job_dir, spider_kwargs)
     else:
-        process.crawl(args.spider, version=args.version)
+        for version in versions:
+            process.crawl(args.spider, version=version, **spider_kwargs)
 
     process.start()
-    sys.exit(0)
+    return 0
+
+
+def _crawl_resumable(
+    process: CrawlerProcess,
+    spider: str,
+    versions: list[str],
+    job_dir: str,
+    spider_kwargs: dict[str, Any],
+) -> None:
+    """버전을 순서대로 크롤링하며 완료된 버전은 건너뜀.
+
+    같은 출력 파일에 이어쓰기하므로 버전별 크롤링을 동시에 실행하지 않습니다.
+    """
+    from twisted.internet import defer
+
+    from pydoc_crawler.checkpoint import CrawlCheckpoint
+
+    checkpoint = CrawlCheckpoint.for_job_dir(job_dir)
+
+    @defer.inlineCallbacks
+    def crawl_all() -> Any:
+        for version in versions:
+            key = CrawlCheckpoint.crawl_key(spider, version)
+            if checkpoint.is_finished(key):
+                print(f"{key}: 이미 완료됨, 건너뜀")
+                continue
+
+            crawler = process.create_crawler(spider)
+            yield process.crawl(crawler, version=version, **spider_kwargs)
+
+            reason = crawler.stats.get_value("finish_reason")
+            if reason != "finished":
+                print(f"{key}: 중단됨 ({reason}). 같은 --job-dir로 다시 실행하면 재개")
+                return
+            checkpoint.mark_finished(key)
+
+    crawl_all()
+
+
+def run_search(argv: list[str]) -> int:
+    """검색 인덱스 조회."""
+    from pydoc_crawler.search import SearchIndex
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler search",
+        description="크롤링된 문서 전문 검색 (SQLite FTS5)",
+    )
+    parser.add_argument("query", help="검색어 (공백 구분 단어 AND 검색)")
+    parser.add_argument("--source", help="문서 출처 필터 (예: python)")
+    parser.add_argument("--version", help="버전 필터 (예: 3.13)")
+    parser.add_argument(
+        "-n", "--limit", type=int, default=10, help="결과 개수 (기본값: 10)"
+    )
+    parser.add_argument(
+        "--chunks", action="store_true", help="청크 단위로 검색 (청크 인덱스 필요)"
+    )
+    parser.add_argument("--json", action="store_true", help="JSON Lines로 출력")
+    parser.add_argument(
+        "--index",
+        default=settings.get("SEARCH_INDEX_PATH"),
+        help="검색 인덱스 경로 (기본값: data/search.db)",
+    )
+    args = parser.parse_args(argv)
+
+    index = SearchIndex(args.index)
+    started = time.perf_counter()
+    try:
+        hits = index.search(
+            args.query,
+            source=args.source,
+            version=args.version,
+            limit=args.limit,
+            chunks=args.chunks,
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        index.close()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    for hit in hits:
+        if args.json:
+            print(json.dumps(hit.__dict__, ensure_ascii=False))
+            continue
+        heading = f" › {hit.heading}" if hit.heading else ""
+        print(f"[{hit.source} {hit.version}] {hit.title}{heading}")
+        print(f"  {hit.url}")
+        print(f"  {' '.join(hit.snippet.split())}\n")
+
+    if not args.json:
+        print(f"{len(hits)}건 ({elapsed_ms:.1f}ms)")
+    return 0
+
+
+def run_index(argv: list[str]) -> int:
+    """기존 JSONL 출력으로 검색 인덱스 갱신."""
+    from pydoc_crawler.chunking import MarkdownChunker
+    from pydoc_crawler.jsonl_index import iter_records
+    from pydoc_crawler.search import SearchIndex
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler index",
+        description="JSONL 출력 파일로 검색 인덱스 갱신 (변경된 문서만)",
+    )
+    parser.add_argument("inputs", nargs="+", help="JSONL 파일 경로")
+    parser.add_argument(
+        "--chunks", action="store_true", help="청크 단위 인덱스도 함께 갱신"
+    )
+    parser.add_argument(
+        "--index",
+        default=settings.get("SEARCH_INDEX_PATH"),
+        help="검색 인덱스 경로 (기본값: data/search.db)",
+    )
+    args = parser.parse_args(argv)
+
+    index = SearchIndex(args.index)
+    chunker = MarkdownChunker(max_tokens=settings.getint("CHUNK_MAX_TOKENS", 512))
+    indexed = skipped = 0
+
+    try:
+        for path in args.inputs:
+            for item in iter_records(path):
+                if index.upsert(item, chunker if args.chunks else None):
+                    indexed += 1
+                else:
+                    skipped += 1
+    finally:
+        index.close()
+
+    print(f"{indexed}개 문서 인덱싱, {skipped}개 변경 없음")
+    return 0
+
+
+def run_dedup(argv: list[str]) -> int:
+    """JSONL 출력의 유사 중복 문서 표시/제거."""
+    from pydoc_crawler.dedup import MinHasher, find_duplicates
+    from pydoc_crawler.jsonl_index import iter_records
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler dedup",
+        description="MinHash/LSH로 JSONL 코퍼스의 유사 중복 문서 탐지",
+    )
+    parser.add_argument("input", help="입력 JSONL 파일")
+    parser.add_argument("-o", "--output", help="출력 JSONL 파일 (생략 시 보고서만)")
+    parser.add_argument(
+        "--drop", action="store_true", help="중복 문서 제거 (기본값: duplicate_of 표시)"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=settings.getfloat("DEDUP_THRESHOLD", 0.9),
+        help="추정 Jaccard 유사도 임계값 (기본값: 0.9)",
+    )
+    parser.add_argument("--report", help="보고서 JSON 저장 경로")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="서명 계산 배치 크기"
+    )
+    args = parser.parse_args(argv)
+
+    hasher = MinHasher(num_perm=settings.getint("DEDUP_NUM_PERM", 128))
+
+    # 1차: 본문은 배치 단위로만 메모리에 올리고 서명/크기만 보관
+    ids: list[str] = []
+    sizes: list[int] = []
+    signature_batches: list[Any] = []
+    texts: list[str] = []
+
+    for item in iter_records(args.input):
+        ids.append(item["id"])
+        sizes.append(len(item["content_markdown"].encode()))
+        texts.append(item["content_markdown"])
+        if len(texts) >= args.batch_size:
+            signature_batches.append(hasher.signatures(texts))
+            texts = []
+    if texts or not signature_batches:
+        signature_batches.append(hasher.signatures(texts))
+
+    report = find_duplicates(
+        ids,
+        signature_batches,
+        sizes,
+        bands=settings.getint("DEDUP_BANDS", 32),
+        threshold=args.threshold,
+    )
+
+    # 2차: 중복 표시/제거하며 출력
+    if args.output:
+        duplicate_of = {
+            duplicate: cluster.representative
+            for cluster in report.clusters
+            for duplicate in cluster.duplicates
+        }
+        with open(args.output, "w", encoding="utf-8") as dst:
+            for item in iter_records(args.input):
+                representative = duplicate_of.get(item["id"])
+                if representative and args.drop:
+                    continue
+                if representative:
+                    item["duplicate_of"] = representative
+                dst.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    summary = report.to_dict()
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(
+        f"문서 {summary['documents']}개 중 유사 중복 {summary['duplicates']}개 "
+        f"({summary['clusters']}개 클러스터), "
+        f"절감 {summary['bytes_saved']:,}B ({summary['savings_ratio']:.1%})"
+    )
+    return 0
+
+
+def run_export(argv: list[str]) -> int:
+    """JSONL 출력을 source/version별 Parquet 파일로 내보내기."""
+    from pydoc_crawler.parquet import ParquetDatasetWriter, export_jsonl
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler export",
+        description="JSONL 출력을 Parquet 데이터셋으로 스트리밍 변환",
+    )
+    parser.add_argument("inputs", nargs="+", help="입력 JSONL 파일")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=settings.get("PARQUET_EXPORT_DIR"),
+        help="출력 디렉토리 (기본값: data/parquet)",
+    )
+    parser.add_argument(
+        "--compression",
+        default=settings.get("PARQUET_COMPRESSION", "zstd"),
+        help="압축 코덱 (기본값: zstd)",
+    )
+    parser.add_argument(
+        "--row-group-rows",
+        type=int,
+        default=settings.getint("PARQUET_ROW_GROUP_ROWS", 1000),
+        help="행 그룹당 최대 행 수",
+    )
+    parser.add_argument(
+        "--no-partition",
+        action="store_true",
+        help="source/version 디렉토리로 나누지 않고 단일 파일로 저장",
+    )
+    args = parser.parse_args(argv)
+
+    writer = ParquetDatasetWriter(
+        args.output,
+        row_group_rows=args.row_group_rows,
+        max_buffer_bytes=settings.getint("PARQUET_MAX_BUFFER_BYTES"),
+        compression=args.compression,
+        partition=not args.no_partition,
+    )
+    stats = export_jsonl(args.inputs, writer)
+
+    print(
+        f"{stats.rows}개 문서, 행 그룹 {stats.row_groups}개, "
+        f"파일 {len(stats.files)}개: {args.output}"
+    )
+    return 0
+
+
+def run_compress(argv: list[str]) -> int:
+    """JSONL 출력의 본문을 코퍼스 학습 사전으로 압축."""
+    from pathlib import Path
+
+    from pydoc_crawler.compression import BodyCodec, compress_jsonl, train_dictionary
+    from pydoc_crawler.jsonl_index import iter_records
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler compress",
+        description="zstd 사전으로 JSONL 본문 압축 (리더는 자동 복원)",
+    )
+    parser.add_argument("inputs", nargs="+", help="입력 JSONL 파일")
+    parser.add_argument("-o", "--output", required=True, help="출력 JSONL 파일")
+    parser.add_argument(
+        "--dict",
+        default=settings.get("BODY_COMPRESSION_DICT"),
+        help="압축 사전 경로 (기본값: data/content.zdict)",
+    )
+    parser.add_argument(
+        "--train", action="store_true", help="입력 문서로 사전을 새로 학습"
+    )
+    parser.add_argument(
+        "--dict-size", type=int, default=112 * 1024, help="학습할 사전 크기 (바이트)"
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        default=settings.getint("BODY_COMPRESSION_LEVEL", 9),
+        help="zstd 압축 레벨",
+    )
+    parser.add_argument("--report", help="통계 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    dict_path = Path(args.dict)
+    if args.train or not dict_path.exists():
+        texts = (
+            item["content_markdown"]
+            for path in args.inputs
+            for item in iter_records(path)
+        )
+        dict_path.parent.mkdir(parents=True, exist_ok=True)
+        dict_path.write_bytes(train_dictionary(texts, dict_size=args.dict_size))
+        print(f"사전 학습 완료: {dict_path} ({dict_path.stat().st_size:,}B)")
+
+    codec = BodyCodec(dict_path.read_bytes(), level=args.level)
+    stats = compress_jsonl(args.inputs, args.output, codec)
+
+    summary = stats.to_dict()
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(
+        f"문서 {summary['documents']}개: {summary['raw_bytes']:,}B → "
+        f"{summary['compressed_bytes']:,}B (압축률 {summary['ratio']}x), "
+        f"복원 {summary['decode_mb_per_sec']} MB/s"
+    )
+    return 0
+
+
+def run_code(argv: list[str]) -> int:
+    """코드 블록 인덱스 조회 (JSONL 내보내기)."""
+    from pydoc_crawler.code_index import CodeIndex
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler code",
+        description="수집된 문서의 코드 블록 조회 및 JSONL 내보내기",
+    )
+    parser.add_argument("contains", nargs="?", help="코드에 포함될 문자열")
+    parser.add_argument("-l", "--language", help="코드 언어 필터 (예: python)")
+    parser.add_argument("-s", "--source", help="문서 출처 필터 (예: python)")
+    parser.add_argument("-v", "--version", help="문서 버전 필터 (예: 3.13)")
+    parser.add_argument("-n", "--limit", type=int, help="최대 결과 수")
+    parser.add_argument("-o", "--output", help="JSONL로 저장할 경로")
+    parser.add_argument(
+        "--index",
+        default=settings.get("CODE_INDEX_PATH"),
+        help="코드 인덱스 경로 (기본값: data/code.db)",
+    )
+    args = parser.parse_args(argv)
+
+    index = CodeIndex(args.index)
+    try:
+        blocks = index.blocks(
+            language=args.language,
+            source=args.source,
+            version=args.version,
+            contains=args.contains,
+            limit=args.limit,
+        )
+        if args.output:
+            count = 0
+            with open(args.output, "w", encoding="utf-8") as f:
+                for block in blocks:
+                    f.write(json.dumps(block, ensure_ascii=False) + "\n")
+                    count += 1
+            print(f"{count}개 코드 블록 저장: {args.output}")
+            return 0
+
+        for block in blocks:
+            heading = f" — {block['heading']}" if block["heading"] else ""
+            print(f"{block['url']}#{block['ordinal']} [{block['language']}]{heading}")
+            print(block["code"])
+            print()
+    finally:
+        index.close()
+    return 0
+
+
+def run_watch(argv: list[str]) -> int:
+    """상주 감시 모드 (버전별 주기 재수집 + 상태 엔드포인트)."""
+    from pydoc_crawler.daemon import load_targets, run_daemon
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler watch",
+        description="프로세스를 유지하며 버전별 주기로 변경분만 재수집",
+    )
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="append",
+        help="감시할 버전 (반복 지정 가능, 기본값: WATCH_TARGETS 전체)",
+    )
+    parser.add_argument(
+        "-s",
+        "--spider",
+        help="감시할 스파이더 (기본값: WATCH_TARGETS 전체, 추가 버전은 WATCH_SPIDER)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="재수집 주기(시간). 지정하면 모든 대상에 적용",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=settings.getint("WATCH_STATUS_PORT", 6081),
+        help="상태 엔드포인트 포트 (기본값: 6081)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="로그 레벨 (기본값: INFO)",
+    )
+    args = parser.parse_args(argv)
+
+    settings.set("LOG_LEVEL", args.log_level)
+    targets = load_targets(settings, args.version, args.interval, args.spider)
+    if not targets:
+        print("감시할 대상이 없습니다 (WATCH_TARGETS 또는 --version 확인)")
+        return 1
+
+    run_daemon(settings, targets, args.port)
+    return 0
+
+
+def run_report(argv: list[str]) -> int:
+    """실행 성능 보고서 (이전 실행 대비 처리량/메모리 회귀 비교)."""
+    from pydoc_crawler.run_report import RunHistory, RunSummary, compare_runs
+
+    settings = get_project_settings()
+
+    parser = argparse.ArgumentParser(
+        prog="pydoc-crawler report",
+        description="크롤링 실행별 성능 요약과 이전 실행 대비 회귀 비교",
+    )
+    parser.add_argument(
+        "run_id", nargs="?", type=int, help="보고할 실행 id (기본값: 가장 최근 실행)"
+    )
+    parser.add_argument("-s", "--spider", help="스파이더 필터 (예: python)")
+    parser.add_argument("-v", "--version", help="버전 필터 (예: 3.13)")
+    parser.add_argument(
+        "--baseline",
+        type=int,
+        help="비교할 기준 실행 id (기본값: 같은 스파이더/버전의 이전 실행들)",
+    )
+    parser.add_argument(
+        "-w",
+        "--window",
+        type=int,
+        default=5,
+        help="기준으로 쓸 이전 실행 수, 중앙값과 비교 (기본값: 5)",
+    )
+    parser.add_argument("--list", action="store_true", help="최근 실행 목록 출력")
+    parser.add_argument(
+        "-n", "--limit", type=int, default=20, help="목록 개수 (기본값: 20)"
+    )
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    parser.add_argument(
+        "--history",
+        default=settings.get("RUN_HISTORY_PATH"),
+        help="실행 이력 경로 (기본값: data/runs.db)",
+    )
+    args = parser.parse_args(argv)
+
+    history = RunHistory(args.history)
+    try:
+        if args.list:
+            runs = history.runs(args.spider, args.version, limit=args.limit)
+            for run in runs:
+                if args.json:
+                    print(json.dumps(run.to_dict(), ensure_ascii=False))
+                    continue
+                finished = time.strftime("%Y-%m-%d %H:%M", time.localtime(run.finished))
+                print(
+                    f"#{run.id:<5} {finished}  {run.spider} {run.version or '-'}  "
+                    f"{run.pages:>6} pages  {run.pages_per_sec:>8.2f} pages/s  "
+                    f"p95 {run.parse_p95_ms or 0:>7.1f}ms  "
+                    f"프로세스 RSS {(run.peak_rss_bytes or 0) / 1024 / 1024:>7.1f}MB"
+                )
+            return 0
+
+        if args.run_id is not None:
+            current = history.get(args.run_id)
+        else:
+            latest = history.runs(args.spider, args.version, limit=1)
+            current = latest[0] if latest else None
+        if current is None:
+            print("기록된 실행이 없습니다", file=sys.stderr)
+            return 1
+
+        baselines: list[RunSummary]
+        if args.baseline is not None:
+            baseline = history.get(args.baseline)
+            baselines = [baseline] if baseline else []
+        else:
+            baselines = history.runs(
+                current.spider, current.version, before=current.id, limit=args.window
+            )
+    finally:
+        history.close()
+
+    thresholds = settings.getdict("RUN_REGRESSION_THRESHOLDS") or None
+    regressions = compare_runs(current, baselines, thresholds)
+
+    if args.json:
+        report = {
+            "run": current.to_dict(),
+            "baseline_runs": [run.id for run in baselines],
+            "regressions": [
+                {**regression.__dict__, "change": round(regression.change, 4)}
+                for regression in regressions
+            ],
+        }
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 1 if regressions else 0
+
+    mb = 1024 * 1024
+    finished = time.strftime("%Y-%m-%d %H:%M", time.localtime(current.finished))
+    print(
+        f"실행 #{current.id} {current.spider} {current.version or ''} "
+        f"({current.section or '-'}) {finished}, {current.finish_reason}"
+    )
+    print(
+        f"  페이지 {current.pages}개 (아이템 {current.items}개), "
+        f"{current.elapsed:.1f}s, {current.pages_per_sec:.2f} pages/s"
+    )
+    print(
+        f"  전송 {current.bytes_fetched / mb:.1f}MB, "
+        f"캐시 적중 {(current.cache_hit_rate or 0):.1%}, "
+        f"304 {(current.not_modified_rate or 0):.1%}"
+    )
+    print(
+        f"  파싱 p50 {current.parse_p50_ms or 0:.1f}ms / "
+        f"p95 {current.parse_p95_ms or 0:.1f}ms / "
+        f"p99 {current.parse_p99_ms or 0:.1f}ms, "
+        f"프로세스 최대 RSS {(current.peak_rss_bytes or 0) / mb:.1f}MB"
+    )
+    for target, counts in sorted(current.item_changes.items()):
+        print(
+            f"  {target}: new {counts['new']}, changed {counts['changed']}, "
+            f"unchanged {counts['unchanged']}"
+        )
+
+    if not baselines:
+        print("비교할 이전 실행이 없습니다")
+        return 0
+    print(f"기준: 실행 {', '.join(f'#{run.id}' for run in baselines)} (중앙값)")
+    if not regressions:
+        print("  회귀 없음")
+    for regression in regressions:
+        print(
+            f"  회귀: {regression.metric} {regression.baseline:.2f} → "
+            f"{regression.current:.2f} ({regression.change:+.1%})"
+        )
+    return 1 if regressions else 0
+
+
+COMMANDS: dict[str, Callable[[list[str]], int]] = {
+    "search": run_search,
+    "index": run_index,
+    "dedup": run_dedup,
+    "export": run_export,
+    "compress": run_compress,
+    "code": run_code,
+    "watch": run_watch,
+    "report": run_report,
+}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""문서 코드 블록 SQLite 인덱스.
+
+파서가 Markdown 변환 중 수집한 코드 블록을 문서 ID/순번 단위로 저장하여,
+코드 검색이나 코드 중심 학습 데이터셋을 Markdown 재파싱 없이 만들 수 있게 합니다.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from pydoc_crawler.items import CodeBlockItem
+from pydoc_crawler.storage import connect_sqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS code_documents (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    version TEXT NOT NULL,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS code_blocks (
+    document_id TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    heading TEXT,
+    code TEXT NOT NULL,
+    PRIMARY KEY (document_id, ordinal)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_code_blocks_language ON code_blocks (language);
+CREATE INDEX IF NOT EXISTS idx_code_documents_source_version
+    ON code_documents (source, version);
+"""
+
+
+class CodeIndex:
+    """코드 블록 인덱스.
+
+    ``content_hash``가 바뀐 문서만 코드 블록을 다시 씁니다.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.conn = connect_sqlite(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """커밋 후 연결 닫기."""
+        self.conn.commit()
+        self.conn.close()
+
+    def commit(self) -> None:
+        """변경사항 커밋."""
+        self.conn.commit()
+
+    def is_current(self, document_id: str, content_hash: str) -> bool:
+        """인덱스의 문서가 최신 상태인지 확인."""
+        row = self.conn.execute(
+            "SELECT content_hash FROM code_documents WHERE id = ?", (document_id,)
+        ).fetchone()
+        return row is not None and row["content_hash"] == content_hash
+
+    def upsert(self, item: dict[str, Any], blocks: list[CodeBlockItem]) -> bool:
+        """문서의 코드 블록 교체. 변경이 없으면 False 반환."""
+        if self.is_current(item["id"], item["content_hash"]):
+            return False
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO code_documents"
+            " (id, source, version, url, content_hash) VALUES (?, ?, ?, ?, ?)",
+            (
+                item["id"],
+                item["source"],
+                item["version"],
+                item["url"],
+                item["content_hash"],
+            ),
+        )
+        self.conn.execute(
+            "DELETE FROM code_blocks WHERE document_id = ?", (item["id"],)
+        )
+        self.conn.executemany(
+            "INSERT INTO code_blocks (document_id, ordinal, language, heading, code)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (item["id"], block.ordinal, block.language, block.heading, block.code)
+                for block in blocks
+            ],
+        )
+        return True
+
+    def blocks(
+        self,
+        language: str | None = None,
+        source: str | None = None,
+        version: str | None = None,
+        contains: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """조건에 맞는 코드 블록을 문서/순번 순서로 스트리밍."""
+        sql = """
+            SELECT b.document_id, b.ordinal, b.language, b.heading, b.code,
+                   d.source, d.version, d.url
+            FROM code_blocks b
+            JOIN code_documents d ON d.id = b.document_id
+            WHERE 1 = 1
+        """
+        params: list[Any] = []
+        if language:
+            sql += " AND b.language = ?"
+            params.append(language)
+        if source:
+            sql += " AND d.source = ?"
+            params.append(source)
+        if version:
+            sql += " AND d.version = ?"
+            params.append(version)
+        if contains:
+            sql += " AND instr(b.code, ?) > 0"
+            params.append(contains)
+        sql += " ORDER BY b.document_id, b.ordinal"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        for row in self.conn.execute(sql, params):
+            yield dict(row)
@@ -0,0 +1,233 @@
+"""코퍼스 학습 사전 기반 문서 본문 압축 (zstd).
+
+버전별로 거의 같은 문서, 반복되는 헤딩/보일러플레이트가 많아 코퍼스 자체로
+학습한 zstd 사전을 쓰면 문서 단위로 압축해도 압축률이 크게 높아집니다.
+
+압축된 JSONL 레코드는 ``content_markdown`` 대신 다음 필드를 가집니다::
+
+    "content_zstd": "<base64>", "content_dict_id": <사전 ID, 사전 없으면 0>
+
+사전은 출력 파일 옆 ``<output>.zdict``에 함께 저장되며, 리더는 이를 찾아
+본문을 투명하게 복원합니다. 한 출력 파일의 레코드는 모두 같은 사전을 쓰므로,
+다른 사전으로 기존 출력에 이어쓰기는 거부합니다.
+
+압축 대상은 JSONL 출력 본문뿐입니다. 검색 인덱스(``search.db``)는 FTS5가
+평문을 토큰화하고 스니펫을 뽑아야 하고, 코드 인덱스(``code.db``)는
+``instr``로 코드 본문을 직접 검색하므로 두 SQLite 저장소는 압축하지 않습니다.
+"""
+
+import base64
+import itertools
+import json
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from scrapy.settings import BaseSettings
+
+try:
+    import zstandard as zstd
+except ImportError:  # pragma: no cover - 선택적 의존성
+    zstd = None  # type: ignore[assignment]
+
+DICT_SUFFIX = ".zdict"
+DEFAULT_DICT_SIZE = 112 * 1024
+DEFAULT_LEVEL = 9
+
+# 사전 학습에 사용할 최대 문서 수
+MAX_TRAINING_SAMPLES = 5000
+
+
+def _require_zstd() -> None:
+    if zstd is None:
+        raise ImportError(
+            "본문 압축에는 zstandard가 필요합니다: uv sync --extra compress"
+        )
+
+
+def dictionary_path_for(path: str | Path) -> Path:
+    """JSONL 파일의 사이드카 사전 경로."""
+    path = Path(path)
+    return path.with_name(path.name + DICT_SUFFIX)
+
+
+def train_dictionary(
+    texts: Iterable[str],
+    dict_size: int = DEFAULT_DICT_SIZE,
+    max_samples: int = MAX_TRAINING_SAMPLES,
+) -> bytes:
+    """문서 본문으로 zstd 사전 학습."""
+    _require_zstd()
+    samples: list[bytes | bytearray | memoryview] = [
+        text.encode() for text in itertools.islice(texts, max_samples)
+    ]
+    try:
+        dictionary = zstd.train_dictionary(dict_size, samples)
+    except zstd.ZstdError as e:
+        raise ValueError(f"사전 학습 실패 (샘플 {len(samples)}개): {e}") from e
+    data: bytes = dictionary.as_bytes()
+    return data
+
+
+class BodyCodec:
+    """문서 본문 압축/복원기.
+
+    Args:
+        dictionary: 학습된 zstd 사전 (None이면 사전 없이 압축)
+        level: zstd 압축 레벨
+    """
+
+    def __init__(self, dictionary: bytes | None = None, level: int = DEFAULT_LEVEL):
+        _require_zstd()
+        self.dictionary = zstd.ZstdCompressionDict(dictionary) if dictionary else None
+        self.dict_id = self.dictionary.dict_id() if self.dictionary else 0
+        self.level = level
+        self._compressor = zstd.ZstdCompressor(level=level, dict_data=self.dictionary)
+        self._decompressor = zstd.ZstdDecompressor(dict_data=self.dictionary)
+
+    @classmethod
+    def from_settings(cls, settings: BaseSettings) -> "BodyCodec | None":
+        """BODY_COMPRESSION 설정 시 코덱 생성 (사전 파일이 있으면 사용)."""
+        if not settings.getbool("BODY_COMPRESSION"):
+            return None
+        dict_path = settings.get("BODY_COMPRESSION_DICT")
+        dictionary = None
+        if dict_path and Path(dict_path).exists():
+            dictionary = Path(dict_path).read_bytes()
+        return cls(dictionary, settings.getint("BODY_COMPRESSION_LEVEL", DEFAULT_LEVEL))
+
+    @classmethod
+    def for_jsonl(cls, path: str | Path) -> "BodyCodec | None":
+        """JSONL 파일 옆 사이드카 사전으로 코덱 생성 (없으면 None)."""
+        dict_path = dictionary_path_for(path)
+        if zstd is None or not dict_path.exists():
+            return None
+        return cls(dict_path.read_bytes())
+
+    def save_dictionary(self, path: str | Path, append: bool = False) -> None:
+        """사전을 JSONL 사이드카로 저장 (사전이 없으면 이전 사이드카 제거).
+
+        ``append``면 기존 레코드를 계속 복원할 수 있도록, 기존 사이드카와
+        사전 ID가 다를 때 덮어쓰지 않고 ``ValueError``를 냅니다.
+        """
+        dict_path = dictionary_path_for(path)
+        if append:
+            existing = dict_path.read_bytes() if dict_path.exists() else None
+            existing_id = (
+                zstd.ZstdCompressionDict(existing).dict_id() if existing else 0
+            )
+            if existing_id != self.dict_id:
+                raise ValueError(
+                    f"압축 사전 불일치: 기존 출력 {existing_id}, 설정 {self.dict_id} "
+                    f"({path}). 기존 사전({dict_path})을 BODY_COMPRESSION_DICT로 "
+                    "지정하거나 새 출력으로 시작하세요"
+                )
+        if self.dictionary:
+            dict_path.write_bytes(self.dictionary.as_bytes())
+        else:
+            dict_path.unlink(missing_ok=True)
+
+    def compress(self, text: str) -> bytes:
+        data: bytes = self._compressor.compress(text.encode())
+        return data
+
+    def decompress(self, data: bytes) -> str:
+        text: bytes = self._decompressor.decompress(data)
+        return text.decode()
+
+    def encode_record(self, item: dict[str, Any]) -> dict[str, Any]:
+        """본문을 압축한 레코드 사본."""
+        return self.pack_record(item, self.compress(item["content_markdown"]))
+
+    def pack_record(self, item: dict[str, Any], blob: bytes) -> dict[str, Any]:
+        """이미 압축한 본문(``blob``)으로 만든 레코드 사본."""
+        record = {k: v for k, v in item.items() if k != "content_markdown"}
+        record["content_zstd"] = base64.b64encode(blob).decode("ascii")
+        record["content_dict_id"] = self.dict_id
+        return record
+
+    def decode_record(self, record: dict[str, Any]) -> dict[str, Any]:
+        """압축 레코드의 본문 복원 (제자리 수정)."""
+        dict_id = record.pop("content_dict_id", 0)
+        if dict_id != self.dict_id:
+            raise ValueError(f"압축 사전 불일치: 레코드 {dict_id}, 코덱 {self.dict_id}")
+        blob = base64.b64decode(record.pop("content_zstd"))
+        record["content_markdown"] = self.decompress(blob)
+        return record
+
+
+def decode_record(record: dict[str, Any], codec: BodyCodec | None) -> dict[str, Any]:
+    """압축 레코드면 본문 복원, 아니면 그대로 반환."""
+    if "content_zstd" not in record:
+        return record
+    if codec is None:
+        if record.get("content_dict_id"):
+            raise ValueError("압축 사전(.zdict)을 찾을 수 없습니다")
+        codec = BodyCodec()
+    return codec.decode_record(record)
+
+
+@dataclass
+class CompressionStats:
+    """압축 결과 요약."""
+
+    documents: int = 0
+    raw_bytes: int = 0
+    compressed_bytes: int = 0
+    decode_seconds: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        """압축률 (원본 / 압축)."""
+        return self.raw_bytes / self.compressed_bytes if self.compressed_bytes else 0.0
+
+    @property
+    def decode_mb_per_sec(self) -> float:
+        """복원 처리량 (원본 기준 MB/s)."""
+        if not self.decode_seconds:
+            return 0.0
+        return self.raw_bytes / self.decode_seconds / 1e6
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 직렬화용 dict."""
+        return {
+            "documents": self.documents,
+            "raw_bytes": self.raw_bytes,
+            "compressed_bytes": self.compressed_bytes,
+            "ratio": round(self.ratio, 2),
+            "decode_mb_per_sec": round(self.decode_mb_per_sec, 1),
+        }
+
+
+def compress_jsonl(
+    inputs: Iterable[str | Path], output: str | Path, codec: BodyCodec
+) -> CompressionStats:
+    """JSONL 파일들의 본문을 압축해 새 JSONL로 저장 (복원 검증 및 처리량 측정)."""
+    from pydoc_crawler.jsonl_index import iter_records, repair_index
+
+    stats = CompressionStats()
+    codec.save_dictionary(output)
+
+    with open(output, "w", encoding="utf-8") as dst:
+        for path in inputs:
+            for item in iter_records(path):
+                text = item["content_markdown"]
+                blob = codec.compress(text)
+
+                start = time.perf_counter()
+                restored = codec.decompress(blob)
+                stats.decode_seconds += time.perf_counter() - start
+                if restored != text:
+                    raise ValueError(f"복원 결과 불일치: {item.get('url')}")
+
+                stats.documents += 1
+                stats.raw_bytes += len(text.encode())
+                stats.compressed_bytes += len(blob)
+
+                record = codec.pack_record(item, blob)
+                dst.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    repair_index(output)
+    return stats
@@ -0,0 +1,260 @@
+"""상주 감시(watch) 모드.
+
+프로세스를 띄워 둔 채로 출처/버전별 주기에 맞춰 재수집(``refresh``) 크롤링을
+다시 예약합니다. Scrapy/파서 모듈 import, SQLite 연결(검색/코드 인덱스, 재수집
+이력), 중복 탐지 인덱스는 ``WARM_STATE``로 실행 간에 유지되므로 주기 실행은
+곧바로 시작하고 변경된 페이지만 처리합니다. 상태는 로컬 HTTP 엔드포인트
+(``GET /``)로 JSON 조회할 수 있습니다.
+
+크롤링은 출력 파일/인덱스를 공유하므로 한 번에 하나씩 순차 실행합니다.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from scrapy.settings import BaseSettings, Settings
+from twisted.internet import defer, task
+from twisted.python.failure import Failure
+from twisted.web.resource import Resource
+
+logger = logging.getLogger(__name__)
+
+# 상태 응답에 포함할 크롤러 통계 키
+STATS_KEYS = (
+    "finish_reason",
+    "item_scraped_count",
+    "response_received_count",
+    "httpcache/hit",
+    "recrawl/new",
+    "recrawl/changed",
+    "recrawl/unchanged",
+    "recrawl/skipped_stable",
+    "recrawl/skipped_budget",
+)
+
+
+@dataclass
+class WatchTarget:
+    """주기적으로 재수집할 출처/버전."""
+
+    spider: str
+    version: str
+    interval: float  # 초
+    next_run: float = 0.0
+    last_started: float | None = None
+    last_finished: float | None = None
+    last_result: str | None = None
+    runs: int = 0
+    last_stats: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.spider}-{self.version}"
+
+    @property
+    def last_duration(self) -> float | None:
+        if self.last_started is None or self.last_finished is None:
+            return None
+        return self.last_finished - self.last_started
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "spider": self.spider,
+            "version": self.version,
+            "interval": self.interval,
+            "next_run": self.next_run,
+            "last_started": self.last_started,
+            "last_finished": self.last_finished,
+            "last_duration": self.last_duration,
+            "last_result": self.last_result,
+            "runs": self.runs,
+            "last_stats": self.last_stats,
+        }
+
+
+def load_targets(
+    settings: BaseSettings,
+    versions: list[str] | None = None,
+    interval_hours: float | None = None,
+    spider: str | None = None,
+) -> list[WatchTarget]:
+    """``WATCH_TARGETS`` 설정(또는 인자)에서 감시 대상 목록 생성.
+
+    ``spider``를 지정하면 해당 스파이더 대상만 남기고, 설정에 없는 버전도 그
+    스파이더로 추가합니다 (기본값: ``WATCH_SPIDER``).
+    """
+    default_spider = settings.get("WATCH_SPIDER", "python")
+    targets = []
+    for entry in settings.getlist("WATCH_TARGETS"):
+        entry_spider = entry.get("spider", default_spider)
+        if spider and entry_spider != spider:
+            continue
+        if versions and entry["version"] not in versions:
+            continue
+        hours = interval_hours or float(entry.get("interval_hours", 24))
+        targets.append(
+            WatchTarget(
+                spider=entry_spider,
+                version=entry["version"],
+                interval=hours * 3600,
+            )
+        )
+
+    # 설정에 없는 버전은 기본 주기로 추가
+    known = {target.version for target in targets}
+    for version in versions or []:
+        if version not in known:
+            targets.append(
+                WatchTarget(
+                    spider or default_spider, version, (interval_hours or 24) * 3600
+                )
+            )
+    return targets
+
+
+class CrawlDaemon:
+    """주기가 된 대상을 하나씩 크롤링하는 스케줄러.
+
+    Args:
+        runner: ``create_crawler``/``crawl``을 제공하는 Scrapy CrawlerRunner
+        targets: 감시 대상 목록
+        tick_seconds: 예약 확인 주기
+        clock: 현재 시각 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        runner: Any,
+        targets: list[WatchTarget],
+        tick_seconds: float = 30,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.runner = runner
+        self.targets = targets
+        self.tick_seconds = tick_seconds
+        self.clock = clock
+        self.started_at = clock()
+        self.running: WatchTarget | None = None
+        self._loop: task.LoopingCall | None = None
+
+    def due_target(self, now: float) -> WatchTarget | None:
+        """가장 오래 기다린 실행 예정 대상."""
+        due = [target for target in self.targets if target.next_run <= now]
+        return min(due, key=lambda target: target.next_run) if due else None
+
+    def tick(self) -> defer.Deferred[Any] | None:
+        """실행 중인 크롤링이 없으면 예정된 대상 하나 시작."""
+        if self.running is not None:
+            return None
+        target = self.due_target(self.clock())
+        if target is None:
+            return None
+
+        self.running = target
+        target.last_started = self.clock()
+        logger.info(f"감시 크롤링 시작: {target.key}")
+
+        crawler = None
+        try:
+            crawler = self.runner.create_crawler(target.spider)
+            d: defer.Deferred[Any] = self.runner.crawl(
+                crawler, version=target.version, refresh=True
+            )
+        except Exception:
+            # 예외가 LoopingCall까지 올라가면 예약 루프가 멈추므로 실패로 기록
+            self._finished(Failure(), target, crawler)  # type: ignore[no-untyped-call]
+            return None
+        d.addBoth(self._finished, target, crawler)
+        return d
+
+    def _finished(self, result: Any, target: WatchTarget, crawler: Any) -> None:
+        """실행 결과 기록 후 다음 실행 예약."""
+        now = self.clock()
+        stats = crawler.stats.get_stats() if crawler and crawler.stats else {}
+        target.last_finished = now
+        target.last_stats = {
+            key: stats[key] for key in STATS_KEYS if stats.get(key) is not None
+        }
+        if isinstance(result, Failure):
+            target.last_result = f"error: {getattr(result, 'value', result)}"
+            logger.error(f"감시 크롤링 실패: {target.key} ({target.last_result})")
+        else:
+            target.last_result = str(stats.get("finish_reason", "finished"))
+            logger.info(
+                f"감시 크롤링 완료: {target.key} "
+                f"({target.last_duration:.1f}초, "
+                f"{target.last_stats.get('item_scraped_count', 0)}개 문서)"
+            )
+        target.runs += 1
+        target.next_run = now + target.interval
+        self.running = None
+
+    def status(self) -> dict[str, Any]:
+        """상태 엔드포인트 응답."""
+        now = self.clock()
+        return {
+            "uptime": now - self.started_at,
+            "running": self.running.key if self.running else None,
+            "targets": [target.to_dict() for target in self.targets],
+        }
+
+    def start(self) -> None:
+        """예약 확인 루프 시작."""
+        self._loop = task.LoopingCall(self.tick)
+        self._loop.start(self.tick_seconds, now=True)
+
+    def stop(self) -> None:
+        if self._loop and self._loop.running:
+            self._loop.stop()
+
+
+class StatusResource(Resource):
+    """데몬 상태를 JSON으로 반환하는 HTTP 리소스."""
+
+    isLeaf = True  # noqa: N815
+
+    def __init__(self, daemon: CrawlDaemon) -> None:
+        super().__init__()  # type: ignore[no-untyped-call]
+        self.daemon = daemon
+
+    def render_GET(self, request: Any) -> bytes:  # noqa: N802
+        request.setHeader(b"Content-Type", b"application/json; charset=utf-8")
+        return json.dumps(self.daemon.status(), ensure_ascii=False).encode("utf-8")
+
+
+def run_daemon(settings: Settings, targets: list[WatchTarget], port: int) -> None:
+    """감시 데몬 실행 (종료 시그널까지 블록)."""
+    from scrapy.crawler import CrawlerRunner
+    from scrapy.utils.log import configure_logging
+    from scrapy.utils.reactor import install_reactor
+
+    from pydoc_crawler import warm
+
+    settings.set("WARM_STATE", True)
+    install_reactor(settings["TWISTED_REACTOR"])
+    configure_logging(settings)
+
+    from twisted.internet import reactor as installed_reactor
+    from twisted.web.server import Site
+
+    reactor: Any = installed_reactor
+
+    daemon = CrawlDaemon(
+        CrawlerRunner(settings),
+        targets,
+        tick_seconds=settings.getfloat("WATCH_TICK_SECONDS", 30),
+    )
+    site = Site(StatusResource(daemon))  # type: ignore[no-untyped-call]
+    reactor.listenTCP(port, site, interface="127.0.0.1")
+    reactor.addSystemEventTrigger("before", "shutdown", daemon.stop)
+    reactor.addSystemEventTrigger("after", "shutdown", warm.clear)
+    logger.info(
+        f"감시 모드 시작: {', '.join(target.key for target in targets)} "
+        f"(상태: http://127.0.0.1:{port}/)"
+    )
+    daemon.start()
+    reactor.run()
@@ -0,0 +1,274 @@
+"""MinHash + LSH 기반 유사 중복 문서 탐지.
+
+버전 배너만 다른 페이지, "What's New" 사본 등 거의 같은 문서를 찾아
+RAG 코퍼스에서 표시하거나 제거합니다. 서명 계산은 NumPy로 여러 문서를
+한 번에 처리하고, LSH 밴딩으로 후보 쌍만 비교하여 전체 비교(O(n²))를 피합니다.
+"""
+
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 선택적 의존성
+    np = None  # type: ignore[assignment]
+
+# 단어 토큰
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# 해시 결합용 64비트 홀수 상수
+_MIX = 0x9E3779B97F4A7C15
+
+# (해시 개수 × 셔글 개수) 행렬을 나눠 계산하는 단위 (메모리 상한)
+_BATCH_SHINGLES = 1 << 16
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("중복 탐지에는 numpy가 필요합니다: uv sync --extra dedup")
+
+
+@dataclass
+class DuplicateCluster:
+    """유사 중복 문서 묶음 (첫 문서가 대표)."""
+
+    representative: str
+    duplicates: list[str]
+    similarity: float
+
+
+@dataclass
+class DedupReport:
+    """중복 탐지 결과 요약."""
+
+    documents: int = 0
+    bytes_total: int = 0
+    bytes_saved: int = 0
+    clusters: list[DuplicateCluster] = field(default_factory=list)
+
+    @property
+    def duplicate_count(self) -> int:
+        return sum(len(cluster.duplicates) for cluster in self.clusters)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 직렬화용 dict."""
+        return {
+            "documents": self.documents,
+            "duplicates": self.duplicate_count,
+            "clusters": len(self.clusters),
+            "bytes_total": self.bytes_total,
+            "bytes_saved": self.bytes_saved,
+            "savings_ratio": (
+                self.bytes_saved / self.bytes_total if self.bytes_total else 0.0
+            ),
+            "cluster_details": [cluster.__dict__ for cluster in self.clusters],
+        }
+
+
+class MinHasher:
+    """단어 n-gram 셔글의 MinHash 서명 계산기."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        _require_numpy()
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+        # multiply-shift 해시 계수 (a는 홀수)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**63, size=(num_perm, 1), dtype=np.uint64) | 1
+        self._b = rng.integers(0, 2**63, size=(num_perm, 1), dtype=np.uint64)
+
+    def shingles(self, text: str) -> "np.ndarray":
+        """텍스트의 고유 셔글 해시 (uint64)."""
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        token_hashes = np.fromiter(
+            (zlib.crc32(token.encode()) for token in tokens),
+            dtype=np.uint64,
+            count=len(tokens),
+        )
+
+        k = min(self.shingle_size, len(token_hashes))
+        if k == 0:
+            return np.empty(0, dtype=np.uint64)
+
+        # 연속 k개 토큰 해시를 다항식으로 결합 (uint64 오버플로 허용)
+        count = len(token_hashes) - k + 1
+        combined = np.zeros(count, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for offset in range(k):
+                combined = (
+                    combined * np.uint64(_MIX) + token_hashes[offset : offset + count]
+                )
+        return np.unique(combined)
+
+    @staticmethod
+    def is_empty(signatures: "np.ndarray") -> "np.ndarray":
+        """셔글이 없는 문서의 서명인지 여부."""
+        return cast(
+            "np.ndarray", np.all(signatures == np.iinfo(np.uint32).max, axis=-1)
+        )
+
+    def signatures(self, texts: list[str]) -> "np.ndarray":
+        """여러 문서의 MinHash 서명을 한 번에 계산 (문서 수 × num_perm, uint32).
+
+        셔글이 없는 문서는 모든 값이 최댓값인 서명을 가집니다.
+        """
+        shingle_sets = [self.shingles(text) for text in texts]
+        result = np.full((len(texts), self.num_perm), np.iinfo(np.uint32).max)
+        result = result.astype(np.uint32)
+
+        non_empty = [i for i, s in enumerate(shingle_sets) if len(s)]
+        if not non_empty:
+            return result
+
+        values = np.concatenate([shingle_sets[i] for i in non_empty])
+        lengths = np.array([len(shingle_sets[i]) for i in non_empty])
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        minima = np.full(
+            (self.num_perm, len(non_empty)), np.iinfo(np.uint32).max, dtype=np.uint32
+        )
+        # 셔글 배열을 구간별로 나눠 (num_perm × 구간) 행렬만 메모리에 유지
+        for begin in range(0, len(values), _BATCH_SHINGLES):
+            end = min(begin + _BATCH_SHINGLES, len(values))
+            with np.errstate(over="ignore"):
+                hashed = (self._a * values[begin:end] + self._b) >> np.uint64(32)
+            hashed = hashed.astype(np.uint32)
+
+            # 이 구간에 걸친 문서들의 부분 최솟값
+            docs = np.nonzero((starts < end) & (starts + lengths > begin))[0]
+            offsets = np.clip(starts[docs], begin, end) - begin
+            partial = np.minimum.reduceat(hashed, offsets, axis=1)
+            minima[:, docs] = np.minimum(minima[:, docs], partial)
+
+        result[non_empty] = minima.T
+        return result
+
+
+class LSHIndex:
+    """MinHash 서명 LSH 밴딩 인덱스.
+
+    같은 밴드 해시를 공유하는 문서만 후보로 삼아 추정 유사도를 비교합니다.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, threshold: float = 0.9):
+        _require_numpy()
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나눠져야 합니다")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.buckets: dict[tuple[int, int], int] = {}
+        self.signatures: list[np.ndarray] = []
+
+    def band_keys(self, signatures: "np.ndarray") -> "np.ndarray":
+        """밴드별 해시 (문서 수 × bands, uint64)."""
+        blocks = signatures.reshape(len(signatures), self.bands, self.rows)
+        keys = np.zeros((len(signatures), self.bands), dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for row in range(self.rows):
+                keys = keys * np.uint64(_MIX) + blocks[:, :, row].astype(np.uint64)
+        return keys
+
+    def query(
+        self, signature: "np.ndarray", keys: "np.ndarray | None" = None
+    ) -> tuple[int, float] | None:
+        """가장 유사한 기존 문서 (인덱스, 추정 유사도). 없으면 None."""
+        if keys is None:
+            keys = self.band_keys(signature[np.newaxis, :])[0]
+        candidates = {
+            self.buckets[(band, int(key))]
+            for band, key in enumerate(keys)
+            if (band, int(key)) in self.buckets
+        }
+
+        best: tuple[int, float] | None = None
+        for candidate in candidates:
+            similarity = float(np.mean(self.signatures[candidate] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (candidate, similarity)
+        return best
+
+    def add(
+        self,
+        signature: "np.ndarray",
+        keys: "np.ndarray | None" = None,
+        index: int | None = None,
+    ) -> int:
+        """서명 추가 후 인덱스 반환. 이미 있는 버킷은 먼저 들어온 문서 유지.
+
+        ``index``가 주어지면 새 번호 대신 그 자리의 (``remove``된) 서명을 교체합니다.
+        """
+        if index is None:
+            index = len(self.signatures)
+            self.signatures.append(signature)
+        else:
+            self.remove(index)
+            self.signatures[index] = signature
+        if keys is None:
+            keys = self.band_keys(signature[np.newaxis, :])[0]
+        for band, key in enumerate(keys):
+            self.buckets.setdefault((band, int(key)), index)
+        return index
+
+    def remove(self, index: int) -> None:
+        """서명이 차지한 버킷을 비워 조회 대상에서 제외 (번호는 유지)."""
+        keys = self.band_keys(self.signatures[index][np.newaxis, :])[0]
+        for band, key in enumerate(keys):
+            if self.buckets.get((band, int(key))) == index:
+                del self.buckets[(band, int(key))]
+
+
+def find_duplicates(
+    ids: list[str],
+    signatures: "np.ndarray | list[np.ndarray]",
+    sizes: list[int] | None = None,
+    bands: int = 32,
+    threshold: float = 0.9,
+) -> DedupReport:
+    """전체 코퍼스의 유사 중복 클러스터 탐지.
+
+    입력 순서상 먼저 나온 문서를 클러스터 대표로 유지하고,
+    나머지를 중복으로 보고합니다. ``signatures``는 배치별 서명 목록도 받습니다.
+    """
+    if isinstance(signatures, list):
+        signatures = np.concatenate(signatures)
+
+    index = LSHIndex(num_perm=signatures.shape[1], bands=bands, threshold=threshold)
+    sizes = sizes or [0] * len(ids)
+    report = DedupReport(documents=len(ids), bytes_total=sum(sizes))
+
+    # LSH 인덱스 번호 -> 코퍼스 내 위치 (대표 문서만 인덱스에 추가됨)
+    members: list[int] = []
+    clusters: dict[int, DuplicateCluster] = {}
+
+    all_keys = index.band_keys(signatures)
+    empty = MinHasher.is_empty(signatures)
+
+    for position, signature in enumerate(signatures):
+        if empty[position]:
+            continue
+
+        match = index.query(signature, all_keys[position])
+        if match is None:
+            index.add(signature, all_keys[position])
+            members.append(position)
+            continue
+
+        representative, similarity = match
+        cluster = clusters.setdefault(
+            representative,
+            DuplicateCluster(
+                representative=ids[members[representative]],
+                duplicates=[],
+                similarity=1.0,
+            ),
+        )
+        cluster.duplicates.append(ids[position])
+        cluster.similarity = min(cluster.similarity, similarity)
+        report.bytes_saved += sizes[position]
+
+    report.clusters = list(clusters.values())
+    return report
@@ -1,11 +1,31 @@
 """Pydantic 데이터 모델 정의."""
 
 import hashlib
+from collections.abc import Iterable
 from datetime import datetime
 
 from pydantic import BaseModel, Field, computed_field
 
 
+def content_hashes(texts: Iterable[str]) -> list[str]:
+    """본문 SHA256 해시 목록 (배치용, ``DocumentItem.content_hash``와 같은 값)."""
+    sha256 = hashlib.sha256
+    return [sha256(text.encode()).hexdigest() for text in texts]
+
+
+class CodeBlockItem(BaseModel):  # type: ignore[misc]
+    """문서 내 코드 블록 데이터 모델.
+
+    - ordinal: 문서 내 코드 블록 순번 (0부터)
+    - heading: 코드 블록 직전의 헤딩 (없으면 None)
+    """
+
+    ordinal: int = Field(description="문서 내 코드 블록 순번")
+    language: str = Field(description="코드 언어")
+    code: str = Field(description="코드 본문")
+    heading: str | None = Field(default=None, description="직전 헤딩")
+
+
 class DocumentItem(BaseModel):  # type: ignore[misc]
     """크롤링된 문서 데이터 모델.
 
@@ -32,6 +52,11 @@ class DocumentItem(BaseModel):  # type: ignore[misc]
     crawled_at: datetime = Field(
         default_factory=datetime.now, description="실제 수집 시간"
     )
+    code_blocks: list[CodeBlockItem] = Field(
+        default_factory=list,
+        exclude=True,
+        description="코드 블록 (CodeIndexPipeline 전용, 출력에서 제외)",
+    )
 
     @computed_field  # type: ignore[misc]
     @property
@@ -43,4 +68,36 @@ class DocumentItem(BaseModel):  # type: ignore[misc]
     @property
     def content_hash(self) -> str:
         """본문 SHA256 해시 (변경 감지용)."""
+        return content_hashes([self.content_markdown])[0]
+
+
+class ChunkItem(BaseModel):  # type: ignore[misc]
+    """RAG 임베딩 단위 청크 데이터 모델.
+
+    - id: 문서 ID + 헤딩 경로 + part의 MD5 Hash (안정적인 청크 ID)
+    - content_hash: 청크 본문 SHA256 Hash (재임베딩 여부 판단용)
+    """
+
+    document_id: str = Field(description="원본 문서 ID")
+    source: str = Field(description="문서 출처 (python, fastapi 등)")
+    version: str = Field(description="프레임워크 버전")
+    url: str = Field(description="원본 문서 URL")
+    title: str = Field(description="문서 제목")
+    heading_path: list[str] = Field(description="상위 헤딩 경로")
+    part: int = Field(description="같은 헤딩 경로 내 순번")
+    ordinal: int = Field(description="문서 내 청크 순번")
+    content_markdown: str = Field(description="청크 Markdown 본문")
+    token_estimate: int = Field(description="추정 토큰 수")
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def id(self) -> str:
+        """문서 ID + 헤딩 경로 기반 MD5 해시 ID."""
+        key = f"{self.document_id}:{' > '.join(self.heading_path)}:{self.part}"
+        return hashlib.md5(key.encode()).hexdigest()
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def content_hash(self) -> str:
+        """청크 본문 SHA256 해시 (변경 감지용)."""
         return hashlib.sha256(self.content_markdown.encode()).hexdigest()
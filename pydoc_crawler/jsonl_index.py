@@ -0,0 +1,269 @@
+"""JSONL 출력 사이드카 오프셋 인덱스와 랜덤 액세스 리더.
+
+``python_3.13_output.jsonl`` 옆에 ``python_3.13_output.jsonl.idx``를 두고, 문서마다
+한 줄씩 바이트 오프셋/길이와 조회 키를 기록합니다 (탭 구분)::
+
+    <offset>\\t<length>\\t<id>\\t<source>\\t<version>\\t<url>
+
+리더는 출력 파일을 메모리 매핑하고 인덱스로 해당 줄만 잘라 파싱하므로,
+문서 하나를 찾거나 일부만 읽을 때 나머지 파일을 읽거나 파싱하지 않습니다.
+본문이 압축된 출력(``content_zstd``)은 사이드카 사전으로 자동 복원합니다.
+"""
+
+import json
+import logging
+import mmap
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+from pydoc_crawler.compression import BodyCodec, decode_record
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+DELTA_SUFFIX = ".delta"
+
+
+def index_path_for(path: str | Path) -> Path:
+    """JSONL 파일의 사이드카 인덱스 경로."""
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def delta_path_for(path: str | Path) -> Path:
+    """부분 수집(재수집/대상 수집) 결과를 모으는 JSONL 파일 경로."""
+    path = Path(path)
+    return path.with_name(path.name + DELTA_SUFFIX)
+
+
+class IndexEntry(NamedTuple):
+    """문서 한 줄의 위치와 조회 키."""
+
+    offset: int
+    length: int
+    id: str
+    source: str
+    version: str
+    url: str
+
+    @classmethod
+    def for_item(cls, item: dict[str, Any], offset: int, length: int) -> "IndexEntry":
+        return cls(
+            offset,
+            length,
+            str(item.get("id", "")),
+            str(item.get("source", "")),
+            str(item.get("version", "")),
+            str(item.get("url", "")),
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> "IndexEntry":
+        offset, length, doc_id, source, version, url = line.rstrip("\n").split("\t", 5)
+        return cls(int(offset), int(length), doc_id, source, version, url)
+
+    def to_line(self) -> str:
+        return "\t".join(map(str, self)) + "\n"
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+
+def load_index(path: str | Path) -> list[IndexEntry]:
+    """사이드카 인덱스 읽기 (없으면 빈 목록, 잘린 마지막 줄은 무시)."""
+    index_path = index_path_for(path)
+    if not index_path.exists():
+        return []
+
+    entries: list[IndexEntry] = []
+    with open(index_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            entries.append(IndexEntry.from_line(line))
+    return entries
+
+
+def repair_index(path: str | Path, write: bool = True) -> list[IndexEntry]:
+    """출력 파일과 일치하도록 인덱스 복구.
+
+    파일 크기를 넘는 항목은 버리고, 마지막 항목 이후의 완전한 줄만 스캔해
+    추가합니다. 인덱스가 없으면 파일 전체를 한 번 스캔해 만듭니다.
+    """
+    path = Path(path)
+    size = path.stat().st_size if path.exists() else 0
+    entries = [entry for entry in load_index(path) if entry.end <= size]
+    offset = entries[-1].end if entries else 0
+
+    if offset < size:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    item = json.loads(line)
+                    entries.append(IndexEntry.for_item(item, offset, len(line)))
+                offset += len(line)
+
+    if write:
+        index_path = index_path_for(path)
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(entry.to_line() for entry in entries)
+        tmp_path.replace(index_path)
+    return entries
+
+
+def merge_jsonl(path: str | Path, delta: str | Path) -> int:
+    """부분 수집 출력(``delta``)을 기존 출력에 병합하고 문서 수 반환.
+
+    ``delta``에 있는 URL의 기존 줄을 빼고 나머지 줄을 파싱 없이 그대로 복사한 뒤
+    ``delta`` 줄을 이어 붙여 임시 파일을 만들고, 인덱스와 함께 교체합니다.
+    같은 ``delta``를 다시 병합해도 결과가 같습니다.
+    """
+    path, delta = Path(path), Path(delta)
+    delta_entries = repair_index(delta, write=False)
+    entries = repair_index(path, write=False) if path.exists() else []
+    if not delta_entries:
+        return len(entries)
+
+    replaced = {entry.url for entry in delta_entries}
+    sources = [
+        (path, [entry for entry in entries if entry.url not in replaced]),
+        (delta, delta_entries),
+    ]
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    merged: list[IndexEntry] = []
+    offset = 0
+    with open(tmp_path, "wb") as dst:
+        for source, source_entries in sources:
+            if not source_entries:
+                continue
+            with open(source, "rb") as src:
+                for entry in source_entries:
+                    src.seek(entry.offset)
+                    dst.write(src.read(entry.length))
+                    merged.append(entry._replace(offset=offset))
+                    offset += entry.length
+
+    index_tmp_path = index_path_for(tmp_path)
+    with open(index_tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(entry.to_line() for entry in merged)
+    tmp_path.replace(path)
+    index_tmp_path.replace(index_path_for(path))
+    return len(merged)
+
+
+def iter_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """JSONL 파일을 한 줄씩 읽어 문서 dict 스트리밍 (압축 본문 자동 복원)."""
+    codec = BodyCodec.for_jsonl(path)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield decode_record(json.loads(line), codec)
+
+
+class JsonlIndexWriter:
+    """JSONL 출력과 함께 사이드카 인덱스를 이어 쓰는 작성기."""
+
+    def __init__(self, path: str | Path, append: bool = False) -> None:
+        self.path = index_path_for(path)
+        self.file: IO[str] = open(  # noqa: SIM115
+            self.path, "a" if append else "w", encoding="utf-8"
+        )
+
+    def write(self, item: dict[str, Any], offset: int, length: int) -> None:
+        self.file.write(IndexEntry.for_item(item, offset, length).to_line())
+
+    def write_many(self, entries: list[tuple[dict[str, Any], int, int]]) -> None:
+        """``(item, offset, length)`` 목록을 쓰기 한 번으로 기록."""
+        self.file.write(
+            "".join(IndexEntry.for_item(*entry).to_line() for entry in entries)
+        )
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class JsonlReader:
+    """사이드카 인덱스 기반 JSONL 랜덤 액세스 리더.
+
+    인덱스가 없거나 출력 파일과 맞지 않으면 한 번 복구(스캔)합니다.
+    같은 id/URL이 여러 번 기록되었으면 마지막 줄을 반환합니다.
+
+    Example::
+
+        with JsonlReader("data/python_3.13_output.jsonl") as reader:
+            doc = reader.get_by_url("https://docs.python.org/3.13/tutorial/index.html")
+            for doc in reader.iter(version="3.12"):
+                ...
+    """
+
+    def __init__(self, path: str | Path, write_index: bool = True) -> None:
+        self.path = Path(path)
+        self.codec = BodyCodec.for_jsonl(self.path)
+        self._file = open(self.path, "rb")  # noqa: SIM115
+        size = self.path.stat().st_size
+        self._buffer: Any = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        )
+
+        entries = load_index(self.path)
+        if not entries or entries[-1].end != size:
+            entries = repair_index(self.path, write=write_index)
+        self.entries = entries
+        self._by_id = {entry.id: entry for entry in entries}
+        self._by_url = {entry.url: entry for entry in entries}
+
+    def __enter__(self) -> "JsonlReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def read(self, entry: IndexEntry) -> dict[str, Any]:
+        """인덱스 항목의 문서 한 줄만 파싱."""
+        record: dict[str, Any] = json.loads(self._buffer[entry.offset : entry.end])
+        return decode_record(record, self.codec)
+
+    def get(self, doc_id: str) -> dict[str, Any] | None:
+        """문서 ID로 조회."""
+        entry = self._by_id.get(doc_id)
+        return self.read(entry) if entry else None
+
+    def get_by_url(self, url: str) -> dict[str, Any] | None:
+        """URL로 조회."""
+        entry = self._by_url.get(url)
+        return self.read(entry) if entry else None
+
+    def iter(
+        self,
+        source: str | None = None,
+        version: str | None = None,
+        ids: Iterable[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """조건에 맞는 문서만 파일 순서대로 스트리밍."""
+        wanted = set(ids) if ids is not None else None
+        for entry in self.entries:
+            if source is not None and entry.source != source:
+                continue
+            if version is not None and entry.version != version:
+                continue
+            if wanted is not None and entry.id not in wanted:
+                continue
+            yield self.read(entry)
@@ -0,0 +1,112 @@
+"""사이트 내부 링크 그래프(역링크 인덱스).
+
+스파이더의 ``LinkExtractor`` 규칙이 찾은 링크(출발 URL → 대상 URL, 앵커 텍스트)를
+기록합니다. URL은 ``urls`` 테이블에 한 번만 저장하고 링크는 정수 id 쌍으로
+보관하며, ``links``의 기본키가 (대상, 출발) 순서라 "이 페이지를 가리키는
+페이지"를 기본키 범위 조회로 찾습니다. 변경된 페이지와 그 페이지를 링크하는
+페이지만 다시 수집할 때(``-a changed=...``) 사용합니다.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydoc_crawler.storage import connect_sqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS links (
+    target INTEGER NOT NULL,
+    source INTEGER NOT NULL,
+    anchor TEXT,
+    PRIMARY KEY (target, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS links_source ON links (source);
+"""
+
+
+class LinkGraph:
+    """사이트 내부 링크 그래프 저장소 (SQLite)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.conn = connect_sqlite(path)
+        self.conn.executescript(SCHEMA)
+        self._ids: dict[str, int] = {}
+
+    def close(self) -> None:
+        """커밋 후 연결 닫기."""
+        self.conn.commit()
+        self.conn.close()
+
+    def commit(self) -> None:
+        """변경사항 커밋."""
+        self.conn.commit()
+
+    def _url_id(self, url: str) -> int:
+        """URL의 정수 id (없으면 등록)."""
+        if url not in self._ids:
+            self.conn.execute("INSERT OR IGNORE INTO urls (url) VALUES (?)", (url,))
+            row = self.conn.execute(
+                "SELECT id FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+            self._ids[url] = row["id"]
+        return self._ids[url]
+
+    def clear_links(self, source: str) -> None:
+        """``source``의 기존 출발 링크 삭제 (페이지를 다시 수집할 때)."""
+        self.conn.execute("DELETE FROM links WHERE source = ?", (self._url_id(source),))
+
+    def add(self, source: str, target: str, anchor: str | None = None) -> None:
+        """링크 기록 (같은 출발/대상 쌍이면 앵커 텍스트만 갱신)."""
+        if source == target:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO links (target, source, anchor) VALUES (?, ?, ?)",
+            (self._url_id(target), self._url_id(source), anchor or None),
+        )
+
+    def in_links(self, url: str) -> list[tuple[str, str | None]]:
+        """``url``을 가리키는 페이지 목록 [(출발 URL, 앵커 텍스트)]."""
+        rows = self.conn.execute(
+            "SELECT urls.url, links.anchor FROM links"
+            " JOIN urls ON urls.id = links.source"
+            " WHERE links.target = (SELECT id FROM urls WHERE url = ?)"
+            " ORDER BY urls.url",
+            (url,),
+        )
+        return [(row["url"], row["anchor"]) for row in rows]
+
+    def out_links(self, url: str) -> list[tuple[str, str | None]]:
+        """``url``에서 나가는 링크 목록 [(대상 URL, 앵커 텍스트)]."""
+        rows = self.conn.execute(
+            "SELECT urls.url, links.anchor FROM links"
+            " JOIN urls ON urls.id = links.target"
+            " WHERE links.source = (SELECT id FROM urls WHERE url = ?)"
+            " ORDER BY urls.url",
+            (url,),
+        )
+        return [(row["url"], row["anchor"]) for row in rows]
+
+    def out_degree(self, url: str) -> int:
+        """``url``에서 나가는 링크 수."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM links"
+            " WHERE source = (SELECT id FROM urls WHERE url = ?)",
+            (url,),
+        ).fetchone()
+        return int(row[0])
+
+    def dependents(self, urls: Iterable[str]) -> set[str]:
+        """주어진 페이지들을 직접 링크하는 페이지 (주어진 페이지 자신은 제외)."""
+        changed = set(urls)
+        neighbors = {source for url in changed for source, _ in self.in_links(url)}
+        return neighbors - changed
+
+    def stats(self) -> dict[str, int]:
+        """저장된 URL/링크 수."""
+        return {
+            "urls": self.conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0],
+            "links": self.conn.execute("SELECT COUNT(*) FROM links").fetchone()[0],
+        }
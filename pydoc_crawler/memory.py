@@ -0,0 +1,135 @@
+"""크롤링 메모리 상한 관리.
+
+- ``MemoryBudget``: 다운로드 완료 후 파싱이 끝날 때까지 메모리에 남아 있는 응답
+  본문 바이트 총량. 상한을 넘으면 새 다운로드를 대기시켜(backpressure) 동시
+  파싱 중인 큰 페이지가 한꺼번에 쌓이지 않게 합니다.
+- ``PeakMemoryTracker``: ``tracemalloc``으로 페이지별 파싱 최대 메모리를 측정해
+  가장 무거운 페이지 목록을 보고합니다.
+"""
+
+import heapq
+import tracemalloc
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from scrapy.crawler import Crawler
+from twisted.internet import defer
+
+_budgets: "weakref.WeakKeyDictionary[Crawler, MemoryBudget]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class Reservation:
+    """응답 하나가 차지한 예산 (여러 번 해제해도 한 번만 반환)."""
+
+    def __init__(self, budget: "MemoryBudget", size: int) -> None:
+        self.budget = budget
+        self.size = size
+        self.released = False
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self.budget.release(self.size)
+
+
+class MemoryBudget:
+    """크롤러별 in-flight 응답 바이트 예산.
+
+    다운로더 미들웨어와 스파이더 미들웨어가 같은 인스턴스를 공유하도록
+    ``for_crawler``로 얻습니다. 진행 중인 응답이 하나도 없으면 상한보다 큰
+    페이지도 받아들여 교착 상태가 되지 않습니다.
+
+    Args:
+        limit: 바이트 상한 (0이면 무제한)
+    """
+
+    def __init__(self, limit: int = 0) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.peak = 0
+        self._waiters: list[defer.Deferred[None]] = []
+
+    @classmethod
+    def for_crawler(cls, crawler: Crawler) -> "MemoryBudget":
+        if crawler not in _budgets:
+            _budgets[crawler] = cls(crawler.settings.getint("MEMORY_INFLIGHT_BYTES"))
+        return _budgets[crawler]
+
+    @property
+    def exhausted(self) -> bool:
+        return bool(self.limit) and self.in_flight >= self.limit
+
+    def wait(self) -> defer.Deferred[None]:
+        """예산에 여유가 생기면 발화하는 Deferred."""
+        if not self.exhausted:
+            return defer.succeed(None)
+        d: defer.Deferred[None] = defer.Deferred()
+        self._waiters.append(d)
+        return d
+
+    def reserve(self, size: int) -> Reservation:
+        self.in_flight += size
+        self.peak = max(self.peak, self.in_flight)
+        return Reservation(self, size)
+
+    def release(self, size: int) -> None:
+        self.in_flight -= size
+        while self._waiters and not self.exhausted:
+            self._waiters.pop(0).callback(None)
+
+
+class PeakMemoryTracker:
+    """페이지별 파싱 최대 메모리 측정 (상위 ``top``개 보관).
+
+    파싱은 리액터 스레드에서 한 페이지씩 동기 실행되므로, 측정 직전에
+    ``tracemalloc.reset_peak()``을 호출하면 해당 페이지의 최대치만 얻습니다.
+    """
+
+    def __init__(self, top: int = 20) -> None:
+        self.top = top
+        self.pages = 0
+        self.max_peak = 0
+        self._heap: list[tuple[int, str]] = []
+        self._started = False
+
+    @contextmanager
+    def measure(self, url: str) -> Iterator[None]:
+        """블록 실행 중 늘어난 최대 메모리를 ``url``에 대해 기록."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            self.record(url, tracemalloc.get_traced_memory()[1] - baseline)
+
+    def record(self, url: str, peak: int) -> None:
+        self.pages += 1
+        self.max_peak = max(self.max_peak, peak)
+        if len(self._heap) < self.top:
+            heapq.heappush(self._heap, (peak, url))
+        else:
+            heapq.heappushpop(self._heap, (peak, url))
+
+    def report(self) -> dict[str, Any]:
+        """측정 요약과 가장 무거운 페이지 목록."""
+        return {
+            "pages": self.pages,
+            "max_peak_bytes": self.max_peak,
+            "top_pages": [
+                {"url": url, "peak_bytes": peak}
+                for peak, url in sorted(self._heap, reverse=True)
+            ],
+        }
+
+    def stop(self) -> None:
+        """직접 시작한 tracemalloc 중지."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
@@ -0,0 +1,178 @@
+"""Scrapy 미들웨어."""
+
+import logging
+import weakref
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from scrapy import signals
+from scrapy.crawler import Crawler
+from scrapy.downloadermiddlewares.redirect import RedirectMiddleware
+from scrapy.exceptions import NotConfigured
+from scrapy.http import Headers, Request, Response
+from scrapy.utils.defer import maybe_deferred_to_future
+
+from pydoc_crawler.memory import MemoryBudget
+from pydoc_crawler.parsers.registry import ParserRegistry
+from pydoc_crawler.parsers.streaming import StreamingDocument, StreamingUnsupportedError
+from pydoc_crawler.urls import UrlCanonicalizer
+
+# 응답 예산 예약을 담는 request.meta 키
+RESERVATION_META_KEY = "_memory_reservation"
+
+# 증분 파싱 상태를 담는 request.meta 키
+STREAM_META_KEY = "_streaming_document"
+
+logger = logging.getLogger(__name__)
+
+
+class CanonicalRedirectMiddleware(RedirectMiddleware):
+    """정규형이 같은 URL로의 리다이렉트가 dupefilter에 걸리지 않도록 처리.
+
+    ``/3/x.html`` → ``/3.13/x.html`` 처럼 원래 요청과 정규형이 같은 대상으로
+    리다이렉트되면, 원래 요청의 지문이 이미 기록되어 있어 대상이 걸러집니다.
+    이 경우에만 필터를 건너뛰고, 정규형이 다른 대상은 평소대로 dupefilter를
+    거쳐 이미 수집된 문서면 다시 받지 않습니다.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.canonicalize = UrlCanonicalizer()
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> "CanonicalRedirectMiddleware":
+        middleware: CanonicalRedirectMiddleware = super().from_crawler(crawler)
+        middleware.canonicalize = UrlCanonicalizer.from_settings(crawler.settings)
+        return middleware
+
+    def _redirect(self, redirected: Request, request: Request, reason: Any) -> Request:
+        redirected = super()._redirect(redirected, request, reason)
+        if self.canonicalize(redirected.url) == self.canonicalize(request.url):
+            redirected.dont_filter = True
+            self.crawler.stats.inc_value("canonical/same_page_redirect")
+        return redirected
+
+
+class MemoryBudgetDownloaderMiddleware:
+    """in-flight 응답 바이트가 ``MEMORY_INFLIGHT_BYTES``를 넘으면 새 다운로드 대기.
+
+    대기 중인 요청도 다운로더의 동시 요청 수에 포함되므로, 엔진은 스케줄러에서
+    더 꺼내지 않습니다. 응답이 도착하면 본문 크기만큼 예산을 예약하고,
+    ``MemoryBudgetSpiderMiddleware``가 콜백 출력을 모두 처리한 뒤 해제합니다.
+    응답이 스파이더까지 가지 않는 경우(에러 등)를 위해 응답 객체가 해제될 때도
+    예약을 반환합니다.
+    """
+
+    def __init__(self, crawler: Crawler) -> None:
+        self.crawler = crawler
+        self.budget = MemoryBudget.for_crawler(crawler)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> "MemoryBudgetDownloaderMiddleware":
+        return cls(crawler)
+
+    async def process_request(self, request: Request) -> None:
+        if self.budget.exhausted:
+            self.crawler.stats.inc_value("memory/backpressure_waits")
+            await maybe_deferred_to_future(self.budget.wait())
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        if self.budget.limit:
+            reservation = self.budget.reserve(len(response.body))
+            request.meta[RESERVATION_META_KEY] = reservation
+            weakref.finalize(response, reservation.release)
+            self.crawler.stats.max_value("memory/inflight_peak_bytes", self.budget.peak)
+        return response
+
+
+class MemoryBudgetSpiderMiddleware:
+    """콜백 출력 처리가 끝나면 응답 예산 해제."""
+
+    def process_spider_output(
+        self, response: Response, result: Iterable[Any]
+    ) -> Iterable[Any]:
+        try:
+            yield from result
+        finally:
+            self._release(response)
+
+    async def process_spider_output_async(
+        self, response: Response, result: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        try:
+            async for output in result:
+                yield output
+        finally:
+            self._release(response)
+
+    def process_spider_exception(
+        self, response: Response, exception: Exception
+    ) -> None:
+        self._release(response)
+
+    def _release(self, response: Response) -> None:
+        reservation = response.meta.get(RESERVATION_META_KEY)
+        if reservation is not None:
+            reservation.release()
+
+
+class StreamingParseMiddleware:
+    """``STREAMING_PARSE``면 본문 조각이 도착하는 대로 증분 파싱.
+
+    ``headers_received`` 시그널에서 HTML 응답마다 ``StreamingDocument``를 만들고,
+    ``bytes_received`` 시그널로 받은 (압축된) 조각을 바로 넣어 다운로드 중에
+    본문 블록을 Markdown으로 변환합니다. 콜백은 ``request.meta``의 결과를
+    마무리만 하고, 스트림을 쓸 수 없는 응답(캐시 응답, 압축 해제 결과가 다른
+    응답, 파싱 오류)은 일반 파싱으로 처리됩니다.
+
+    ``HttpCompressionMiddleware``(590)보다 엔진 쪽(580)에 두어 압축이 풀린
+    본문 크기와 스트림이 디코딩한 크기를 비교합니다.
+    """
+
+    def __init__(self, crawler: Crawler) -> None:
+        self.crawler = crawler
+        self.min_bytes = crawler.settings.getint("STREAMING_PARSE_MIN_BYTES")
+        crawler.signals.connect(self.headers_received, signal=signals.headers_received)
+        crawler.signals.connect(self.bytes_received, signal=signals.bytes_received)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> "StreamingParseMiddleware":
+        if not crawler.settings.getbool("STREAMING_PARSE"):
+            raise NotConfigured
+        return cls(crawler)
+
+    def headers_received(
+        self, headers: Headers, body_length: int, request: Request
+    ) -> None:
+        # 재시도/리다이렉트 요청은 이전 다운로드의 meta를 복사해 옴
+        request.meta.pop(STREAM_META_KEY, None)
+        registry = getattr(self.crawler.spider, "parsers", None)
+        content_type = headers.get(b"Content-Type") or b""
+        if not isinstance(registry, ParserRegistry) or b"html" not in content_type:
+            return
+        if 0 <= body_length < self.min_bytes:
+            return
+        try:
+            request.meta[STREAM_META_KEY] = StreamingDocument(registry, headers)
+        except StreamingUnsupportedError:
+            self.crawler.stats.inc_value("streaming/unsupported")
+
+    def bytes_received(self, data: bytes, request: Request) -> None:
+        stream = request.meta.get(STREAM_META_KEY)
+        if stream is None:
+            return
+        try:
+            stream.feed(data)
+        except Exception as e:
+            del request.meta[STREAM_META_KEY]
+            self.crawler.stats.inc_value("streaming/fallback")
+            logger.debug(f"증분 파싱 중단: {request.url} - {e}")
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        stream = request.meta.get(STREAM_META_KEY)
+        if stream is not None and (
+            "cached" in response.flags or stream.decoded_bytes != len(response.body)
+        ):
+            del request.meta[STREAM_META_KEY]
+            self.crawler.stats.inc_value("streaming/fallback")
+        return response
@@ -0,0 +1,228 @@
+"""Parquet 코퍼스 내보내기.
+
+문서를 source/version별 디렉토리로 나눠 Parquet 파일로 씁니다::
+
+    <root>/<source>/<version>/part-00000.parquet
+
+레코드는 파티션별 버퍼에 모았다가 행 수 또는 바이트 상한에 도달하면
+행 그룹 하나로 기록하므로, 코퍼스 크기와 무관하게 메모리 사용량이
+``max_buffer_bytes`` 안에서 유지됩니다. ``source``/``version``은 사전(dictionary)
+인코딩 컬럼입니다.
+"""
+
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydoc_crawler.jsonl_index import iter_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - 선택적 의존성
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# 파티션 디렉토리 이름에 쓸 수 없는 문자
+UNSAFE_PATH_CHARS = re.compile(r"[^\w.\-]")
+
+# DocumentItem 컬럼 순서
+COLUMNS = [
+    "id",
+    "source",
+    "version",
+    "url",
+    "title",
+    "content_markdown",
+    "content_hash",
+    "last_updated_at",
+    "crawled_at",
+]
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Parquet 내보내기에는 pyarrow가 필요합니다: uv sync --extra parquet"
+        )
+
+
+def document_schema() -> "pa.Schema":
+    """문서 Parquet 스키마."""
+    _require_pyarrow()
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [
+            ("id", pa.string()),
+            ("source", category),
+            ("version", category),
+            ("url", pa.string()),
+            ("title", pa.string()),
+            ("content_markdown", pa.large_string()),
+            ("content_hash", pa.string()),
+            ("last_updated_at", pa.string()),
+            ("crawled_at", pa.timestamp("us")),
+        ]
+    )
+
+
+def _row(item: dict[str, Any]) -> dict[str, Any]:
+    """아이템 dict를 스키마 컬럼만 남긴 행으로 변환."""
+    row = {column: item.get(column) for column in COLUMNS}
+    crawled_at = row["crawled_at"]
+    if isinstance(crawled_at, str):
+        row["crawled_at"] = datetime.fromisoformat(crawled_at)
+    return row
+
+
+def _row_size(row: dict[str, Any]) -> int:
+    """행 버퍼 크기 추정 (문자열 컬럼 길이 합)."""
+    return sum(len(value) for value in row.values() if isinstance(value, str))
+
+
+@dataclass
+class ExportStats:
+    """내보내기 결과 요약."""
+
+    rows: int = 0
+    row_groups: int = 0
+    files: list[str] = field(default_factory=list)
+
+
+class _PartitionWriter:
+    """파티션 하나의 행 버퍼와 ParquetWriter."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.rows: list[dict[str, Any]] = []
+        self.buffered_bytes = 0
+        self.writer: Any = None
+
+
+class ParquetDatasetWriter:
+    """source/version 파티션별 스트리밍 Parquet 작성기.
+
+    Args:
+        root: 출력 루트 디렉토리
+        row_group_rows: 행 그룹당 최대 행 수
+        row_group_bytes: 행 그룹당 최대 버퍼 크기 (바이트, 추정치)
+        max_buffer_bytes: 전체 파티션 버퍼 합계 상한 (초과 시 가장 큰 버퍼부터 기록)
+        compression: Parquet 압축 코덱 (zstd, snappy, gzip, none 등)
+        partition: False면 ``<root>/part-NNNNN.parquet`` 단일 파일
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        row_group_rows: int = 1000,
+        row_group_bytes: int = 32 * 1024 * 1024,
+        max_buffer_bytes: int = 128 * 1024 * 1024,
+        compression: str = "zstd",
+        partition: bool = True,
+    ) -> None:
+        _require_pyarrow()
+        self.root = Path(root)
+        self.row_group_rows = row_group_rows
+        self.row_group_bytes = row_group_bytes
+        self.max_buffer_bytes = max_buffer_bytes
+        self.compression = compression
+        self.partition = partition
+        self.schema = document_schema()
+        self.partitions: dict[tuple[str, ...], _PartitionWriter] = {}
+        self.buffered_bytes = 0
+        self.stats = ExportStats()
+
+    def write(self, item: dict[str, Any]) -> None:
+        """문서 하나 추가 (상한 도달 시 행 그룹 기록)."""
+        row = _row(item)
+        # 디렉토리 이름이 같아지는 값은 같은 파티션 (파트 파일 번호 충돌 방지)
+        key = (
+            tuple(
+                UNSAFE_PATH_CHARS.sub("_", str(row[column]))
+                for column in ("source", "version")
+            )
+            if self.partition
+            else ()
+        )
+        partition = self.partitions.get(key)
+        if partition is None:
+            partition = _PartitionWriter(self._partition_path(key))
+            self.partitions[key] = partition
+
+        size = _row_size(row)
+        partition.rows.append(row)
+        partition.buffered_bytes += size
+        self.buffered_bytes += size
+        self.stats.rows += 1
+
+        if (
+            len(partition.rows) >= self.row_group_rows
+            or partition.buffered_bytes >= self.row_group_bytes
+        ):
+            self._flush(partition)
+
+        while self.buffered_bytes > self.max_buffer_bytes:
+            largest = max(self.partitions.values(), key=lambda p: p.buffered_bytes)
+            self._flush(largest)
+
+    def close(self) -> ExportStats:
+        """남은 버퍼 기록 후 모든 파일 닫기."""
+        for partition in self.partitions.values():
+            self._flush(partition)
+            if partition.writer is not None:
+                partition.writer.close()
+                self.stats.files.append(str(partition.path))
+        self.partitions.clear()
+        return self.stats
+
+    def _partition_path(self, key: tuple[str, ...]) -> Path:
+        """다음 파트 파일 경로 (기존 파일은 덮어쓰지 않음)."""
+        directory = self.root.joinpath(*key)
+        directory.mkdir(parents=True, exist_ok=True)
+        indexes = [
+            int(path.stem.removeprefix("part-"))
+            for path in directory.glob("part-*.parquet")
+            if path.stem.removeprefix("part-").isdigit()
+        ]
+        return directory / f"part-{max(indexes, default=-1) + 1:05d}.parquet"
+
+    def _flush(self, partition: _PartitionWriter) -> None:
+        """버퍼를 행 그룹 하나로 기록."""
+        if not partition.rows:
+            return
+        if partition.writer is None:
+            partition.writer = pq.ParquetWriter(
+                partition.path,
+                self.schema,
+                compression=self.compression,
+                use_dictionary=["source", "version"],
+            )
+
+        table = pa.Table.from_pylist(partition.rows, schema=self.schema)
+        partition.writer.write_table(table, row_group_size=table.num_rows)
+        self.stats.row_groups += 1
+
+        self.buffered_bytes -= partition.buffered_bytes
+        partition.rows = []
+        partition.buffered_bytes = 0
+
+
+def export_jsonl(
+    inputs: Iterable[str | Path], writer: ParquetDatasetWriter
+) -> ExportStats:
+    """JSONL 출력 파일들을 한 줄씩 읽어 Parquet으로 내보내기."""
+    for path in inputs:
+        for item in iter_records(path):
+            writer.write(item)
+    stats = writer.close()
+    logger.info(
+        f"Parquet 내보내기: {stats.rows}행, 행 그룹 {stats.row_groups}개, "
+        f"파일 {len(stats.files)}개"
+    )
+    return stats
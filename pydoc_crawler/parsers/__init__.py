@@ -1,5 +1,14 @@
 """HTML 파서 모듈."""
 
+from pydoc_crawler.parsers.base import BaseDocParser
+from pydoc_crawler.parsers.mkdocs import MkDocsParser
+from pydoc_crawler.parsers.registry import ParserRegistry, detect_engine
 from pydoc_crawler.parsers.sphinx import SphinxParser
 
-__all__ = ["SphinxParser"]
+__all__ = [
+    "BaseDocParser",
+    "MkDocsParser",
+    "ParserRegistry",
+    "SphinxParser",
+    "detect_engine",
+]
@@ -0,0 +1,187 @@
+"""문서 엔진 파서 공통 기반."""
+
+import re
+from typing import Any, ClassVar
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, Tag
+from markdownify import MarkdownConverter
+from scrapy.http import Response
+
+# 코드 블록의 직전 헤딩 탐색 대상
+HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
+# 연속된 빈 줄(공백만 있는 줄 포함)을 첫 빈 줄 하나로 축약
+_BLANK_RUN = re.compile(r"(\n[^\S\n]*)(?:\n[^\S\n]*)+(?=\n|$)")
+
+
+class BaseDocParser:
+    """문서 사이트 파서 기반 클래스.
+
+    하위 클래스는 엔진 이름과 CSS 선택자만 정의합니다.
+    선택자는 클래스 생성 시 한 번 컴파일(선택자 플랜)되어 페이지마다
+    다시 파싱하지 않습니다.
+    """
+
+    # 문서 엔진 이름 (registry 키)
+    ENGINE: ClassVar[str] = ""
+
+    # 본문 영역 CSS 선택자 (우선순위 순)
+    CONTENT_SELECTORS: ClassVar[list[str]] = ["main", "article"]
+
+    # 제거할 노이즈 요소
+    NOISE_SELECTORS: ClassVar[list[str]] = ["nav", "script", "style"]
+
+    # <title> fallback 시 사이트 이름 구분자
+    TITLE_SEPARATOR: ClassVar[str] = "—"
+
+    # 컴파일된 선택자 플랜
+    _content_plan: ClassVar[list[sv.SoupSieve]] = []
+    _noise_plan: ClassVar[list[sv.SoupSieve]] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._content_plan = [sv.compile(s) for s in cls.CONTENT_SELECTORS]
+        cls._noise_plan = [sv.compile(s) for s in cls.NOISE_SELECTORS]
+
+    def parse(self, response: Response) -> dict[str, Any]:
+        """Scrapy Response를 파싱하여 Markdown으로 변환."""
+        soup = BeautifulSoup(response.text, "html.parser")
+        try:
+            title = self._extract_title(soup)
+            content_div = self._find_content_area(soup)
+
+            if not content_div:
+                raise ValueError(f"본문 영역을 찾을 수 없습니다: {response.url}")
+
+            # 노이즈 제거
+            self._remove_noise(content_div)
+
+            # Markdown 변환 (코드 블록 레코드도 같은 변환 과정에서 수집)
+            code_blocks: list[dict[str, Any]] = []
+            content_markdown = self._to_markdown(content_div, code_blocks)
+
+            # 수정일 추출 (있는 경우)
+            last_updated = self._extract_last_updated(soup)
+        finally:
+            # 트리의 부모/자식 순환 참조를 끊어 GC 전에 즉시 해제
+            soup.decompose()
+
+        return {
+            "title": title,
+            "content_markdown": content_markdown,
+            "last_updated_at": last_updated,
+            "code_blocks": code_blocks,
+        }
+
+    def _extract_title(self, soup: BeautifulSoup) -> str:
+        """문서 제목 추출."""
+        title_tag = soup.find("h1")
+        if title_tag:
+            # headerlink (¶) 제거
+            for link in title_tag.select(".headerlink"):
+                link.decompose()
+            return str(title_tag.get_text(strip=True))
+
+        # fallback: <title> 태그
+        if soup.title:
+            title = str(soup.title.get_text(strip=True))
+            return title.split(self.TITLE_SEPARATOR)[0].strip()
+
+        return "Untitled"
+
+    def _find_content_area(self, soup: BeautifulSoup) -> Tag | None:
+        """본문 영역 찾기."""
+        for plan in self._content_plan:
+            content = plan.select_one(soup)
+            if content:
+                return content
+        return None
+
+    def _remove_noise(self, content: Tag) -> None:
+        """노이즈 요소 제거."""
+        for plan in self._noise_plan:
+            for element in plan.select(content):
+                element.decompose()
+
+    def _to_markdown(
+        self, content: Tag, code_blocks: list[dict[str, Any]] | None = None
+    ) -> str:
+        """HTML을 Markdown으로 변환.
+
+        파싱된 트리를 그대로 변환하여 HTML 문자열 직렬화/재파싱 사본을 만들지
+        않고, 빈 줄 정리도 줄 목록 없이 한 번에 처리합니다.
+        ``code_blocks``가 주어지면 변환 중 만나는 ``<pre>``마다 코드 블록
+        레코드(순번, 언어, 코드, 직전 헤딩)를 추가합니다.
+        """
+
+        def detect_code_language(element: Tag) -> str:
+            language = self._detect_code_language(element)
+            if code_blocks is not None:
+                code_blocks.append(
+                    self._code_block(element, content, language, len(code_blocks))
+                )
+            return language
+
+        converter = MarkdownConverter(
+            heading_style="ATX",
+            code_language_callback=detect_code_language,
+        )
+        markdown = converter.convert_soup(content)
+
+        # 후처리: 불필요한 빈 줄 정리
+        return _BLANK_RUN.sub(r"\1", markdown).strip()
+
+    def _detect_code_language(self, element: Tag) -> str:
+        """코드 블록의 언어 감지."""
+        # data-language 속성
+        if element.get("data-language"):
+            return str(element["data-language"])
+
+        # class 속성에서 언어 추출
+        classes = element.get("class")
+        if classes and isinstance(classes, list):
+            for cls in classes:
+                if isinstance(cls, str):
+                    if cls.startswith("language-"):
+                        return cls.replace("language-", "")
+                    if cls in ("python", "bash", "sql", "json", "yaml", "shell"):
+                        return cls
+
+        # Sphinx 기본: highlight-python 등
+        parent = element.parent
+        if parent and hasattr(parent, "get"):
+            parent_classes = parent.get("class")
+            if parent_classes and isinstance(parent_classes, list):
+                for cls in parent_classes:
+                    if isinstance(cls, str) and cls.startswith("highlight-"):
+                        return cls.replace("highlight-", "")
+
+        # 기본값
+        return "python"
+
+    def _code_block(
+        self, element: Tag, content: Tag, language: str, ordinal: int
+    ) -> dict[str, Any]:
+        """``<pre>`` 요소의 코드 블록 레코드 (직전 헤딩은 본문 영역 안에서만 찾음)."""
+        heading = None
+        for node in element.previous_elements:
+            if node is content:
+                break
+            if isinstance(node, Tag) and node.name in HEADING_TAGS:
+                heading = node
+                break
+        return {
+            "ordinal": ordinal,
+            "language": language,
+            "code": element.get_text().strip("\n"),
+            "heading": heading.get_text(strip=True) if heading else None,
+        }
+
+    def _extract_last_updated(self, soup: BeautifulSoup) -> str | None:
+        """문서 수정일 추출."""
+        # Sphinx 문서의 일반적인 수정일 위치
+        last_updated = soup.select_one(".last-updated")
+        if last_updated:
+            return str(last_updated.get_text(strip=True))
+        return None
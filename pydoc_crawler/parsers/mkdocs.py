@@ -0,0 +1,56 @@
+"""MkDocs 문서 파서."""
+
+from bs4 import Tag
+
+from pydoc_crawler.parsers.base import BaseDocParser
+
+
+class MkDocsParser(BaseDocParser):
+    """MkDocs (Material 테마 포함) 기반 문서 사이트 파서.
+
+    대상: FastAPI 등
+    """
+
+    ENGINE = "mkdocs"
+
+    # 본문 영역 CSS 선택자 (우선순위 순)
+    CONTENT_SELECTORS = [
+        "article.md-content__inner",
+        "div.md-content",
+        "div[role=main]",
+        "main",
+        "article",
+    ]
+
+    # 제거할 노이즈 요소
+    NOISE_SELECTORS = [
+        "nav",
+        ".headerlink",
+        ".md-header",
+        ".md-footer",
+        ".md-sidebar",
+        ".md-source-file",
+        ".md-content__button",  # 'Edit this page' 버튼
+        ".md-clipboard",
+        "script",
+        "style",
+    ]
+
+    # FastAPI 등: "Title - FastAPI"
+    TITLE_SEPARATOR = " - "
+
+    def _detect_code_language(self, element: Tag) -> str:
+        """코드 블록의 언어 감지 (Material: ``div.language-python > pre``)."""
+        code = element.find("code")
+        candidates = [element.parent, code if isinstance(code, Tag) else None]
+
+        for candidate in candidates:
+            if candidate is None or not hasattr(candidate, "get"):
+                continue
+            classes = candidate.get("class")
+            if classes and isinstance(classes, list):
+                for cls in classes:
+                    if isinstance(cls, str) and cls.startswith("language-"):
+                        return cls.replace("language-", "")
+
+        return super()._detect_code_language(element)
@@ -0,0 +1,98 @@
+"""문서 엔진 감지 및 파서 레지스트리."""
+
+import re
+from typing import Any
+
+from scrapy.http import Response
+
+from pydoc_crawler.parsers.base import BaseDocParser
+from pydoc_crawler.parsers.mkdocs import MkDocsParser
+from pydoc_crawler.parsers.sphinx import SphinxParser
+
+# 엔진 감지에 사용할 본문 앞부분 크기 (DOM 생성 없이 바이트 패턴만 검사)
+DETECT_BYTES = 8192
+
+# <meta name="generator" content="..."> (속성 순서 무관)
+GENERATOR_META = re.compile(rb"<meta\s[^>]*name=[\"']?generator[\"']?[^>]*>", re.I)
+CONTENT_ATTR = re.compile(rb"content=[\"']([^\"']*)[\"']", re.I)
+
+# generator 태그가 없을 때 사용할 엔진별 흔적 (우선순위 순)
+# 본문 텍스트에 나올 수 있는 엔진 이름이나 다른 사이트도 쓰는 정적 파일 경로
+# (``_static/``)는 제외하고, 엔진 이름은 generator 태그/헤더로만 판단합니다.
+ENGINE_MARKERS: list[tuple[str, re.Pattern[bytes]]] = [
+    ("mkdocs", re.compile(rb"data-md-component=|assets/javascripts/bundle\.")),
+    (
+        "sphinx",
+        re.compile(rb"documentation_options\.js|doctools\.js|class=\"sphinxsidebar"),
+    ),
+]
+
+
+def detect_engine(headers: Any, body: bytes) -> str | None:
+    """응답 헤더와 본문 앞부분으로 문서 엔진 감지. 알 수 없으면 None."""
+    generator = headers.get(b"X-Generator") if headers else None
+    candidates = [generator] if generator else []
+
+    head = body[:DETECT_BYTES]
+    meta = GENERATOR_META.search(head)
+    if meta:
+        content = CONTENT_ATTR.search(meta.group(0))
+        if content:
+            candidates.append(content.group(1))
+
+    for value in candidates:
+        lowered = value.lower()
+        if b"mkdocs" in lowered:
+            return "mkdocs"
+        if b"sphinx" in lowered:
+            return "sphinx"
+
+    for engine, marker in ENGINE_MARKERS:
+        if marker.search(head):
+            return engine
+
+    return None
+
+
+class ParserRegistry:
+    """엔진별 파서 레지스트리.
+
+    페이지마다 모든 엔진의 선택자를 시도하지 않고, 감지된 엔진의
+    파서 하나만 실행합니다. 감지에 실패하면 ``default`` 엔진을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        parsers: list[BaseDocParser] | None = None,
+        default: str = "sphinx",
+    ) -> None:
+        self.parsers: dict[str, BaseDocParser] = {}
+        for parser in parsers or [SphinxParser(), MkDocsParser()]:
+            self.register(parser)
+        self.default = default
+
+    def register(self, parser: BaseDocParser) -> None:
+        """파서 등록 (같은 엔진이면 교체)."""
+        self.parsers[parser.ENGINE] = parser
+
+    def detect(self, response: Response) -> str:
+        """응답의 문서 엔진 이름."""
+        return self.detect_bytes(response.headers, response.body)
+
+    def detect_bytes(self, headers: Any, body: bytes) -> str:
+        """헤더와 (압축 해제된) 본문 앞부분의 문서 엔진 이름."""
+        engine = detect_engine(headers, body)
+        if engine in self.parsers:
+            return engine
+        return self.default
+
+    def parser_for(self, response: Response) -> BaseDocParser:
+        """응답에 맞는 파서."""
+        return self.parsers[self.detect(response)]
+
+    def parse(self, response: Response) -> dict[str, Any]:
+        """감지된 엔진의 파서로 파싱 (결과에 ``engine`` 포함)."""
+        engine = self.detect(response)
+        result = self.parsers[engine].parse(response)
+        result["engine"] = engine
+        return result
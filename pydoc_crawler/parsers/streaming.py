@@ -0,0 +1,362 @@
+"""다운로드와 겹쳐 진행하는 증분(streaming) 파싱.
+
+``StreamingDocument``는 응답 본문 조각을 받는 즉시 압축을 풀어 lxml 증분
+HTML 파서(``HTMLPullParser``)에 넣고, 본문 영역 안에서 닫힌 블록 요소마다
+바로 Markdown으로 변환합니다. 전체 본문을 하나의 문자열로 디코딩하거나
+BeautifulSoup 트리를 한꺼번에 만들지 않으며, 변환이 끝난 블록은 트리에서
+지워 메모리에 남기지 않습니다.
+
+블록 단위 변환은 ``BaseDocParser``의 노이즈 제거/Markdown 변환을 그대로
+사용합니다. ``<section>``은 블록을 담는 컨테이너로 보고 자식 블록을 하나씩
+변환합니다. 선택자에 결합자(공백, ``>`` 등)가 있는 파서는 시작 태그만으로
+일치 여부를 판단할 수 없으므로 스트리밍하지 않습니다(``supports``).
+"""
+
+import html
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from bs4 import BeautifulSoup
+from cssselect import GenericTranslator, SelectorError
+from cssselect import parse as parse_css
+from cssselect.parser import CombinedSelector
+from lxml import etree
+from w3lib.encoding import http_content_type_encoding
+
+from pydoc_crawler.parsers.base import _BLANK_RUN, HEADING_TAGS, BaseDocParser
+from pydoc_crawler.parsers.registry import DETECT_BYTES, ParserRegistry
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택적 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택적 의존성
+    zstandard = None  # type: ignore[assignment]
+
+# 자식 블록을 하나씩 변환하는 컨테이너 태그
+CONTAINER_TAGS = frozenset({"section"})
+
+# 파서 클래스별 컴파일된 선택자 플랜 (스트리밍할 수 없으면 None)
+_plans: dict[type, tuple[list[etree.XPath], list[etree.XPath]] | None] = {}
+
+
+class StreamingUnsupportedError(Exception):
+    """이 응답은 스트리밍 파싱할 수 없음 (일반 파싱으로 처리)."""
+
+
+def _decoder(content_encoding: bytes | None) -> Callable[[bytes], bytes] | None:
+    """``Content-Encoding``별 증분 압축 해제 함수 (identity면 None)."""
+    encoding = (content_encoding or b"identity").strip().lower()
+    if encoding == b"identity":
+        return None
+    if encoding in (b"gzip", b"x-gzip"):
+        return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS).decompress
+    if encoding == b"deflate":
+        return zlib.decompressobj().decompress
+    if encoding == b"br" and brotli is not None:
+        return brotli.Decompressor().process  # type: ignore[no-any-return]
+    if encoding == b"zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj().decompress
+    raise StreamingUnsupportedError(f"지원하지 않는 Content-Encoding: {encoding!r}")
+
+
+def _stream_plan(
+    parser_cls: type[BaseDocParser],
+) -> tuple[list[etree.XPath], list[etree.XPath]] | None:
+    """파서 선택자를 시작 태그 하나에 적용할 XPath로 컴파일 (불가능하면 None)."""
+    if parser_cls not in _plans:
+        _plans[parser_cls] = _compile_plan(parser_cls)
+    return _plans[parser_cls]
+
+
+def _compile_plan(
+    parser_cls: type[BaseDocParser],
+) -> tuple[list[etree.XPath], list[etree.XPath]] | None:
+    translator = GenericTranslator()
+
+    def compile_all(selectors: list[str]) -> list[etree.XPath]:
+        plans = []
+        for css in selectors:
+            for selector in parse_css(css):
+                if isinstance(selector.parsed_tree, CombinedSelector):
+                    raise SelectorError(css)
+                xpath = translator.selector_to_xpath(selector, prefix="self::")
+                plans.append(etree.XPath(xpath))
+        return plans
+
+    try:
+        return (
+            compile_all(parser_cls.CONTENT_SELECTORS),
+            compile_all(parser_cls.NOISE_SELECTORS),
+        )
+    except SelectorError:
+        return None
+
+
+def supports(parser: BaseDocParser) -> bool:
+    """파서의 선택자가 스트리밍 파싱에 쓸 수 있는 형태인지."""
+    return _stream_plan(type(parser)) is not None
+
+
+def _text(element: Any, skip_class: str | None = None) -> str:
+    """``get_text(strip=True)``와 같은 규칙의 텍스트 (``skip_class`` 하위 제외)."""
+    parts: list[str] = []
+
+    def walk(node: Any) -> None:
+        if skip_class and skip_class in (node.get("class") or "").split():
+            return
+        if node.text:
+            parts.append(node.text.strip())
+        for child in node:
+            if isinstance(child.tag, str):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail.strip())
+
+    walk(element)
+    return "".join(parts)
+
+
+class StreamingDocument:
+    """응답 하나의 증분 파싱 상태.
+
+    ``feed``로 (압축된) 본문 조각을 도착 순서대로 넣고, 다운로드가 끝나면
+    ``finish``로 ``ParserRegistry.parse``와 같은 형태의 결과를 얻습니다.
+
+    Args:
+        registry: 엔진 감지와 파서 선택에 쓸 레지스트리
+        headers: 응답 헤더 (``Content-Encoding``, ``Content-Type``)
+    """
+
+    def __init__(self, registry: ParserRegistry, headers: Any) -> None:
+        self.registry = registry
+        self.headers = headers
+        self._decode = _decoder(headers.get(b"Content-Encoding"))
+        content_type = headers.get(b"Content-Type") or b""
+        self._encoding = http_content_type_encoding(content_type.decode("latin-1"))
+
+        self.decoded_bytes = 0
+        self._head: list[bytes] = []
+        self._head_size = 0
+        self._pull: etree.HTMLPullParser | None = None
+        self.engine: str | None = None
+        self.parser: BaseDocParser | None = None
+        self._content_plan: list[etree.XPath] = []
+        self._noise_plan: list[etree.XPath] = []
+
+        # 추출 결과
+        self.parts: list[str] = []
+        self.code_blocks: list[dict[str, Any]] = []
+        self.title: str | None = None
+        self._title_tag: str | None = None
+        self.last_updated: str | None = None
+        self._last_heading: str | None = None
+
+        # 본문 영역 상태
+        self._content: Any = None
+        self._content_open = False
+        self._content_done = False
+        self._chain: set[Any] = set()
+        self._text_done: set[Any] = set()
+        self._pending: tuple[Any, bool] | None = None
+        # 최우선 선택자가 아닌 후보 {우선순위: (요소, 직전 헤딩)}
+        self._candidates: dict[int, tuple[Any, str | None]] = {}
+
+    def feed(self, data: bytes) -> None:
+        """본문 조각 처리 (완성된 블록은 바로 Markdown으로 변환)."""
+        if self._decode is not None:
+            data = self._decode(data)
+        if not data:
+            return
+        self.decoded_bytes += len(data)
+
+        if self._pull is None:
+            self._head.append(data)
+            self._head_size += len(data)
+            if self._head_size < DETECT_BYTES:
+                return
+            self._start()
+            return
+
+        self._pull.feed(data)
+        self._process_events()
+
+    def finish(self) -> dict[str, Any]:
+        """남은 입력을 처리하고 파싱 결과 반환."""
+        if self._pull is None:
+            self._start()
+        assert self._pull is not None and self.parser is not None
+        self._pull.close()
+        self._process_events()
+        self._flush()
+
+        if self._content is None:
+            self._convert_candidate()
+
+        return {
+            "title": self._resolve_title(),
+            "content_markdown": _BLANK_RUN.sub(r"\1", "\n\n".join(self.parts)).strip(),
+            "last_updated_at": self.last_updated,
+            "code_blocks": self.code_blocks,
+            "engine": self.engine,
+        }
+
+    def _start(self) -> None:
+        """앞부분으로 엔진을 감지하고 증분 파서 시작."""
+        head = b"".join(self._head)
+        self._head = []
+        self.engine = self.registry.detect_bytes(self.headers, head)
+        self.parser = self.registry.parsers[self.engine]
+        plan = _stream_plan(type(self.parser))
+        if plan is None:
+            raise StreamingUnsupportedError(f"스트리밍할 수 없는 선택자: {self.engine}")
+        self._content_plan, self._noise_plan = plan
+
+        self._pull = etree.HTMLPullParser(
+            events=("start", "end"), encoding=self._encoding
+        )
+        self._pull.feed(head)
+        self._process_events()
+
+    def _process_events(self) -> None:
+        assert self._pull is not None
+        for event, element in self._pull.read_events():
+            # 이벤트가 하나라도 더 오면 보류 중인 블록의 tail 텍스트가 완성됨
+            self._flush()
+            if event == "start":
+                self._on_start(element)
+            else:
+                self._on_end(element)
+
+    def _on_start(self, element: Any) -> None:
+        if self._content_open:
+            parent = element.getparent()
+            if parent in self._chain:
+                self._emit_text(parent)
+                if element.tag in CONTAINER_TAGS and not self._matches(
+                    self._noise_plan, element
+                ):
+                    self._chain.add(element)
+            return
+
+        if self._content is not None or self._content_done:
+            return
+        for priority, plan in enumerate(self._content_plan):
+            if plan(element):
+                if priority == 0:
+                    self._content = element
+                    self._content_open = True
+                    self._chain.add(element)
+                    self._candidates.clear()
+                elif priority not in self._candidates:
+                    self._candidates[priority] = (element, self._last_heading)
+                return
+
+    def _on_end(self, element: Any) -> None:
+        self._record(element)
+        if self._content_open:
+            if element is self._content:
+                self._content_open = False
+                self._content_done = True
+                self._chain.clear()
+                self._text_done.clear()
+            elif element.getparent() in self._chain:
+                # 컨테이너는 자식 블록을 이미 변환했으므로 tail만 남음
+                self._pending = (element, element not in self._chain)
+            return
+
+        if not self._candidates:
+            # 본문 밖 요소는 제목 등을 기록한 뒤 바로 해제
+            element.clear()
+
+    def _record(self, element: Any) -> None:
+        """본문 밖/안에 관계없이 제목, 수정일, 직전 헤딩 기록."""
+        tag = element.tag
+        if tag == "h1" and self.title is None:
+            self.title = _text(element, skip_class="headerlink")
+        elif tag == "title" and self._title_tag is None:
+            self._title_tag = _text(element)
+        if (
+            self.last_updated is None
+            and "last-updated" in (element.get("class") or "").split()
+        ):
+            self.last_updated = _text(element)
+        if tag in HEADING_TAGS and not self._content_open:
+            self._last_heading = _text(element)
+
+    def _flush(self) -> None:
+        """보류 중인 블록(또는 컨테이너 tail)을 Markdown으로 변환 후 해제."""
+        if self._pending is None:
+            return
+        element, whole = self._pending
+        self._pending = None
+
+        if whole:
+            fragment = etree.tostring(
+                element, method="html", encoding="unicode", with_tail=True
+            )
+        else:
+            fragment = html.escape(element.tail or "")
+        if fragment.strip():
+            self._convert(fragment)
+
+        self._chain.discard(element)
+        element.clear()
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
+    def _emit_text(self, container: Any) -> None:
+        """컨테이너의 첫 자식 앞 텍스트 변환 (컨테이너당 한 번)."""
+        if container in self._text_done:
+            return
+        self._text_done.add(container)
+        if container.text and container.text.strip():
+            self._convert(html.escape(container.text))
+
+    def _convert(self, fragment_html: str, last_heading: str | None = None) -> None:
+        assert self.parser is not None
+        fragment = BeautifulSoup(fragment_html, "html.parser")
+        try:
+            self.parser._remove_noise(fragment)
+            first_block = len(self.code_blocks)
+            markdown = self.parser._to_markdown(fragment, self.code_blocks)
+
+            # 조각 앞쪽 코드 블록의 직전 헤딩은 이전 조각에 있음
+            previous = last_heading if last_heading is not None else self._last_heading
+            for block in self.code_blocks[first_block:]:
+                if block["heading"] is None:
+                    block["heading"] = previous
+            headings = fragment.find_all(HEADING_TAGS)
+            if headings:
+                self._last_heading = headings[-1].get_text(strip=True)
+        finally:
+            fragment.decompose()
+        if markdown:
+            self.parts.append(markdown)
+
+    def _convert_candidate(self) -> None:
+        """최우선 선택자가 없으면 가장 우선순위 높은 후보 전체를 변환."""
+        if not self._candidates:
+            raise ValueError("본문 영역을 찾을 수 없습니다")
+        element, last_heading = self._candidates[min(self._candidates)]
+        self._convert(
+            etree.tostring(element, method="html", encoding="unicode"),
+            last_heading=last_heading,
+        )
+
+    def _resolve_title(self) -> str:
+        if self.title is not None:
+            return self.title
+        if self._title_tag:
+            assert self.parser is not None
+            return self._title_tag.split(self.parser.TITLE_SEPARATOR)[0].strip()
+        return "Untitled"
+
+    @staticmethod
+    def _matches(plans: list[etree.XPath], element: Any) -> bool:
+        return any(plan(element) for plan in plans)
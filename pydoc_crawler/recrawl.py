@@ -0,0 +1,163 @@
+"""변경 이력 기반 재수집 스케줄러.
+
+URL별 ``content_hash`` 변경 이력으로 변경률(일 단위 포아송 모델)을 추정해
+재방문 주기와 요청 우선순위를 정합니다. 자주 바뀌는 페이지를 먼저 가져오고,
+아직 재방문 시점이 아닌 안정적인 페이지는 건너뜁니다.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydoc_crawler.storage import connect_sqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_history (
+    url TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_checked REAL NOT NULL,
+    last_changed REAL NOT NULL,
+    checks INTEGER NOT NULL DEFAULT 1,
+    changes INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+DAY = 86400.0
+
+# 정기 실행 시각의 오차 허용 비율 (주기의 90%가 지나면 재방문 대상)
+DUE_TOLERANCE = 0.1
+
+
+@dataclass
+class PageHistory:
+    """URL 한 개의 변경 이력."""
+
+    url: str
+    content_hash: str
+    first_seen: float
+    last_checked: float
+    last_changed: float
+    checks: int
+    changes: int
+
+    def change_rate(self) -> float:
+        """일 단위 추정 변경률 (변경 0회여도 0이 되지 않도록 보정)."""
+        observed_days = (self.last_checked - self.first_seen) / DAY
+        return (self.changes + 0.5) / (observed_days + 0.5)
+
+
+@dataclass
+class RecrawlDecision:
+    """재수집 판단 결과."""
+
+    due: bool
+    probability: float
+    interval: float
+
+    @property
+    def priority(self) -> int:
+        """Scrapy 요청 우선순위 (변경 확률이 높을수록 큼)."""
+        return round(self.probability * 100)
+
+
+class RecrawlPolicy:
+    """변경률로 재방문 주기와 우선순위를 계산하는 정책."""
+
+    def __init__(
+        self, min_interval: float = DAY, max_interval: float = 30 * DAY
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    def decide(self, history: PageHistory | None, now: float) -> RecrawlDecision:
+        """이력이 없는 새 URL은 항상 최우선 수집."""
+        if history is None:
+            return RecrawlDecision(due=True, probability=1.0, interval=0.0)
+
+        rate = history.change_rate()
+        interval = min(max(DAY / rate, self.min_interval), self.max_interval)
+        elapsed = now - history.last_checked
+
+        # 마지막 확인 이후 한 번 이상 바뀌었을 확률
+        probability = 1.0 - math.exp(-rate * elapsed / DAY)
+        return RecrawlDecision(
+            due=elapsed >= interval * (1 - DUE_TOLERANCE),
+            probability=probability,
+            interval=interval,
+        )
+
+
+class RecrawlHistory:
+    """URL별 변경 이력 저장소 (SQLite)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.conn = connect_sqlite(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """커밋 후 연결 닫기."""
+        self.conn.commit()
+        self.conn.close()
+
+    def commit(self) -> None:
+        """변경사항 커밋."""
+        self.conn.commit()
+
+    def get(self, url: str) -> PageHistory | None:
+        """URL 이력 조회."""
+        row = self.conn.execute(
+            "SELECT * FROM page_history WHERE url = ?", (url,)
+        ).fetchone()
+        return PageHistory(**dict(row)) if row else None
+
+    def all(self, prefix: str = "") -> list[PageHistory]:
+        """``prefix``로 시작하는 URL의 이력 (기본키 범위 조회)."""
+        rows = self.conn.execute(
+            "SELECT * FROM page_history WHERE url >= ? AND url < ?",
+            (prefix, prefix + "\U0010ffff"),
+        ).fetchall()
+        return [PageHistory(**dict(row)) for row in rows]
+
+    def record(self, url: str, content_hash: str, now: float | None = None) -> str:
+        """수집 결과 기록. ``new``, ``changed``, ``unchanged`` 중 하나를 반환."""
+        now = time.time() if now is None else now
+        previous = self.get(url)
+
+        if previous is None:
+            self.conn.execute(
+                "INSERT INTO page_history"
+                " (url, content_hash, first_seen, last_checked, last_changed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (url, content_hash, now, now, now),
+            )
+            return "new"
+
+        if previous.content_hash == content_hash:
+            self.conn.execute(
+                "UPDATE page_history SET last_checked = ?, checks = checks + 1"
+                " WHERE url = ?",
+                (now, url),
+            )
+            return "unchanged"
+
+        self.conn.execute(
+            "UPDATE page_history SET content_hash = ?, last_checked = ?,"
+            " last_changed = ?, checks = checks + 1, changes = changes + 1"
+            " WHERE url = ?",
+            (content_hash, now, now, url),
+        )
+        return "changed"
+
+    def plan(
+        self,
+        policy: RecrawlPolicy,
+        now: float | None = None,
+        prefix: str = "",
+    ) -> dict[str, RecrawlDecision]:
+        """``prefix``로 시작하는 URL의 재수집 판단 (URL -> 판단)."""
+        now = time.time() if now is None else now
+        return {
+            history.url: policy.decide(history, now) for history in self.all(prefix)
+        }
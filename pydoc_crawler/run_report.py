@@ -0,0 +1,353 @@
+"""실행별 성능 보고서와 실행 간 회귀 비교.
+
+크롤링이 끝날 때마다 ``RunReportExtension``이 Scrapy 통계와 스파이더의 페이지별
+파싱 지연으로 ``RunSummary``(처리량, 전송량, 캐시 적중률, 304 비율, 파싱 지연
+백분위수, 실행 중 프로세스 최대 RSS, source/version별 new/changed/unchanged 수)를 만들어
+실행 이력 저장소(SQLite)에 기록합니다. ``pydoc-crawler report``는 최근 실행을
+같은 스파이더/버전의 이전 실행들(중앙값)과 비교해 처리량 저하나 메모리 증가를
+표시합니다.
+"""
+
+import json
+import logging
+import math
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from scrapy import Spider, signals
+from scrapy.crawler import Crawler
+from scrapy.exceptions import NotConfigured
+from twisted.internet import task
+
+from pydoc_crawler.storage import connect_sqlite
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    spider TEXT NOT NULL,
+    version TEXT,
+    section TEXT,
+    finished REAL NOT NULL,
+    finish_reason TEXT,
+    elapsed REAL NOT NULL,
+    pages INTEGER NOT NULL,
+    items INTEGER NOT NULL,
+    pages_per_sec REAL NOT NULL,
+    bytes_fetched INTEGER NOT NULL,
+    cache_hit_rate REAL,
+    not_modified_rate REAL,
+    parse_p50_ms REAL,
+    parse_p95_ms REAL,
+    parse_p99_ms REAL,
+    peak_rss_bytes INTEGER,
+    item_changes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_target ON runs (spider, version, finished);
+"""
+
+# item_changes에 기록하는 재수집 상태
+CHANGE_STATUSES = ("new", "changed", "unchanged")
+
+
+def _percentile(values: list[float], q: float) -> float | None:
+    """정렬된 값의 백분위수 (nearest-rank)."""
+    if not values:
+        return None
+    rank = max(math.ceil(q / 100 * len(values)), 1)
+    return values[min(rank, len(values)) - 1]
+
+
+def _ratio(part: float, total: float) -> float | None:
+    return round(part / total, 4) if total else None
+
+
+def current_rss_bytes() -> int | None:
+    """현재 프로세스의 RSS (``/proc``가 없는 플랫폼이면 None).
+
+    ``ru_maxrss``는 프로세스 전체 최대치라 줄어들지 않으므로, 한 프로세스에서
+    여러 번 크롤링하면(``--all-versions``, watch 모드) 실행별 값으로 쓸 수 없습니다.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class RssSampler:
+    """실행 동안 주기적으로 프로세스 RSS를 재서 그 기간의 최대치를 보관.
+
+    RSS는 프로세스 단위라, 같은 프로세스에서 겹쳐 실행된 크롤링
+    (``--all-versions``)은 모두 공유 프로세스의 최대치를 보고합니다.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self.interval = interval
+        self.peak: int | None = None
+        self._loop: task.LoopingCall | None = None
+
+    def sample(self) -> None:
+        rss = current_rss_bytes()
+        if rss is not None:
+            self.peak = max(self.peak or 0, rss)
+
+    def start(self) -> None:
+        self._loop = task.LoopingCall(self.sample)
+        self._loop.start(self.interval, now=True)
+
+    def stop(self) -> int | None:
+        """측정 중지 후 실행 기간의 프로세스 최대 RSS 반환."""
+        if self._loop and self._loop.running:
+            self._loop.stop()
+        self.sample()
+        return self.peak
+
+
+@dataclass
+class RunSummary:
+    """크롤링 실행 하나의 성능 요약."""
+
+    spider: str
+    version: str | None
+    section: str | None
+    finished: float
+    finish_reason: str | None
+    elapsed: float
+    pages: int
+    items: int
+    pages_per_sec: float
+    bytes_fetched: int
+    cache_hit_rate: float | None = None
+    not_modified_rate: float | None = None
+    parse_p50_ms: float | None = None
+    parse_p95_ms: float | None = None
+    parse_p99_ms: float | None = None
+    # 실행 기간의 프로세스 최대 RSS (동시 실행끼리 나누지 않음)
+    peak_rss_bytes: int | None = None
+    # "source/version" -> {"new": n, "changed": n, "unchanged": n}
+    item_changes: dict[str, dict[str, int]] = field(default_factory=dict)
+    id: int | None = None
+
+    @classmethod
+    def from_stats(
+        cls,
+        stats: dict[str, Any],
+        spider: str,
+        version: str | None = None,
+        section: str | None = None,
+        parse_latencies: list[float] | None = None,
+        peak_rss: int | None = None,
+        finished: float | None = None,
+    ) -> "RunSummary":
+        """Scrapy 통계와 페이지별 파싱 지연(초)으로 요약 생성."""
+        elapsed = float(stats.get("elapsed_time_seconds") or 0.0)
+        pages = int(stats.get("downloader/response_count", 0))
+        hits = int(stats.get("httpcache/hit", 0))
+        lookups = hits + int(stats.get("httpcache/miss", 0))
+        latencies = sorted(seconds * 1000 for seconds in parse_latencies or [])
+
+        item_changes: dict[str, dict[str, int]] = {}
+        for key, value in stats.items():
+            parts = key.split("/")
+            if (
+                len(parts) == 4
+                and parts[0] == "recrawl"
+                and parts[1] in CHANGE_STATUSES
+            ):
+                counts = item_changes.setdefault(
+                    f"{parts[2]}/{parts[3]}", dict.fromkeys(CHANGE_STATUSES, 0)
+                )
+                counts[parts[1]] = int(value)
+
+        def rounded(value: float | None) -> float | None:
+            return round(value, 2) if value is not None else None
+
+        return cls(
+            spider=spider,
+            version=version,
+            section=section,
+            finished=time.time() if finished is None else finished,
+            finish_reason=stats.get("finish_reason"),
+            elapsed=round(elapsed, 3),
+            pages=pages,
+            items=int(stats.get("item_scraped_count", 0)),
+            pages_per_sec=round(pages / elapsed, 3) if elapsed else 0.0,
+            bytes_fetched=int(stats.get("downloader/response_bytes", 0)),
+            cache_hit_rate=_ratio(hits, lookups),
+            not_modified_rate=_ratio(
+                int(stats.get("downloader/response_status_count/304", 0)), pages
+            ),
+            parse_p50_ms=rounded(_percentile(latencies, 50)),
+            parse_p95_ms=rounded(_percentile(latencies, 95)),
+            parse_p99_ms=rounded(_percentile(latencies, 99)),
+            peak_rss_bytes=peak_rss,
+            item_changes=item_changes,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class Regression:
+    """기준 대비 악화된 지표."""
+
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """기준 대비 변화율."""
+        return (self.current - self.baseline) / self.baseline
+
+
+def compare_runs(
+    current: RunSummary,
+    baselines: list[RunSummary],
+    thresholds: dict[str, float] | None = None,
+) -> list[Regression]:
+    """현재 실행을 기준 실행들의 중앙값과 비교해 회귀 지표 목록 반환.
+
+    ``thresholds``는 ``RUN_REGRESSION_THRESHOLDS`` 기본값 위에 덮어씁니다.
+    """
+    from pydoc_crawler.settings import RUN_REGRESSION_THRESHOLDS
+
+    limits = {**RUN_REGRESSION_THRESHOLDS, **(thresholds or {})}
+    checks = [
+        ("pages_per_sec", -limits["throughput_drop"]),
+        ("parse_p95_ms", limits["parse_p95_rise"]),
+        ("peak_rss_bytes", limits["peak_rss_rise"]),
+    ]
+
+    regressions = []
+    for metric, limit in checks:
+        value = getattr(current, metric)
+        history = [getattr(run, metric) for run in baselines]
+        history = [v for v in history if v]
+        if not value or not history:
+            continue
+        regression = Regression(metric, statistics.median(history), value)
+        if (limit < 0 and regression.change < limit) or (
+            limit > 0 and regression.change > limit
+        ):
+            regressions.append(regression)
+    return regressions
+
+
+class RunHistory:
+    """실행 요약 이력 저장소 (SQLite)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.conn = connect_sqlite(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """커밋 후 연결 닫기."""
+        self.conn.commit()
+        self.conn.close()
+
+    def add(self, summary: RunSummary) -> int:
+        """요약 기록 후 실행 id 반환."""
+        record = summary.to_dict()
+        record.pop("id")
+        record["item_changes"] = json.dumps(record["item_changes"], sort_keys=True)
+        columns = ", ".join(record)
+        placeholders = ", ".join("?" * len(record))
+        cursor = self.conn.execute(
+            f"INSERT INTO runs ({columns}) VALUES ({placeholders})",
+            tuple(record.values()),
+        )
+        self.conn.commit()
+        summary.id = cursor.lastrowid
+        return int(summary.id or 0)
+
+    def get(self, run_id: int) -> RunSummary | None:
+        row = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return self._summary(row) if row else None
+
+    def runs(
+        self,
+        spider: str | None = None,
+        version: str | None = None,
+        before: int | None = None,
+        limit: int = 20,
+    ) -> list[RunSummary]:
+        """최근 실행부터 (``before``가 주어지면 그 id 이전 실행만)."""
+        query = "SELECT * FROM runs WHERE 1 = 1"
+        params: list[Any] = []
+        if spider:
+            query += " AND spider = ?"
+            params.append(spider)
+        if version:
+            query += " AND version = ?"
+            params.append(version)
+        if before is not None:
+            query += " AND id < ?"
+            params.append(before)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return [self._summary(row) for row in self.conn.execute(query, params)]
+
+    @staticmethod
+    def _summary(row: Any) -> RunSummary:
+        record = dict(row)
+        record["item_changes"] = json.loads(record["item_changes"])
+        return RunSummary(**record)
+
+
+class RunReportExtension:
+    """스파이더 종료 시 실행 요약을 ``RUN_HISTORY_PATH``에 기록.
+
+    파싱 지연은 스파이더의 ``parse_latencies``(페이지별 초 단위)를 사용하고,
+    new/changed/unchanged 수는 ``RecrawlHistoryPipeline``의 ``recrawl/*`` 통계에서
+    가져옵니다. 최대 RSS는 스파이더가 열린 뒤부터 ``RUN_RSS_SAMPLE_INTERVAL``초
+    간격으로 잰 프로세스 RSS의 최대치로, 같은 프로세스에서 동시에 도는 다른
+    크롤링의 메모리도 포함합니다.
+    """
+
+    def __init__(self, crawler: Crawler) -> None:
+        self.crawler = crawler
+        self.path = crawler.settings.get("RUN_HISTORY_PATH")
+        self.rss = RssSampler(crawler.settings.getfloat("RUN_RSS_SAMPLE_INTERVAL", 1.0))
+        crawler.signals.connect(self.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(self.spider_closed, signal=signals.spider_closed)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> "RunReportExtension":
+        if not crawler.settings.getbool("RUN_HISTORY_ENABLED"):
+            raise NotConfigured
+        return cls(crawler)
+
+    def spider_opened(self, spider: Spider) -> None:
+        self.rss.start()
+
+    def spider_closed(self, spider: Spider) -> None:
+        from pydoc_crawler.settings import DATA_DIR
+
+        assert self.crawler.stats is not None
+        summary = RunSummary.from_stats(
+            self.crawler.stats.get_stats(),
+            spider=spider.name,
+            version=getattr(spider, "version", None),
+            section=getattr(spider, "section", None),
+            parse_latencies=getattr(spider, "parse_latencies", None),
+            peak_rss=self.rss.stop(),
+        )
+        history = RunHistory(self.path or DATA_DIR / "runs.db")
+        try:
+            run_id = history.add(summary)
+        finally:
+            history.close()
+        logger.info(
+            f"실행 #{run_id} 기록: {summary.pages}개 페이지, "
+            f"{summary.pages_per_sec:.2f} pages/s, p95 파싱 "
+            f"{summary.parse_p95_ms or 0:.1f}ms"
+        )
@@ -0,0 +1,221 @@
+"""SQLite FTS5 전문 검색 인덱스."""
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydoc_crawler.chunking import MarkdownChunker
+from pydoc_crawler.items import ChunkItem
+from pydoc_crawler.storage import connect_sqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    version TEXT NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_source_version
+    ON documents (source, version);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, content_markdown, tokenize = 'porter unicode61'
+);
+
+CREATE TABLE IF NOT EXISTS chunks (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    document_id TEXT NOT NULL,
+    heading TEXT NOT NULL,
+    ordinal INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_document_id ON chunks (document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    heading, content_markdown, tokenize = 'porter unicode61'
+);
+"""
+
+
+@dataclass
+class SearchHit:
+    """검색 결과 한 건."""
+
+    url: str
+    title: str
+    source: str
+    version: str
+    snippet: str
+    score: float
+    heading: str | None = None
+
+
+def to_match_expression(query: str) -> str:
+    """사용자 입력을 FTS5 MATCH 식으로 변환.
+
+    각 단어를 따옴표로 감싸 ``abs(x)``처럼 FTS5 문법 문자가 포함된
+    검색어도 그대로 검색되도록 합니다 (단어 간 AND).
+    """
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class SearchIndex:
+    """문서/청크 전문 검색 인덱스.
+
+    ``content_hash``가 바뀐 문서만 FTS 테이블을 다시 씁니다.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.conn = connect_sqlite(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """커밋 후 연결 닫기."""
+        self.conn.commit()
+        self.conn.close()
+
+    def commit(self) -> None:
+        """변경사항 커밋."""
+        self.conn.commit()
+
+    def has_chunks(self, document_id: str) -> bool:
+        """문서의 청크 인덱스가 있는지 확인."""
+        row = self.conn.execute(
+            "SELECT 1 FROM chunks WHERE document_id = ? LIMIT 1", (document_id,)
+        ).fetchone()
+        return row is not None
+
+    def upsert(
+        self, item: dict[str, Any], chunker: MarkdownChunker | None = None
+    ) -> bool:
+        """문서 인덱싱. 변경이 없으면 False 반환.
+
+        최신 여부 확인과 문서 행 갱신을 ``INSERT ... ON CONFLICT`` 한 문장으로
+        처리하므로, ``content_hash``가 같은 문서는 문장 하나로 끝납니다.
+        ``chunker``가 주어졌는데 청크 인덱스가 없으면 (청크 인덱싱을 나중에 켠
+        경우) 문서가 최신이어도 청크만 인덱싱합니다.
+        """
+        row = self.conn.execute(
+            "INSERT INTO documents (id, source, version, url, title, content_hash)"
+            " VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (id) DO UPDATE SET source = excluded.source,"
+            " version = excluded.version, url = excluded.url,"
+            " title = excluded.title, content_hash = excluded.content_hash"
+            " WHERE documents.content_hash <> excluded.content_hash"
+            " RETURNING rowid",
+            (
+                item["id"],
+                item["source"],
+                item["version"],
+                item["url"],
+                item["title"],
+                item["content_hash"],
+            ),
+        ).fetchone()
+
+        if row is None:
+            if chunker is None or self.has_chunks(item["id"]):
+                return False
+            self._replace_chunks(item["id"], chunker.chunk(item))
+            return True
+
+        # 새 문서면 지울 행이 없고, 바뀐 문서면 이전 본문 삭제
+        self.conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (row[0],))
+        self.conn.execute(
+            "INSERT INTO documents_fts (rowid, title, content_markdown)"
+            " VALUES (?, ?, ?)",
+            (row[0], item["title"], item["content_markdown"]),
+        )
+
+        if chunker is not None:
+            self._replace_chunks(item["id"], chunker.chunk(item))
+
+        return True
+
+    def _replace_chunks(self, document_id: str, chunks: list[ChunkItem]) -> None:
+        """문서의 청크 인덱스 교체."""
+        old_rowids = [
+            (row["rowid"],)
+            for row in self.conn.execute(
+                "SELECT rowid FROM chunks WHERE document_id = ?", (document_id,)
+            )
+        ]
+        self.conn.executemany("DELETE FROM chunks_fts WHERE rowid = ?", old_rowids)
+        self.conn.execute("DELETE FROM chunks WHERE document_id = ?", (document_id,))
+
+        for chunk in chunks:
+            heading = " > ".join(chunk.heading_path)
+            cursor = self.conn.execute(
+                "INSERT INTO chunks (id, document_id, heading, ordinal)"
+                " VALUES (?, ?, ?, ?)",
+                (chunk.id, document_id, heading, chunk.ordinal),
+            )
+            self.conn.execute(
+                "INSERT INTO chunks_fts (rowid, heading, content_markdown)"
+                " VALUES (?, ?, ?)",
+                (cursor.lastrowid, heading, chunk.content_markdown),
+            )
+
+    def search(
+        self,
+        query: str,
+        source: str | None = None,
+        version: str | None = None,
+        limit: int = 10,
+        chunks: bool = False,
+    ) -> list[SearchHit]:
+        """BM25 순위로 검색. ``chunks=True``면 청크 단위로 검색."""
+        match = to_match_expression(query)
+        if not match:
+            return []
+
+        if chunks:
+            sql = """
+                SELECT d.url, d.title, d.source, d.version, c.heading,
+                       snippet(chunks_fts, 1, '[', ']', '…', 16) AS snippet,
+                       bm25(chunks_fts, 5.0, 1.0) AS score
+                FROM chunks_fts
+                JOIN chunks c ON c.rowid = chunks_fts.rowid
+                JOIN documents d ON d.id = c.document_id
+                WHERE chunks_fts MATCH ?
+            """
+        else:
+            sql = """
+                SELECT d.url, d.title, d.source, d.version, NULL AS heading,
+                       snippet(documents_fts, 1, '[', ']', '…', 16) AS snippet,
+                       bm25(documents_fts, 10.0, 1.0) AS score
+                FROM documents_fts
+                JOIN documents d ON d.rowid = documents_fts.rowid
+                WHERE documents_fts MATCH ?
+            """
+
+        params: list[Any] = [match]
+        if source:
+            sql += " AND d.source = ?"
+            params.append(source)
+        if version:
+            sql += " AND d.version = ?"
+            params.append(version)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        try:
+            rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"잘못된 검색어입니다: {query} ({e})") from e
+
+        return [
+            SearchHit(
+                url=row["url"],
+                title=row["title"],
+                source=row["source"],
+                version=row["version"],
+                snippet=row["snippet"],
+                score=row["score"],
+                heading=row["heading"],
+            )
+            for row in rows
+        ]
@@ -23,10 +23,149 @@ USER_AGENT = "PyDoc-Crawler/0.1 (+https://github.com/pydoc-crawler)"
 
 # 파이프라인 설정
 ITEM_PIPELINES: dict[str, int] = {
+    "pydoc_crawler.pipelines.CodeIndexPipeline": 50,
     "pydoc_crawler.pipelines.ValidationPipeline": 100,
     "pydoc_crawler.pipelines.JsonLinesPipeline": 300,
+    "pydoc_crawler.pipelines.RecrawlHistoryPipeline": 350,
+    "pydoc_crawler.pipelines.SearchIndexPipeline": 400,
 }
 
+# 배치 파이프라인 설정 (ValidationPipeline, DedupPipeline, JsonLinesPipeline,
+# MarkdownExportPipeline)
+# 아이템을 PIPELINE_BATCH_SIZE개 또는 첫 아이템 도착 후 PIPELINE_BATCH_MAX_DELAY초
+# 단위로 모아 검증/해시/직렬화/쓰기를 한 번에 처리합니다. 1이면 아이템마다 바로 처리.
+# 대기는 단계마다 따로 쌓이므로 배치가 차지 않을 때 아이템 지연은 최대
+# (배치 단계 수 × MAX_DELAY)입니다. 기본 파이프라인은 2단계라 최대 0.1초이며,
+# MAX_DELAY를 늘리면 저속 구간의 배치가 커지는 대신 증분 출력이 그만큼 늦어집니다.
+PIPELINE_BATCH_SIZE = 32
+PIPELINE_BATCH_MAX_DELAY = 0.05  # 단계별 배치 대기 상한 (초)
+
+# 재개 가능한 크롤링 설정
+# CRAWL_JOB_DIR를 지정하면 스파이더별 JOBDIR(<job_dir>/<spider>-<version>)가
+# 자동 설정되고, JSONL 출력은 체크포인트 기준으로 이어쓰기됩니다.
+CRAWL_JOB_DIR: str | None = None
+CHECKPOINT_INTERVAL = 20  # 체크포인트 저장 주기 (아이템 수)
+# JsonLinesPipeline 출력 경로 (None: data/<spider>_<version>_output.jsonl,
+# 재개 모드의 --output). %(name)s, %(version)s로 스파이더 이름/버전 치환
+JSONL_OUTPUT_PATH: str | None = None
+
+# 재수집 스케줄러 설정 (-a refresh=1)
+RECRAWL_HISTORY_PATH = str(DATA_DIR / "recrawl.db")
+RECRAWL_MIN_INTERVAL_DAYS = 1.0  # 자주 바뀌는 페이지의 최소 재방문 주기
+RECRAWL_MAX_INTERVAL_DAYS = 30.0  # 안정적인 페이지의 최대 재방문 주기
+RECRAWL_REQUEST_BUDGET = 0  # 재수집 모드 요청 상한 (0: 무제한)
+# 안정 페이지라도 index 페이지나 링크 그래프상 링크가 이 수 이상인 목차 페이지는
+# 방문해 새 페이지를 발견 (0: index 페이지만)
+RECRAWL_HUB_MIN_LINKS = 10
+
+# 링크 그래프 설정 (-a changed=<url,...>)
+# 크롤링 중 섹션 내부 링크(출발 → 대상, 앵커)를 기록해 두면, 변경 페이지가
+# 주어졌을 때 그 페이지와 이를 직접 링크하는 페이지만 다시 수집합니다.
+LINK_GRAPH_ENABLED = True
+LINK_GRAPH_PATH = str(DATA_DIR / "links.db")
+
+# 청킹 설정 (ChunkingPipeline 사용 시)
+CHUNK_MAX_TOKENS = 512
+
+# 검색 인덱스 설정 (SQLite FTS5)
+SEARCH_INDEX_PATH = str(DATA_DIR / "search.db")
+SEARCH_INDEX_CHUNKS = False  # True면 청크 단위 인덱스도 함께 갱신
+
+# 코드 블록 인덱스 설정
+CODE_INDEX_PATH = str(DATA_DIR / "code.db")
+
+# 유사 중복 탐지 설정 (DedupPipeline 사용 시, numpy 필요)
+DEDUP_MODE = "mark"  # mark: duplicate_of 필드 표시, drop: 아이템 제거
+DEDUP_THRESHOLD = 0.9  # 추정 Jaccard 유사도 임계값
+DEDUP_NUM_PERM = 128
+DEDUP_BANDS = 32
+
+# 본문 압축 설정 (JsonLinesPipeline, zstandard 필요)
+# 사전은 `pydoc-crawler compress --train`으로 기존 출력에서 학습.
+# 재개 시 기존 출력과 사전이 다르면 이어쓰지 않고 중단 (search.db/code.db는 비압축)
+BODY_COMPRESSION = False
+BODY_COMPRESSION_DICT = str(DATA_DIR / "content.zdict")  # 없으면 사전 없이 압축
+BODY_COMPRESSION_LEVEL = 9
+
+# Parquet 내보내기 설정 (ParquetExportPipeline 사용 시, pyarrow 필요)
+PARQUET_EXPORT_DIR = str(DATA_DIR / "parquet")
+PARQUET_ROW_GROUP_ROWS = 1000  # 행 그룹당 최대 행 수
+PARQUET_MAX_BUFFER_BYTES = 128 * 1024 * 1024  # 전체 버퍼 메모리 상한
+PARQUET_COMPRESSION = "zstd"
+
+# URL 정규화 설정 (dupefilter/HTTP 캐시 지문 기준)
+# 같은 문서의 URL 변형(index.html, #fragment, 쿼리, 버전 별칭)은 한 번만 수집
+URL_ALIASES: dict[str, str] = {
+    "https://docs.python.org/3/": "https://docs.python.org/3.13/",
+}
+URL_KEEP_QUERY = False  # True면 쿼리 문자열을 지문에 포함
+DOWNLOADER_MIDDLEWARES: dict[str, int | None] = {
+    "pydoc_crawler.middlewares.MemoryBudgetDownloaderMiddleware": 50,
+    "scrapy.downloadermiddlewares.redirect.RedirectMiddleware": None,
+    "pydoc_crawler.middlewares.CanonicalRedirectMiddleware": 600,
+    "pydoc_crawler.middlewares.StreamingParseMiddleware": 580,
+}
+
+# HTTP/2 다운로드 설정 (h2 필요: uv sync --extra http2)
+# 켜면 https 요청을 호스트당 연결 하나에 다중화하고, brotli/zstandard가 설치되어
+# 있으면 br/zstd 압축 응답을 협상합니다. 전송/디코딩 바이트는 transfer/* 통계로 기록.
+HTTP2_ENABLED = False
+HTTP2_CONCURRENT_STREAMS = 16  # 호스트(연결)당 동시 스트림 수
+ADDONS: dict[str, int] = {
+    "pydoc_crawler.transfer.Http2Addon": 0,
+}
+
+# 메모리 상한 설정
+# 다운로드 완료~파싱 완료 사이 응답 본문 총량이 MEMORY_INFLIGHT_BYTES를 넘으면
+# 새 다운로드를 대기시킵니다. 페이지 하나는 DOWNLOAD_MAXSIZE를 넘으면 받지 않습니다.
+DOWNLOAD_MAXSIZE = 16 * 1024 * 1024
+DOWNLOAD_WARNSIZE = 4 * 1024 * 1024
+MEMORY_INFLIGHT_BYTES = 64 * 1024 * 1024  # 0: 무제한
+MEMORY_TRACE_PAGES = False  # True면 tracemalloc으로 페이지별 파싱 최대 메모리 기록
+MEMORY_REPORT_TOP = 20  # 보고서에 남길 가장 무거운 페이지 수
+SPIDER_MIDDLEWARES: dict[str, int | None] = {
+    "pydoc_crawler.middlewares.MemoryBudgetSpiderMiddleware": 10,
+}
+
+# 스트리밍 파싱 설정
+# 켜면 본문 조각이 도착하는 대로 증분 HTML 파서에 넣어 본문 블록을 바로 Markdown으로
+# 변환하므로, 큰 페이지의 파싱이 다운로드 시간과 겹칩니다. 결합자가 있는 본문/노이즈
+# 선택자를 쓰는 엔진과 HTTP 캐시 응답은 일반 파싱으로 처리됩니다 (streaming/* 통계).
+STREAMING_PARSE = False
+STREAMING_PARSE_MIN_BYTES = 64 * 1024  # Content-Length가 이보다 작으면 일반 파싱
+
+# 실행 성능 보고서 설정 (`pydoc-crawler report`)
+# 크롤링이 끝날 때마다 처리량, 전송 바이트, 캐시 적중률, 304 비율, 파싱 지연 백분위수,
+# 실행 중 프로세스 최대 RSS, source/version별 new/changed/unchanged 수를 실행 이력에
+# 기록합니다. RSS는 프로세스 단위라 --all-versions처럼 한 프로세스에서 겹쳐 도는
+# 실행은 같은 최대치를 공유합니다 (실행별 메모리 비교는 버전별로 따로 실행).
+RUN_HISTORY_ENABLED = True
+RUN_HISTORY_PATH = str(DATA_DIR / "runs.db")
+RUN_RSS_SAMPLE_INTERVAL = 1.0  # 프로세스 최대 RSS 측정 간격 (초)
+RUN_REGRESSION_THRESHOLDS: dict[str, float] = {
+    "throughput_drop": 0.2,  # pages/sec 감소율
+    "parse_p95_rise": 0.25,  # 파싱 p95 지연 증가율
+    "peak_rss_rise": 0.2,  # 프로세스 최대 RSS 증가율
+}
+EXTENSIONS: dict[str, int | None] = {
+    "pydoc_crawler.run_report.RunReportExtension": 500,
+    "pydoc_crawler.transfer.TransferStatsExtension": 500,
+}
+
+# 감시(watch) 모드 설정 (`pydoc-crawler watch`)
+# 상주 프로세스가 버전별 주기로 재수집하며, WARM_STATE가 켜지면 인덱스 DB 연결과
+# 중복 탐지 상태를 실행 간에 유지합니다 (watch 명령이 자동으로 켬).
+WARM_STATE = False
+WATCH_TARGETS: list[dict[str, Any]] = [
+    {"spider": "python", "version": "3.13", "interval_hours": 6},
+    {"spider": "python", "version": "3.12", "interval_hours": 24},
+    {"spider": "python", "version": "3.11", "interval_hours": 72},
+    {"spider": "python", "version": "3.10", "interval_hours": 72},
+]
+WATCH_SPIDER = "python"  # spider를 생략한 대상과 --version으로 추가한 대상의 스파이더
+WATCH_STATUS_PORT = 6081  # 상태 엔드포인트 (127.0.0.1)
+WATCH_TICK_SECONDS = 30
+
 # 피드 내보내기 설정
 FEEDS: dict[str, dict[str, Any]] = {
     str(DATA_DIR / "%(name)s_%(time)s.jsonl"): {
@@ -42,6 +181,7 @@ LOG_FORMAT = "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
 
 # 요청 설정
 REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
+REQUEST_FINGERPRINTER_CLASS = "pydoc_crawler.urls.CanonicalRequestFingerprinter"
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
 
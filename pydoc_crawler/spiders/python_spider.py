@@ -1,14 +1,27 @@
 """Python 공식 문서 스파이더."""
 
-from collections.abc import Iterator
+import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import nullcontext
+from pathlib import Path
 from typing import Any
+from urllib.parse import urljoin
 
-from scrapy.http import Response
+from scrapy.crawler import Crawler
+from scrapy.http import Request, Response
 from scrapy.linkextractors import LinkExtractor
 from scrapy.spiders import CrawlSpider, Rule
 
+from pydoc_crawler import warm
+from pydoc_crawler.checkpoint import CrawlCheckpoint
 from pydoc_crawler.items import DocumentItem
-from pydoc_crawler.parsers.sphinx import SphinxParser
+from pydoc_crawler.link_graph import LinkGraph
+from pydoc_crawler.memory import PeakMemoryTracker
+from pydoc_crawler.middlewares import STREAM_META_KEY
+from pydoc_crawler.parsers.registry import ParserRegistry
+from pydoc_crawler.recrawl import DAY, RecrawlDecision, RecrawlHistory, RecrawlPolicy
+from pydoc_crawler.urls import UrlCanonicalizer
 
 
 class PythonDocsSpider(CrawlSpider):  # type: ignore[misc]
@@ -33,6 +46,8 @@ class PythonDocsSpider(CrawlSpider):  # type: ignore[misc]
         self,
         version: str = "3.13",
         section: str = "tutorial",
+        refresh: bool | str = False,
+        changed: str | list[str] | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -41,10 +56,38 @@ class PythonDocsSpider(CrawlSpider):  # type: ignore[misc]
         Args:
             version: Python 문서 버전 (기본값: 3.13)
             section: 수집할 섹션 (기본값: tutorial)
+            refresh: 변경 이력 기반 재수집 모드 (``-a refresh=1``)
+            changed: 변경된 페이지 (쉼표 구분 URL 또는 섹션 기준 상대 경로).
+                주어지면 이 페이지와 이를 직접 링크하는 페이지만 수집
         """
         self.version = version
         self.section = section
-        self.parser = SphinxParser()
+        self.parsers = ParserRegistry()
+
+        # 재수집 모드 상태 (from_crawler에서 이력 로드)
+        self.refresh = str(refresh).lower() in ("1", "true", "yes")
+        self.recrawl_plan: dict[str, RecrawlDecision] = {}
+        self.request_budget = 0
+        self.hub_min_links = 0
+        self.scheduled_urls: set[str] = set()
+
+        # 링크 그래프 (LINK_GRAPH_ENABLED) 및 변경 페이지 대상 수집 상태
+        if isinstance(changed, str):
+            changed = [url for url in changed.split(",") if url.strip()]
+        self.changed_urls = [
+            urljoin(self.url_prefix, url.strip()) for url in changed or []
+        ]
+        self.target_urls: set[str] = set()
+        self.link_graph: LinkGraph | None = None
+        # 링크 그래프 URL 정규화 (from_crawler에서 URL_ALIASES 등 설정 반영)
+        self.canonicalize = UrlCanonicalizer()
+        self.linked_sources: set[str] = set()
+
+        # 페이지별 파싱 최대 메모리 측정 (MEMORY_TRACE_PAGES)
+        self.memory_tracker: PeakMemoryTracker | None = None
+
+        # 페이지별 파싱/변환 시간 (초, RunReportExtension이 백분위수로 기록)
+        self.parse_latencies: list[float] = []
 
         # 시작 URL 설정
         self.start_urls = [f"https://docs.python.org/{version}/{section}/index.html"]
@@ -63,6 +106,7 @@ class PythonDocsSpider(CrawlSpider):  # type: ignore[misc]
                 ),
                 callback="parse_document",
                 follow=True,
+                process_request="schedule_request",
             ),
         )
 
@@ -74,14 +118,251 @@ class PythonDocsSpider(CrawlSpider):  # type: ignore[misc]
 
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def from_crawler(
+        cls, crawler: Crawler, *args: Any, **kwargs: Any
+    ) -> "PythonDocsSpider":
+        """재개 모드면 버전별 JOBDIR 설정 (<CRAWL_JOB_DIR>/<spider>-<version>)."""
+        spider: PythonDocsSpider = super().from_crawler(crawler, *args, **kwargs)
+
+        job_dir = crawler.settings.get("CRAWL_JOB_DIR")
+        if job_dir and not crawler.settings.get("JOBDIR"):
+            checkpoint = CrawlCheckpoint.for_job_dir(job_dir)
+            jobdir = checkpoint.jobdir_for(spider.name, spider.version)
+            crawler.settings.set("JOBDIR", str(jobdir), priority="spider")
+
+        spider.canonicalize = UrlCanonicalizer.from_settings(crawler.settings)
+        if crawler.settings.getbool("LINK_GRAPH_ENABLED") or spider.changed_urls:
+            spider.link_graph = warm.open_store(
+                LinkGraph,
+                crawler.settings.get("LINK_GRAPH_PATH"),
+                crawler.settings.getbool("WARM_STATE"),
+            )
+
+        if spider.changed_urls:
+            spider.load_targets()
+        elif spider.refresh:
+            spider.load_recrawl_plan()
+
+        if crawler.settings.getbool("MEMORY_TRACE_PAGES"):
+            spider.memory_tracker = PeakMemoryTracker(
+                top=crawler.settings.getint("MEMORY_REPORT_TOP", 20)
+            )
+
+        return spider
+
+    @property
+    def url_prefix(self) -> str:
+        """수집 범위 (버전/섹션) URL 접두사."""
+        return f"https://docs.python.org/{self.version}/{self.section}/"
+
+    @property
+    def full_crawl(self) -> bool:
+        """범위 안의 모든 페이지를 방문하는 크롤링인지.
+
+        재수집/대상 수집 모드나 재개(JOBDIR) 실행은 일부 페이지만 방문합니다.
+        """
+        return (
+            not self.refresh
+            and not self.changed_urls
+            and not self.crawler.settings.get("JOBDIR")
+        )
+
+    def closed(self, reason: str) -> None:
+        """링크 그래프 반납 및 페이지별 파싱 최대 메모리 보고서 저장."""
+        if self.link_graph is not None:
+            warm.release_store(
+                self.link_graph, self.crawler.settings.getbool("WARM_STATE")
+            )
+
+        if self.memory_tracker is None:
+            return
+        from pydoc_crawler.settings import DATA_DIR
+
+        self.memory_tracker.stop()
+        report = self.memory_tracker.report()
+        self.crawler.stats.set_value(
+            "memory/parse_peak_bytes", report["max_peak_bytes"]
+        )
+
+        Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
+        filepath = DATA_DIR / f"{self.name}_memory_report.json"
+        filepath.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        self.logger.info(
+            f"페이지 파싱 최대 메모리 {report['max_peak_bytes'] / 1024 / 1024:.1f}MB "
+            f"({report['pages']}개 페이지): {filepath}"
+        )
+
+    def load_recrawl_plan(self) -> None:
+        """변경 이력에서 이 섹션 URL들의 재수집 판단 로드."""
+        settings = self.crawler.settings
+        policy = RecrawlPolicy(
+            min_interval=settings.getfloat("RECRAWL_MIN_INTERVAL_DAYS", 1) * DAY,
+            max_interval=settings.getfloat("RECRAWL_MAX_INTERVAL_DAYS", 30) * DAY,
+        )
+        shared = settings.getbool("WARM_STATE")
+        history = warm.open_store(
+            RecrawlHistory, settings.get("RECRAWL_HISTORY_PATH"), shared
+        )
+        try:
+            self.recrawl_plan = history.plan(policy, prefix=self.url_prefix)
+        finally:
+            warm.release_store(history, shared)
+
+        self.request_budget = settings.getint("RECRAWL_REQUEST_BUDGET", 0)
+        self.hub_min_links = settings.getint("RECRAWL_HUB_MIN_LINKS", 0)
+        due = sum(decision.due for decision in self.recrawl_plan.values())
+        self.logger.info(
+            f"재수집 계획: 알려진 URL {len(self.recrawl_plan)}개 중 {due}개 대상, "
+            f"요청 예산 {self.request_budget or '무제한'}"
+        )
+
+    def load_targets(self) -> None:
+        """변경 페이지와 이를 직접 링크하는 페이지를 수집 대상으로 지정.
+
+        링크 그래프와 같이 대상 URL도 정규화된 형태로 보관합니다.
+        """
+        assert self.link_graph is not None
+        changed = [self.canonicalize(url) for url in self.changed_urls]
+        dependents = self.link_graph.dependents(changed)
+        self.target_urls = {*changed, *dependents}
+        self.logger.info(
+            f"대상 수집: 변경 페이지 {len(self.changed_urls)}개, "
+            f"이를 링크하는 페이지 {len(dependents)}개"
+        )
+
+    async def start(self) -> AsyncIterator[Any]:
+        """시작 URL 이후, 재수집 모드면 변경 가능성이 높은 URL부터 요청.
+
+        변경 페이지가 주어지면 시작 URL 대신 대상 페이지만 요청합니다.
+        """
+        if self.target_urls:
+            for url in sorted(self.target_urls):
+                self.scheduled_urls.add(url)
+                yield Request(url)
+            return
+
+        async for request in super().start():
+            if self.refresh and isinstance(request, Request):
+                self.scheduled_urls.add(request.url)
+            yield request
+
+        if not self.refresh:
+            return
+
+        due = sorted(
+            (item for item in self.recrawl_plan.items() if item[1].due),
+            key=lambda item: item[1].probability,
+            reverse=True,
+        )
+        for url, _ in due:
+            request = self.schedule_request(Request(url), None)
+            if request is None:
+                break
+            yield request
+
+    def schedule_request(
+        self, request: Request, response: Response | None
+    ) -> Request | None:
+        """링크 기록 후, 재수집 모드에서 요청 우선순위 지정 및 제외.
+
+        대상 수집 모드에서는 대상이 아닌 페이지로의 링크를 따라가지 않고, 재수집
+        모드에서는 안정 페이지(목차 페이지 제외)/예산 초과 요청을 제외합니다.
+        """
+        if response is not None:
+            self.record_link(response.url, request)
+
+        if self.target_urls:
+            if self.canonicalize(request.url) not in self.target_urls:
+                self.crawler.stats.inc_value("linkgraph/skipped")
+            return None
+
+        if not self.refresh or request.url in self.scheduled_urls:
+            return request
+
+        decision = self.recrawl_plan.get(request.url)
+        if decision is not None and not decision.due:
+            # 목차 페이지는 안정적이어도 방문해야 새 페이지로 가는 링크를 발견
+            if not self.is_hub(request.url):
+                self.crawler.stats.inc_value("recrawl/skipped_stable")
+                return None
+            self.crawler.stats.inc_value("recrawl/hub")
+
+        if self.request_budget and len(self.scheduled_urls) >= self.request_budget:
+            self.crawler.stats.inc_value("recrawl/skipped_budget")
+            return None
+
+        self.scheduled_urls.add(request.url)
+        priority = decision.priority if decision else 100
+        return request.replace(priority=priority)
+
+    def is_hub(self, url: str) -> bool:
+        """섹션/디렉토리 index 또는 링크 그래프상 링크가 많은 목차 페이지인지."""
+        if url.endswith(("/", "/index.html")):
+            return True
+        return bool(
+            self.hub_min_links
+            and self.link_graph is not None
+            and self.link_graph.out_degree(self.canonicalize(url)) >= self.hub_min_links
+        )
+
+    def _requests_to_follow(self, response: Response) -> Iterator[Any]:
+        """규칙이 만든 요청을 모두 만든 뒤(링크 기록) 응답 단위로 커밋하고 반환.
+
+        생성기를 그대로 넘기면 엔진이 리액터 턴을 넘겨 가며 소비하는 동안 쓰기
+        트랜잭션이 열려 있어, 같은 DB를 쓰는 다른 크롤러가 잠금 대기에 걸립니다.
+        """
+        requests = list(super()._requests_to_follow(response))
+        if self.link_graph is not None:
+            self.link_graph.commit()
+        yield from requests
+
+    def record_link(self, source: str, request: Request) -> None:
+        """``LinkExtractor`` 규칙이 찾은 링크를 링크 그래프에 기록.
+
+        ValidationPipeline이 문서를 정규화된 URL로 식별하므로, 양 끝 URL을
+        정규화해 같은 문서의 URL 변형(``index.html``, 쿼리 등)을 한 노드로 모읍니다.
+        """
+        if self.link_graph is None:
+            return
+        source = self.canonicalize(source)
+        # 이번 실행에서 처음 보는 출발 페이지면 이전 실행의 링크를 교체
+        if source not in self.linked_sources:
+            self.linked_sources.add(source)
+            self.link_graph.clear_links(source)
+        self.link_graph.add(
+            source, self.canonicalize(request.url), request.meta.get("link_text")
+        )
+        self.crawler.stats.inc_value("linkgraph/links")
+
     def parse_start_url(self, response: Response) -> Iterator[DocumentItem]:
         """시작 URL (index.html) 파싱."""
         return self.parse_document(response)
 
+    def _parse_content(self, response: Response) -> dict[str, Any]:
+        """다운로드 중 증분 파싱한 결과가 있으면 마무리, 없으면 일반 파싱."""
+        stream = response.meta.pop(STREAM_META_KEY, None)
+        if stream is not None:
+            try:
+                result: dict[str, Any] = stream.finish()
+            except Exception as e:
+                self.crawler.stats.inc_value("streaming/fallback")
+                self.logger.debug(f"증분 파싱 실패, 일반 파싱: {response.url} - {e}")
+            else:
+                self.crawler.stats.inc_value("streaming/pages")
+                return result
+        return self.parsers.parse(response)
+
     def parse_document(self, response: Response) -> Iterator[DocumentItem]:
         """문서 페이지 파싱."""
         try:
-            result = self.parser.parse(response)
+            tracker = self.memory_tracker
+            started = time.perf_counter()
+            with tracker.measure(response.url) if tracker else nullcontext():
+                result = self._parse_content(response)
+            self.parse_latencies.append(time.perf_counter() - started)
 
             yield DocumentItem(
                 source="python",
@@ -90,6 +371,7 @@ class PythonDocsSpider(CrawlSpider):  # type: ignore[misc]
                 title=result["title"],
                 content_markdown=result["content_markdown"],
                 last_updated_at=result.get("last_updated_at"),
+                code_blocks=result.get("code_blocks", []),
             )
 
         except Exception as e:
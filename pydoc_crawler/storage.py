@@ -0,0 +1,19 @@
+"""SQLite 저장소 공통 유틸리티."""
+
+import sqlite3
+from pathlib import Path
+
+
+def connect_sqlite(path: str | Path) -> sqlite3.Connection:
+    """크롤러용 SQLite 연결 생성.
+
+    WAL 모드로 열어 크롤링 중 쓰기와 CLI 조회가 서로 막히지 않게 합니다.
+    """
+    if str(path) != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
@@ -0,0 +1,157 @@
+"""HTTP/2 다운로드 경로와 전송량 통계.
+
+``HTTP2_ENABLED``를 켜면 ``Http2Addon``이 https 다운로드 핸들러를 Scrapy의
+HTTP/2 핸들러로 바꿉니다. HTTP/2 핸들러는 호스트마다 연결 하나를 풀에 두고
+요청을 스트림으로 다중화하므로, 도메인당 동시 요청 수를
+``HTTP2_CONCURRENT_STREAMS``까지 올려도 연결이 늘어나지 않습니다.
+
+``TransferStatsExtension``은 압축 해제 전(전송) 바이트와 해제 후(디코딩)
+바이트, 인코딩별 응답 수, 프로토콜별 응답 수, 호스트(= HTTP/2 연결)별 동시
+스트림 수를 통계로 남깁니다. brotli/zstd 응답은 ``brotli``/``zstandard``가
+설치되어 있으면 Scrapy가 ``Accept-Encoding``으로 협상하고 해제합니다.
+"""
+
+from collections import defaultdict
+from typing import Any
+
+from scrapy import signals
+from scrapy.crawler import Crawler
+from scrapy.http import Request, Response
+from scrapy.settings import BaseSettings
+from scrapy.utils.httpobj import urlparse_cached
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - 선택적 의존성
+    h2 = None  # type: ignore[assignment]
+
+H2_HANDLER = "scrapy.core.downloader.handlers.http2.H2DownloadHandler"
+
+
+def _require_h2() -> None:
+    if h2 is None:
+        raise ImportError("HTTP/2 다운로드에는 h2가 필요합니다: uv sync --extra http2")
+
+
+class Http2Addon:
+    """``HTTP2_ENABLED``면 https 요청을 HTTP/2로 다운로드하도록 설정.
+
+    애드온은 스파이더 ``custom_settings`` 적용 후에 실행되므로, 도메인당 동시
+    요청 수는 ``spider`` 우선순위로 덮어씁니다.
+    """
+
+    def update_settings(self, settings: BaseSettings) -> None:
+        if not settings.getbool("HTTP2_ENABLED"):
+            return
+        _require_h2()
+
+        handlers = settings.getdict("DOWNLOAD_HANDLERS")
+        handlers.setdefault("https", H2_HANDLER)
+        settings.set("DOWNLOAD_HANDLERS", handlers, priority="addon")
+
+        streams = settings.getint("HTTP2_CONCURRENT_STREAMS", 16)
+        settings.set("CONCURRENT_REQUESTS_PER_DOMAIN", streams, priority="spider")
+        if settings.getint("CONCURRENT_REQUESTS") < streams:
+            settings.set("CONCURRENT_REQUESTS", streams, priority="spider")
+
+
+class TransferStats:
+    """응답 전송량과 호스트별 동시 요청(스트림) 집계."""
+
+    def __init__(self) -> None:
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.encodings: dict[str, int] = defaultdict(int)
+        self.protocols: dict[str, int] = defaultdict(int)
+        self.streams_peak: dict[str, int] = defaultdict(int)
+        self.streams_total: dict[str, int] = defaultdict(int)
+        self.requests: dict[str, int] = defaultdict(int)
+
+    def transferred(self, host: str, streams: int) -> None:
+        """응답 도착 시점에 같은 호스트에서 전송 중이던 요청 수 기록."""
+        self.requests[host] += 1
+        self.streams_total[host] += streams
+        self.streams_peak[host] = max(self.streams_peak[host], streams)
+
+    def received(self, response: Response) -> None:
+        """압축 해제 전 응답."""
+        encoding = response.headers.get(b"Content-Encoding") or b"identity"
+        self.wire_bytes += len(response.body)
+        self.encodings[encoding.decode("latin-1").lower()] += 1
+        self.protocols[response.protocol or "unknown"] += 1
+
+    def decoded(self, response: Response) -> None:
+        """압축 해제 후 응답."""
+        self.decoded_bytes += len(response.body)
+
+    def summary(self) -> dict[str, Any]:
+        """통계 키/값."""
+        stats: dict[str, Any] = {
+            "transfer/wire_bytes": self.wire_bytes,
+            "transfer/decoded_bytes": self.decoded_bytes,
+        }
+        if self.wire_bytes:
+            stats["transfer/compression_ratio"] = round(
+                self.decoded_bytes / self.wire_bytes, 2
+            )
+        for encoding, count in self.encodings.items():
+            stats[f"transfer/encoding/{encoding}"] = count
+        for protocol, count in self.protocols.items():
+            stats[f"transfer/protocol/{protocol}"] = count
+        for host, requests in self.requests.items():
+            stats[f"transfer/connection/{host}/requests"] = requests
+            stats[f"transfer/connection/{host}/streams_peak"] = self.streams_peak[host]
+            stats[f"transfer/connection/{host}/streams_mean"] = round(
+                self.streams_total[host] / requests, 2
+            )
+        return stats
+
+
+class TransferStatsExtension:
+    """전송/디코딩 바이트와 연결별 스트림 활용도 통계.
+
+    압축된 본문 크기와 동시 스트림 수는 다운로드 핸들러가 응답을 돌려준
+    직후의 ``response_downloaded`` 시그널에서 셉니다. 이때 요청은 아직
+    다운로더 슬롯의 전송 중 목록에 있으므로, 슬롯 대기열의 요청은 빼고 실제로
+    전송 중인 요청만 동시 스트림으로 셉니다. 리다이렉트처럼 미들웨어가
+    응답을 가로채도 셈이 어긋나지 않습니다. 디코딩된 크기는 모든 미들웨어를
+    거친 뒤의 ``response_received`` 시그널에서 세며, HTTP 캐시에서 나온
+    응답은 다운로더를 거치지 않으므로 제외됩니다.
+    """
+
+    def __init__(self, crawler: Crawler) -> None:
+        self.crawler = crawler
+        self.stats = TransferStats()
+        crawler.signals.connect(
+            self.response_downloaded, signal=signals.response_downloaded
+        )
+        crawler.signals.connect(
+            self.response_received, signal=signals.response_received
+        )
+        crawler.signals.connect(self.spider_closed, signal=signals.spider_closed)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> "TransferStatsExtension":
+        return cls(crawler)
+
+    def _transferring(self, request: Request) -> int:
+        """요청의 다운로더 슬롯에서 전송 중인 요청 수."""
+        assert self.crawler.engine is not None
+        slots = self.crawler.engine.downloader.slots
+        slot = slots.get(request.meta.get("download_slot", ""))
+        return len(slot.transferring) if slot else 1
+
+    def response_downloaded(self, response: Response, request: Request) -> None:
+        self.stats.transferred(
+            urlparse_cached(request).netloc, self._transferring(request)
+        )
+        self.stats.received(response)
+
+    def response_received(self, response: Response) -> None:
+        if "cached" not in response.flags:
+            self.stats.decoded(response)
+
+    def spider_closed(self) -> None:
+        assert self.crawler.stats is not None
+        for key, value in self.stats.summary().items():
+            self.crawler.stats.set_value(key, value)
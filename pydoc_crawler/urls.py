@@ -0,0 +1,113 @@
+"""URL 정규화 및 정규화 기반 요청 지문(fingerprint)."""
+
+import re
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
+from weakref import WeakKeyDictionary
+
+from scrapy.http import Request
+from scrapy.settings import BaseSettings
+from scrapy.utils.request import fingerprint
+from w3lib.url import canonicalize_url as w3lib_canonicalize_url
+
+if TYPE_CHECKING:
+    from scrapy.crawler import Crawler
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+INDEX_FILES = ("index.html", "index.htm")
+DUPLICATE_SLASHES = re.compile(r"/{2,}")
+
+
+def canonicalize_url(
+    url: str,
+    aliases: dict[str, str] | None = None,
+    keep_query: bool = False,
+) -> str:
+    """같은 문서를 가리키는 URL 변형을 하나의 형태로 정규화.
+
+    - 스킴/호스트 소문자, 기본 포트 제거, 퍼센트 인코딩 정규화
+    - ``#fragment`` 제거, 쿼리 문자열 제거 (``keep_query``면 정렬 후 유지)
+    - ``.../index.html`` → ``.../``
+    - ``aliases`` 접두사 치환 (예: ``/3/`` → ``/3.13/``)
+    """
+    parts = urlsplit(w3lib_canonicalize_url(url, keep_fragments=False))
+    scheme = parts.scheme.lower()
+
+    netloc = parts.netloc.lower()
+    host, _, port = netloc.rpartition(":")
+    if host and DEFAULT_PORTS.get(scheme) == port:
+        netloc = host
+
+    path = DUPLICATE_SLASHES.sub("/", parts.path) or "/"
+    directory, _, filename = path.rpartition("/")
+    if filename in INDEX_FILES:
+        path = f"{directory}/"
+
+    query = parts.query if keep_query else ""
+    canonical = urlunsplit((scheme, netloc, path, query, ""))
+
+    for alias, target in (aliases or {}).items():
+        if canonical.startswith(alias):
+            return target + canonical[len(alias) :]
+    return canonical
+
+
+class UrlCanonicalizer:
+    """설정(별칭, 쿼리 유지 여부)을 묶어 둔 URL 정규화 함수."""
+
+    def __init__(
+        self, aliases: dict[str, str] | None = None, keep_query: bool = False
+    ) -> None:
+        # 별칭 자체도 정규화해서 비교 (긴 접두사 우선)
+        normalized = {
+            canonicalize_url(alias, keep_query=keep_query): canonicalize_url(
+                target, keep_query=keep_query
+            )
+            for alias, target in (aliases or {}).items()
+        }
+        self.aliases = dict(
+            sorted(normalized.items(), key=lambda item: len(item[0]), reverse=True)
+        )
+        self.keep_query = keep_query
+
+    @classmethod
+    def from_settings(cls, settings: BaseSettings) -> "UrlCanonicalizer":
+        """Scrapy 설정(URL_ALIASES, URL_KEEP_QUERY)에서 생성."""
+        return cls(
+            aliases=settings.getdict("URL_ALIASES"),
+            keep_query=settings.getbool("URL_KEEP_QUERY"),
+        )
+
+    def __call__(self, url: str) -> str:
+        return canonicalize_url(url, self.aliases, self.keep_query)
+
+
+class CanonicalRequestFingerprinter:
+    """정규화된 URL 기준 요청 지문 (``REQUEST_FINGERPRINTER_CLASS``).
+
+    dupefilter와 HTTP 캐시가 이 지문을 사용하므로, 같은 문서의 URL 변형과
+    리다이렉트 대상은 스케줄링 단계에서 걸러져 한 번만 다운로드/파싱됩니다.
+    URL이 이미 정규형이면 Scrapy 기본 지문과 같은 값을 반환합니다.
+    """
+
+    def __init__(self, crawler: "Crawler | None" = None) -> None:
+        if crawler is not None:
+            self.canonicalize = UrlCanonicalizer.from_settings(crawler.settings)
+        else:
+            self.canonicalize = UrlCanonicalizer()
+        self._cache: WeakKeyDictionary[Request, bytes] = WeakKeyDictionary()
+
+    @classmethod
+    def from_crawler(cls, crawler: "Crawler") -> "CanonicalRequestFingerprinter":
+        return cls(crawler)
+
+    def fingerprint(self, request: Request) -> bytes:
+        """요청 지문 (정규화된 URL, 메서드, 본문 기준)."""
+        if request not in self._cache:
+            canonical = self.canonicalize(request.url)
+            if canonical != request.url:
+                request_for_fp = request.replace(url=canonical)
+            else:
+                request_for_fp = request
+            self._cache[request] = fingerprint(request_for_fp)
+        return self._cache[request]
@@ -0,0 +1,59 @@
+"""데몬 모드에서 크롤링 실행 사이에 유지되는 프로세스 내 상태.
+
+``WARM_STATE`` 설정이 켜져 있으면 파이프라인/스파이더는 ``shared=True``로
+SQLite 저장소를 열어, 닫지 않고 커밋만 한 뒤 다음 실행에서 그대로 재사용하고,
+중복 탐지 인덱스 같은 메모리 상태도 실행 간에 이어서 사용합니다. 설정이 꺼져
+있으면 (일반 CLI 실행) 기존처럼 실행마다 열고 닫습니다.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Protocol
+
+
+class Store(Protocol):
+    """commit/close를 제공하는 저장소 (SearchIndex, RecrawlHistory 등)."""
+
+    def commit(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+_stores: dict[tuple[str, str], Any] = {}
+_states: dict[str, Any] = {}
+
+
+def open_store(
+    factory: Callable[[str | Path], Any], path: str | Path, shared: bool = False
+) -> Any:
+    """저장소 열기 (``shared``면 이미 열린 연결 재사용)."""
+    if not shared:
+        return factory(path)
+
+    key = (getattr(factory, "__qualname__", repr(factory)), str(Path(path).resolve()))
+    if key not in _stores:
+        _stores[key] = factory(path)
+    return _stores[key]
+
+
+def release_store(store: Store, shared: bool = False) -> None:
+    """저장소 반납 (``shared``면 커밋만, 아니면 닫기)."""
+    if shared:
+        store.commit()
+    else:
+        store.close()
+
+
+def get_state(key: str, factory: Callable[[], Any]) -> Any:
+    """실행 간 공유되는 메모리 상태 (없으면 생성)."""
+    if key not in _states:
+        _states[key] = factory()
+    return _states[key]
+
+
+def clear() -> None:
+    """열린 저장소를 모두 닫고 상태 초기화 (데몬 종료 시)."""
+    for store in _stores.values():
+        store.close()
+    _stores.clear()
+    _states.clear()
@@ -3,20 +3,23 @@
 from __future__ import annotations
 
 import json
-import subprocess
-import tempfile
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from pydoc_crawler.jsonl_index import JsonlReader
+
 
 @dataclass
 class CrawlResults:
     """크롤링 결과 컨테이너."""
 
     items: list[dict[str, Any]] = field(default_factory=list)
+    path: Path | None = None
 
     @property
     def urls(self) -> set[str]:
@@ -27,69 +30,111 @@ class CrawlResults:
         return len(self.items)
 
     def get_by_url(self, url: str) -> dict[str, Any] | None:
-        for item in self.items:
-            if item.get("url") == url:
-                return item
-        return None
+        """출력 파일의 사이드카 인덱스로 해당 문서만 읽기."""
+        if self.path is None:
+            for item in self.items:
+                if item.get("url") == url:
+                    return item
+            return None
+        with JsonlReader(self.path) as reader:
+            return reader.get_by_url(url)
+
+
+# 녹화된 응답 아카이브 (E2E_RECORD=1로 실행하면 실제 사이트에서 다시 녹화)
+# 저장소에 포함된 아카이브는 실제 녹화가 아니라 tests/e2e/synthetic_archive.py가
+# golden 파일로 만든 3페이지 합성 사이트이며, 나머지 링크는 재생 시 404로
+# 응답합니다 (tests/fixtures/e2e/README.md 참고).
+ARCHIVE_DIR = Path(__file__).parent.parent / "fixtures" / "e2e"
+
+
+def archive_path_for(version: str, section: str) -> Path:
+    return ARCHIVE_DIR / f"python-{version}-{section}.jsonl.gz"
+
+
+def baseline_path_for(version: str, section: str) -> Path:
+    """품질 게이트 기준 코퍼스 (E2E_UPDATE_BASELINE=1이면 현재 출력으로 갱신)."""
+    return ARCHIVE_DIR / f"python-{version}-{section}.baseline.jsonl"
 
 
 def _run_spider_crawl(
+    output_file: Path,
     version: str = "3.13",
     section: str = "tutorial",
     max_items: int = 3,
+    record: bool = False,
 ) -> list[dict[str, Any]]:
-    """subprocess로 Scrapy 스파이더를 실행하고 결과를 반환."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_file = Path(tmpdir) / "output.jsonl"
-
-        # Scrapy 명령 실행
-        cmd = [
-            "uv",
-            "run",
-            "scrapy",
-            "crawl",
-            "python",
-            "-a",
-            f"version={version}",
-            "-a",
-            f"section={section}",
-            "-s",
-            f"CLOSESPIDER_ITEMCOUNT={max_items}",
-            "-s",
-            "LOG_LEVEL=WARNING",
-            "-s",
-            "HTTPCACHE_ENABLED=True",
-            "-o",
-            str(output_file),
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-            check=False,
+    """녹화 아카이브로 Scrapy 스파이더를 프로세스 내에서 실행하고 결과를 반환.
+
+    리액터는 프로세스당 한 번만 실행할 수 있으므로 세션 fixture에서만 호출합니다.
+    ``record``면 실제 사이트를 크롤링하며 아카이브를 새로 씁니다.
+    """
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+
+    from tests.e2e.replay import HANDLER_PATH
+
+    work_dir = output_file.parent
+    settings = get_project_settings()
+    settings.setdict(
+        {
+            "CLOSESPIDER_ITEMCOUNT": max_items,
+            "LOG_LEVEL": "WARNING",
+            "LOG_INSTALL_ROOT_HANDLER": False,
+            "HTTPCACHE_ENABLED": False,
+            "DOWNLOAD_HANDLERS": {"http": HANDLER_PATH, "https": HANDLER_PATH},
+            "E2E_ARCHIVE": str(archive_path_for(version, section)),
+            "E2E_RECORD": record,
+            "FEEDS": {str(output_file): {"format": "jsonlines", "encoding": "utf-8"}},
+            "SEARCH_INDEX_PATH": str(work_dir / "search.db"),
+            "CODE_INDEX_PATH": str(work_dir / "code.db"),
+            "RECRAWL_HISTORY_PATH": str(work_dir / "recrawl.db"),
+            "RUN_HISTORY_PATH": str(work_dir / "runs.db"),
+            "LINK_GRAPH_PATH": str(work_dir / "links.db"),
+        },
+        priority="cmdline",
+    )
+    if not record:
+        # 재생은 로컬이므로 요청 간격 불필요
+        settings.set("DOWNLOAD_DELAY", 0, priority="cmdline")
+    if "twisted.internet.reactor" in sys.modules:
+        # 앞선 테스트가 이미 리액터를 설치했으면 (실행 전이므로) 그대로 사용
+        from twisted.internet import reactor
+
+        reactor_class = type(reactor)
+        settings.set(
+            "TWISTED_REACTOR",
+            f"{reactor_class.__module__}.{reactor_class.__name__}",
+            priority="cmdline",
         )
 
-        if result.returncode != 0:
-            raise RuntimeError(f"Scrapy 크롤링 실패: {result.stderr}")
-
-        # JSONL 파일에서 결과 읽기
-        items: list[dict[str, Any]] = []
-        if output_file.exists():
-            with open(output_file, encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        items.append(json.loads(line))
-
-        return items
-
-
-@pytest.fixture(scope="module")
-def spider_crawl_results() -> CrawlResults:
-    """Scrapy 스파이더 실행 결과 (3 페이지)."""
-    items = _run_spider_crawl(max_items=3)
-    return CrawlResults(items=items)
+    with pytest.MonkeyPatch.context() as mp:
+        # 파이프라인 부산물(JSONL 출력, 보고서)은 작업 디렉토리에
+        mp.setattr("pydoc_crawler.settings.DATA_DIR", work_dir)
+        process = CrawlerProcess(settings)
+        process.crawl("python", version=version, section=section)
+        process.start()
+
+    # JSONL 파일에서 결과 읽기
+    items: list[dict[str, Any]] = []
+    if output_file.exists():
+        with open(output_file, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    items.append(json.loads(line))
+
+    return items
+
+
+@pytest.fixture(scope="session")
+def spider_crawl_results(tmp_path_factory: pytest.TempPathFactory) -> CrawlResults:
+    """Scrapy 스파이더 실행 결과 (3 페이지, 녹화 아카이브 재생)."""
+    record = os.environ.get("E2E_RECORD") == "1"
+    if not record and not archive_path_for("3.13", "tutorial").exists():
+        pytest.skip("녹화 아카이브 없음: E2E_RECORD=1로 한 번 실행하여 생성")
+
+    output_file = tmp_path_factory.mktemp("crawl") / "output.jsonl"
+    items = _run_spider_crawl(output_file, max_items=3, record=record)
+    return CrawlResults(items=items, path=output_file)
 
 
 @pytest.fixture
@@ -0,0 +1,209 @@
+"""코퍼스 전체 품질 회귀 게이트.
+
+크롤링 결과 코퍼스(JSONL)를 저장된 기준 코퍼스와 URL 단위로 비교합니다.
+``content_hash``가 같은 페이지는 메트릭 계산 없이 동일로 처리하고, 바뀐
+페이지만 프로세스 풀에서 병렬로 WER/CER/유사도를 계산한 뒤, 허용 오차를
+넘은 페이지를 유사도가 낮은 순으로 정렬해 보고합니다.
+
+Example::
+
+    python -m tests.e2e.quality data/baseline.jsonl data/python_3.13_output.jsonl \\
+        --report data/quality_report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pydoc_crawler.jsonl_index import iter_records
+from tests.e2e.helpers import TextMetrics, compute_metrics, normalize_for_comparison
+
+# 페이지별 허용 오차 (단일 페이지 golden 테스트와 같은 Normal 수준)
+THRESHOLDS = {
+    "wer_max": 0.05,
+    "cer_max": 0.03,
+    "similarity_min": 0.95,
+}
+
+
+@dataclass
+class PageResult:
+    """바뀐 페이지 하나의 비교 결과."""
+
+    url: str
+    metrics: TextMetrics
+    regressed: bool
+
+
+@dataclass
+class QualityReport:
+    """코퍼스 비교 보고서."""
+
+    baseline_pages: int = 0
+    current_pages: int = 0
+    identical: int = 0
+    changed: list[PageResult] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    new: list[str] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> list[PageResult]:
+        """허용 오차를 넘은 페이지 (유사도 낮은 순, 같으면 WER 높은 순)."""
+        return sorted(
+            (page for page in self.changed if page.regressed),
+            key=lambda page: (page.metrics.similarity, -page.metrics.wer),
+        )
+
+    def passed(self, allow_missing: bool = False) -> bool:
+        return not self.regressions and (allow_missing or not self.missing)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "baseline_pages": self.baseline_pages,
+            "current_pages": self.current_pages,
+            "identical": self.identical,
+            "changed": len(self.changed),
+            "regressed": len(self.regressions),
+            "missing": self.missing,
+            "new": self.new,
+            "regressions": [
+                {"url": page.url, **asdict(page.metrics)} for page in self.regressions
+            ],
+        }
+
+    def write(self, path: str | Path) -> None:
+        Path(path).write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+
+def load_corpus(paths: Iterable[str | Path]) -> dict[str, dict[str, Any]]:
+    """JSONL 코퍼스를 URL별 ``content_hash``/본문으로 로드 (같은 URL은 마지막 값)."""
+    corpus: dict[str, dict[str, Any]] = {}
+    for path in paths:
+        for record in iter_records(path):
+            corpus[record["url"]] = {
+                "content_hash": record.get("content_hash"),
+                "content": record.get("content_markdown", ""),
+            }
+    return corpus
+
+
+def _compare_page(task: tuple[str, str, str]) -> tuple[str, TextMetrics]:
+    """기준/현재 본문 비교 (프로세스 풀 작업 단위)."""
+    url, reference, hypothesis = task
+    reference = normalize_for_comparison(reference)
+    hypothesis = normalize_for_comparison(hypothesis)
+    if reference == hypothesis:
+        # 공백 등 정규화 대상만 다른 경우
+        return url, TextMetrics(0.0, 0.0, 1.0, 0, 0)
+    return url, compute_metrics(reference, hypothesis)
+
+
+def _is_regressed(metrics: TextMetrics, thresholds: dict[str, float]) -> bool:
+    return (
+        metrics.wer > thresholds["wer_max"]
+        or metrics.cer > thresholds["cer_max"]
+        or metrics.similarity < thresholds["similarity_min"]
+    )
+
+
+def compare_corpora(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    thresholds: dict[str, float] | None = None,
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> QualityReport:
+    """기준 코퍼스 대비 현재 코퍼스 품질 비교.
+
+    Args:
+        baseline: ``load_corpus``로 읽은 기준 코퍼스
+        current: ``load_corpus``로 읽은 현재 코퍼스
+        thresholds: 페이지별 허용 오차 (기본값: THRESHOLDS)
+        workers: 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 계산)
+        chunksize: 워커에 한 번에 넘길 페이지 수
+    """
+    thresholds = thresholds or THRESHOLDS
+    report = QualityReport(baseline_pages=len(baseline), current_pages=len(current))
+    report.missing = sorted(baseline.keys() - current.keys())
+    report.new = sorted(current.keys() - baseline.keys())
+
+    tasks: list[tuple[str, str, str]] = []
+    for url in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[url], current[url]
+        if before["content_hash"] and before["content_hash"] == after["content_hash"]:
+            report.identical += 1
+            continue
+        tasks.append((url, before["content"], after["content"]))
+
+    for url, metrics in _map(tasks, workers, chunksize):
+        report.changed.append(
+            PageResult(url, metrics, regressed=_is_regressed(metrics, thresholds))
+        )
+    return report
+
+
+def _map(
+    tasks: list[tuple[str, str, str]], workers: int | None, chunksize: int
+) -> Iterator[tuple[str, TextMetrics]]:
+    if workers == 1 or len(tasks) <= 1:
+        yield from map(_compare_page, tasks)
+        return
+
+    # 크롤러(리액터 스레드)가 떠 있던 프로세스에서도 안전하도록 spawn 사용
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        yield from pool.map(_compare_page, tasks, chunksize=chunksize)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.e2e.quality",
+        description="기준 코퍼스 대비 크롤링 결과 품질 회귀 검사",
+    )
+    parser.add_argument("baseline", type=Path, help="기준 코퍼스 JSONL")
+    parser.add_argument("current", nargs="+", type=Path, help="비교할 JSONL 파일")
+    parser.add_argument(
+        "-j", "--workers", type=int, help="프로세스 수 (기본값: CPU 수)"
+    )
+    parser.add_argument("--report", type=Path, help="JSON 보고서 저장 경로")
+    parser.add_argument("--top", type=int, default=20, help="출력할 회귀 페이지 수")
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="기준에만 있는 페이지를 실패로 보지 않음",
+    )
+    args = parser.parse_args(argv)
+
+    report = compare_corpora(
+        load_corpus([args.baseline]), load_corpus(args.current), workers=args.workers
+    )
+    if args.report:
+        report.write(args.report)
+
+    print(
+        f"기준 {report.baseline_pages}개 / 현재 {report.current_pages}개: "
+        f"동일 {report.identical}, 변경 {len(report.changed)}, "
+        f"회귀 {len(report.regressions)}, 누락 {len(report.missing)}, "
+        f"신규 {len(report.new)}"
+    )
+    for page in report.regressions[: args.top]:
+        metrics = page.metrics
+        print(
+            f"  {metrics.similarity:.4f} sim  {metrics.wer:.4f} WER  "
+            f"{metrics.cer:.4f} CER  {page.url}"
+        )
+    return 0 if report.passed(args.allow_missing) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""E2E 크롤링 녹화/재생 (오프라인 실행용).
+
+녹화 모드(``E2E_RECORD=1``)에서는 실제 HTTP 다운로드 핸들러로 받은 응답을
+원본 그대로(상태/헤더/압축된 본문, 리다이렉트 포함) 아카이브에 저장하고,
+재생 모드에서는 같은 아카이브를 로컬 대역(stand-in) 핸들러로 돌려줍니다.
+URL/도메인이 실제 사이트와 같아 스파이더 규칙과 오프사이트 필터가 그대로
+동작하고, 네트워크 없이 수 초 안에 크롤링이 끝납니다.
+
+아카이브 형식 (gzip JSONL, 응답당 한 줄)::
+
+    {"url": ..., "status": 200, "headers": {"Content-Type": [...]}, "body": <base64>}
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+from scrapy import Request
+from scrapy.core.downloader.handlers.base import BaseDownloadHandler
+from scrapy.crawler import Crawler
+from scrapy.http import Headers, Response
+from scrapy.responsetypes import responsetypes
+
+HANDLER_PATH = "tests.e2e.replay.ArchiveDownloadHandler"
+
+
+class ResponseArchive:
+    """URL별 녹화 응답 모음."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.records: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: str | Path) -> ResponseArchive:
+        archive = cls(path)
+        with gzip.open(archive.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    archive.records[record["url"]] = record
+        return archive
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            for url in sorted(self.records):
+                f.write(json.dumps(self.records[url]) + "\n")
+
+    def add(self, url: str, response: Response) -> None:
+        self.records[url] = {
+            "url": url,
+            "status": response.status,
+            "headers": {
+                key.decode(): [value.decode("latin-1") for value in values]
+                for key, values in response.headers.items()
+            },
+            "body": base64.b64encode(response.body).decode("ascii"),
+        }
+
+    def response_for(self, request: Request) -> Response:
+        """녹화된 응답 재생 (없으면 404)."""
+        record = self.records.get(request.url)
+        if record is None:
+            return Response(request.url, status=404, request=request)
+
+        headers = Headers(record["headers"])
+        body = base64.b64decode(record["body"])
+        respcls = responsetypes.from_args(headers=headers, url=request.url, body=body)
+        return respcls(
+            url=request.url,
+            status=record["status"],
+            headers=headers,
+            body=body,
+            request=request,
+        )
+
+
+class ArchiveDownloadHandler(BaseDownloadHandler):
+    """``E2E_ARCHIVE`` 아카이브로 녹화하거나 재생하는 다운로드 핸들러."""
+
+    def __init__(self, crawler: Crawler) -> None:
+        super().__init__(crawler)
+        path = crawler.settings["E2E_ARCHIVE"]
+        self.upstream: BaseDownloadHandler | None = None
+        if crawler.settings.getbool("E2E_RECORD"):
+            from scrapy.core.downloader.handlers.http11 import HTTP11DownloadHandler
+
+            self.archive = ResponseArchive(path)
+            self.upstream = HTTP11DownloadHandler.from_crawler(crawler)
+        else:
+            self.archive = ResponseArchive.load(path)
+
+    async def download_request(self, request: Request) -> Response:
+        if self.upstream is None:
+            return self.archive.response_for(request)
+
+        response = await self.upstream.download_request(request)
+        self.archive.add(request.url, response)
+        return response
+
+    async def close(self) -> None:
+        if self.upstream is not None:
+            await self.upstream.close()
+            self.archive.save()
@@ -0,0 +1,279 @@
+"""E2E 재생용 합성 응답 아카이브 생성기.
+
+``tests/fixtures/e2e/python-3.13-tutorial.jsonl.gz``는 실제 docs.python.org 녹화가
+아니라 이 스크립트로 만든 합성 사이트입니다. ``index.html``은 golden 파일
+(``tests/fixtures/python_tutorial.md``)을 Sphinx 형태 HTML로 렌더링한 것이고,
+``appetite.html``/``interpreter.html``은 고정 본문의 짧은 페이지입니다.
+
+index 페이지가 golden 파일에서 만들어지므로, golden 유사도 테스트는 실제 사이트
+대비 충실도가 아니라 파서의 HTML → Markdown 왕복을 검증합니다. 실제 사이트 기준
+검증이 필요하면 ``E2E_RECORD=1``로 녹화한 아카이브를 사용하세요.
+
+Example::
+
+    python -m tests.e2e.synthetic_archive
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import html
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+from tests.e2e.helpers import remove_frontmatter
+
+ROOT = Path(__file__).parent.parent
+GOLDEN_PATH = ROOT / "fixtures" / "python_tutorial.md"
+ARCHIVE_PATH = ROOT / "fixtures" / "e2e" / "python-3.13-tutorial.jsonl.gz"
+BASE_URL = "https://docs.python.org/3.13/tutorial/"
+
+# golden 파일의 cp1252 인코딩 아티팩트 → 원래 문자
+ARTIFACTS = [
+    ("â\u0080\u0099", "'"),
+    ("â\u0080\u009c", '"'),
+    ("â\u0080\u009d", '"'),
+    ("â\u0080\u0094", "—"),
+]
+
+
+def _inline(text: str) -> str:
+    """Markdown 인라인 서식(링크, 코드, 강조)을 Sphinx HTML로 변환."""
+    text = html.escape(text, quote=False)
+    text = re.sub(
+        r"\[([^\]]+)\]\(([^)]+)\)",
+        lambda m: f'<a class="reference internal" href="{m.group(2)}">{m.group(1)}</a>',
+        text,
+    )
+    text = re.sub(
+        r"`([^`]+)`",
+        r'<code class="docutils literal notranslate">'
+        r'<span class="pre">\1</span></code>',
+        text,
+    )
+    text = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"(?<![\w*])\*([^*\s][^*]*)\*", r"<em>\1</em>", text)
+    return text.replace("\\*", "*")
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def _toctree(lines: list[str]) -> str:
+    """들여쓰기(2칸) 중첩 목록을 Sphinx toctree ``<ul>``로 변환."""
+    out: list[str] = []
+    depth = -1
+    for line in lines:
+        indent = (len(line) - len(line.lstrip())) // 2
+        item = line.strip()[2:]
+        while depth < indent:
+            out.append("<ul>")
+            depth += 1
+        while depth > indent:
+            out.append("</li></ul>")
+            depth -= 1
+        if out and out[-1] != "<ul>":
+            out.append("</li>")
+        out.append(f'<li class="toctree-l{indent + 1}">{_inline(item)}')
+    while depth >= 0:
+        out.append("</li></ul>")
+        depth -= 1
+    return '<div class="toctree-wrapper compound">\n' + "\n".join(out) + "\n</div>"
+
+
+def _body_from_markdown(markdown: str) -> tuple[str, str]:
+    """golden Markdown 블록을 (제목, 본문 HTML)로 변환."""
+    blocks = re.split(r"\n\s*\n", markdown.strip())
+    parts: list[str] = []
+    title = ""
+    i = 0
+    while i < len(blocks):
+        block = blocks[i]
+        if block.startswith("# "):
+            title = block[2:]
+            parts.append(
+                f'<h1>{_inline(title)}<a class="headerlink" href="#{_slug(title)}"'
+                ' title="Link to this heading">¶</a></h1>'
+            )
+        elif block == "Tip":
+            parts.append(
+                '<div class="admonition tip">\n<p class="admonition-title">Tip</p>\n'
+                f"<p>{_inline(blocks[i + 1])}</p>\n</div>"
+            )
+            i += 1
+        elif block.lstrip().startswith("* "):
+            parts.append(_toctree(block.split("\n")))
+        else:
+            parts.append(f"<p>{_inline(block)}</p>")
+        i += 1
+    return title, "\n".join(parts)
+
+
+def _page(title: str, body: str) -> str:
+    """Sphinx 페이지 골격 (내비게이션/사이드바/푸터 포함)."""
+    return f"""<!DOCTYPE html>
+<html lang="en" data-content_root="../">
+<head>
+<meta charset="utf-8" />
+<meta name="generator" content="Docutils 0.19: https://docutils.sourceforge.io/" />
+<title>{html.escape(title)} &#8212; Python 3.13 documentation</title>
+<script src="../_static/documentation_options.js"></script>
+<script src="../_static/doctools.js"></script>
+</head>
+<body>
+<div class="related" role="navigation" aria-label="Related">
+<h3>Navigation</h3>
+<ul><li><a href="../genindex.html">index</a></li><li><a href="index.html">The Python Tutorial</a></li></ul>
+</div>
+<div class="document">
+<div class="documentwrapper">
+<div class="bodywrapper">
+<div class="body" role="main">
+<section id="{_slug(title)}">
+{body}
+</section>
+</div>
+</div>
+</div>
+<div class="sphinxsidebar" role="navigation" aria-label="Main">
+<h3>Table of Contents</h3>
+<ul><li><a href="#">{html.escape(title)}</a></li></ul>
+</div>
+</div>
+<div class="footer">&copy; Copyright 2001 Python Software Foundation.</div>
+</body>
+</html>
+"""  # noqa: E501
+
+
+def _section(
+    heading: str, level: int, paragraphs: list[str], code: str | None = None
+) -> str:
+    """번호 붙은 헤딩 섹션 (최상위 섹션은 페이지 골격이 닫음)."""
+    section_id = _slug(re.sub(r"^[\d.]+\s*", "", heading))
+    out = [
+        f'<section id="{section_id}">',
+        f'<h{level}>{_inline(heading)}<a class="headerlink" href="#{section_id}"'
+        f' title="Link to this heading">¶</a></h{level}>',
+    ]
+    out += [f"<p>{_inline(paragraph)}</p>" for paragraph in paragraphs]
+    if code:
+        out.append(
+            '<div class="highlight-python3 notranslate"><div class="highlight"><pre>'
+            f"{html.escape(code)}</pre></div></div>"
+        )
+    if level > 1:
+        out.append("</section>")
+    return "\n".join(out)
+
+
+def build_pages(golden: str) -> dict[str, str]:
+    """파일 이름별 합성 페이지 HTML."""
+    markdown = remove_frontmatter(golden)
+    for artifact, char in ARTIFACTS:
+        markdown = markdown.replace(artifact, char)
+    title, body = _body_from_markdown(markdown)
+    pages = {"index.html": _page(title, body)}
+
+    pages["appetite.html"] = _page(
+        "1. Whetting Your Appetite",
+        _section(
+            "1. Whetting Your Appetite",
+            1,
+            [
+                "If you do much work on computers, eventually you find that there is "
+                "some task you would like to automate, such as a search-and-replace "
+                "over a large number of text files or renaming a batch of photo files.",
+                "Python is simple to use, but it is a real programming language, "
+                "offering much more structure and support for large programs than "
+                "shell scripts or batch files can offer.",
+                "Python allows you to split your program into modules that can be "
+                "reused in other Python programs. Now that you are all excited about "
+                "Python, continue with "
+                "[Using the Python Interpreter](interpreter.html).",
+            ],
+        ),
+    )
+
+    pages["interpreter.html"] = _page(
+        "2. Using the Python Interpreter",
+        "\n".join(
+            [
+                _section("2. Using the Python Interpreter", 1, []),
+                _section(
+                    "2.1. Invoking the Interpreter",
+                    2,
+                    [
+                        "The Python interpreter is usually installed as "
+                        "`/usr/local/bin/python3.13` on those machines where it is "
+                        "available; putting `/usr/local/bin` in your shell's search "
+                        "path makes it possible to start it by typing the command:",
+                    ],
+                    "python3.13\n",
+                ),
+                _section(
+                    "2.1.1. Argument Passing",
+                    3,
+                    [
+                        "When known to the interpreter, the script name and additional "
+                        "arguments thereafter are turned into a list of strings and "
+                        "assigned to the `argv` variable in the `sys` module.",
+                    ],
+                    "import sys\nprint(sys.argv)\n",
+                ),
+                _section(
+                    "2.2. The Interpreter and Its Environment",
+                    2,
+                    [
+                        "By default, Python source files are treated as encoded in "
+                        "UTF-8. To declare an encoding other than the default one, a "
+                        "special comment line should be added as the first line of "
+                        "the file.",
+                    ],
+                ),
+            ]
+        ),
+    )
+    return pages
+
+
+def write_archive(pages: dict[str, str], path: Path) -> None:
+    """재생 아카이브 형식(gzip JSONL, 응답당 한 줄)으로 저장 (재현 가능하게 mtime=0)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with (
+        gzip.GzipFile(path, "wb", mtime=0) as raw,
+        io.TextIOWrapper(raw, encoding="utf-8") as f,
+    ):
+        for name, text in sorted(pages.items()):
+            record = {
+                "url": BASE_URL + name,
+                "status": 200,
+                "headers": {"Content-Type": ["text/html; charset=utf-8"]},
+                "body": base64.b64encode(text.encode("utf-8")).decode("ascii"),
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.e2e.synthetic_archive",
+        description="golden 파일로 E2E 재생용 합성 아카이브 생성",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=ARCHIVE_PATH, help="아카이브 경로"
+    )
+    args = parser.parse_args(argv)
+
+    write_archive(build_pages(GOLDEN_PATH.read_text(encoding="utf-8")), args.output)
+    print(f"{args.output} ({args.output.stat().st_size}B)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""코퍼스 품질 회귀 게이트 테스트."""
+
+import os
+import shutil
+from typing import Any
+
+import pytest
+
+from tests.e2e.conftest import CrawlResults, baseline_path_for
+from tests.e2e.quality import compare_corpora, load_corpus
+
+TEXT = (
+    "The Python Tutorial. Python is an easy to learn, powerful programming "
+    "language. It has efficient high-level data structures and a simple but "
+    "effective approach to object-oriented programming."
+)
+
+
+def _corpus(pages: dict[str, tuple[str, str]]) -> dict[str, dict[str, Any]]:
+    return {
+        url: {"content_hash": content_hash, "content": content}
+        for url, (content_hash, content) in pages.items()
+    }
+
+
+@pytest.fixture
+def corpora() -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    baseline = _corpus(
+        {
+            "same": ("h1", TEXT),
+            "spacing": ("h2", TEXT),
+            "broken": ("h3", TEXT),
+            "worse": ("h4", TEXT),
+            "gone": ("h5", TEXT),
+        }
+    )
+    current = _corpus(
+        {
+            # 해시가 같으면 본문을 비교하지 않음
+            "same": ("h1", "not compared"),
+            "spacing": ("h2x", TEXT.replace(". ", ".\n\n")),
+            "broken": ("h3x", TEXT[: len(TEXT) // 2]),
+            "worse": ("h4x", TEXT[:20]),
+            "added": ("h6", TEXT),
+        }
+    )
+    return baseline, current
+
+
+def test_report_ranks_regressions(
+    corpora: tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]],
+) -> None:
+    """동일 페이지는 건너뛰고, 회귀 페이지를 유사도 낮은 순으로 보고."""
+    report = compare_corpora(*corpora, workers=1)
+
+    assert report.identical == 1
+    assert sorted(page.url for page in report.changed) == [
+        "broken",
+        "spacing",
+        "worse",
+    ]
+    assert [page.url for page in report.regressions] == ["worse", "broken"]
+    assert report.missing == ["gone"]
+    assert report.new == ["added"]
+    assert not report.passed(allow_missing=True)
+    assert report.to_dict()["regressions"][0]["url"] == "worse"
+
+
+def test_parallel_matches_serial(
+    corpora: tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]],
+) -> None:
+    """프로세스 풀 계산 결과가 단일 프로세스와 같음."""
+    serial = compare_corpora(*corpora, workers=1)
+    parallel = compare_corpora(*corpora, workers=2, chunksize=1)
+
+    assert parallel.to_dict() == serial.to_dict()
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+def test_crawl_matches_baseline_corpus(spider_crawl_results: CrawlResults) -> None:
+    """녹화 아카이브 크롤링 결과가 기준 코퍼스와 품질 차이가 없는지 확인."""
+    assert spider_crawl_results.path is not None
+    baseline_path = baseline_path_for("3.13", "tutorial")
+    if os.environ.get("E2E_UPDATE_BASELINE") == "1":
+        shutil.copyfile(spider_crawl_results.path, baseline_path)
+    if not baseline_path.exists():
+        pytest.skip("기준 코퍼스 없음: E2E_UPDATE_BASELINE=1로 한 번 실행하여 생성")
+
+    report = compare_corpora(
+        load_corpus([baseline_path]), load_corpus([spider_crawl_results.path])
+    )
+
+    # 수집 개수 제한으로 페이지 구성은 실행마다 다를 수 있음
+    assert report.passed(allow_missing=True), report.to_dict()["regressions"]
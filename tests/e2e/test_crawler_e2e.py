@@ -41,7 +41,11 @@ class TestCrawlerE2E:
         single_page_result: dict[str, Any],
         golden_tutorial: str,
     ) -> None:
-        """Golden file 대비 내용 유사도 검증."""
+        """Golden file 대비 내용 유사도 검증.
+
+        합성 아카이브의 index 페이지는 golden 파일로 만든 HTML이므로, 재생 시에는
+        실제 사이트 충실도가 아니라 HTML → Markdown 왕복을 검증합니다.
+        """
         # 정규화
         crawled_normalized = normalize_for_comparison(
             single_page_result["content_markdown"]
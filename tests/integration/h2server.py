@@ -0,0 +1,152 @@
+"""로컬 HTTP/2(TLS + ALPN) 테스트 서버와 크롤링 실행기.
+
+리액터는 프로세스당 한 번만 실행할 수 있으므로 ``run_crawl``은 별도 프로세스
+(spawn)에서 실행하고, 크롤러 통계를 JSON 파일로 남깁니다.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from scrapy import Request, Spider
+from scrapy.http import Response
+from twisted.web import resource
+
+PAGES = 24
+# 페이지 번호별 응답 인코딩 (Accept-Encoding에 있을 때만 사용)
+ENCODINGS = ["br", "zstd", "gzip", "identity"]
+
+
+def page_body(number: int) -> bytes:
+    rows = "".join(
+        f"<tr><td>func{i}</td><td>Return the value of item {i}.</td></tr>"
+        for i in range(300)
+    )
+    return (
+        f"<html><body><h1>Page {number}</h1><table>{rows}</table></body></html>"
+    ).encode()
+
+
+def encode(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        import brotli
+
+        return bytes(brotli.compress(body))
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(body)
+    if encoding == "gzip":
+        return gzip.compress(body)
+    return body
+
+
+class PageResource(resource.Resource):
+    isLeaf = True  # noqa: N815
+
+    def render_GET(self, request: Any) -> bytes:  # noqa: N802
+        number = int(request.postpath[-1].decode())
+        encoding = ENCODINGS[number % len(ENCODINGS)]
+        accepted = (request.getHeader("accept-encoding") or "").split(", ")
+        if encoding not in accepted:
+            encoding = "identity"
+
+        request.setHeader("Content-Type", "text/html; charset=utf-8")
+        if encoding != "identity":
+            request.setHeader("Content-Encoding", encoding)
+        return encode(page_body(number), encoding)
+
+
+def _certificate_options() -> Any:
+    """자체 서명 인증서와 h2 ALPN을 쓰는 TLS 옵션."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    from OpenSSL import crypto
+    from twisted.internet import ssl
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    return ssl.CertificateOptions(
+        privateKey=crypto.PKey.from_cryptography_key(key),
+        certificate=crypto.X509.from_cryptography(cert),
+        acceptableProtocols=[b"h2"],
+    )
+
+
+class PagesSpider(Spider):
+    name = "h2pages"
+
+    def __init__(self, base_url: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    async def start(self) -> Any:
+        for number in range(PAGES):
+            yield Request(f"{self.base_url}/page/{number}", dont_filter=True)
+
+    def parse(self, response: Response) -> Iterator[dict[str, Any]]:
+        yield {"url": response.url, "protocol": response.protocol}
+
+
+def run_crawl(result_path: str) -> None:
+    """HTTP/2 서버를 띄우고 ``HTTP2_ENABLED`` 설정으로 크롤링 후 통계 저장."""
+    from scrapy.utils.reactor import install_reactor
+
+    install_reactor("twisted.internet.asyncioreactor.AsyncioSelectorReactor")
+
+    from scrapy.crawler import CrawlerRunner
+    from scrapy.utils.project import get_project_settings
+    from twisted.internet import reactor as installed_reactor
+    from twisted.web.server import Site
+
+    reactor: Any = installed_reactor
+    port = reactor.listenSSL(
+        0, Site(PageResource()), _certificate_options(), interface="127.0.0.1"
+    )
+
+    settings = get_project_settings()
+    settings.setdict(
+        {
+            "HTTP2_ENABLED": True,
+            "ITEM_PIPELINES": {},
+            "FEEDS": {},
+            "HTTPCACHE_ENABLED": False,
+            "RUN_HISTORY_ENABLED": False,
+            "LINK_GRAPH_ENABLED": False,
+            "ROBOTSTXT_OBEY": False,
+            "DOWNLOAD_DELAY": 0,
+            "LOG_LEVEL": "WARNING",
+        },
+        priority="cmdline",
+    )
+    runner = CrawlerRunner(settings)
+    crawler = runner.create_crawler(PagesSpider)
+
+    def finished(_: Any) -> None:
+        Path(result_path).write_text(
+            json.dumps(crawler.stats.get_stats(), default=str), encoding="utf-8"
+        )
+        port.stopListening()
+        reactor.stop()
+
+    base_url = f"https://127.0.0.1:{port.getHost().port}"
+    runner.crawl(crawler, base_url=base_url).addBoth(finished)
+    reactor.run()
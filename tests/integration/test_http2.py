@@ -0,0 +1,66 @@
+"""HTTP/2 다운로드 경로 통합 테스트 (로컬 HTTP/2 서버)."""
+
+import json
+import multiprocessing
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy.settings import Settings
+
+from pydoc_crawler.transfer import H2_HANDLER, Http2Addon
+
+pytest.importorskip("h2")
+pytest.importorskip("brotli")
+pytest.importorskip("zstandard")
+
+
+def test_addon_switches_https_handler() -> None:
+    """HTTP2_ENABLED일 때만 https 핸들러와 동시 스트림 수 변경."""
+    settings = Settings({"CONCURRENT_REQUESTS_PER_DOMAIN": 4})
+    Http2Addon().update_settings(settings)
+    assert "https" not in settings.getdict("DOWNLOAD_HANDLERS")
+
+    settings.set("HTTP2_ENABLED", True)
+    settings.set("HTTP2_CONCURRENT_STREAMS", 32)
+    settings.set("CONCURRENT_REQUESTS_PER_DOMAIN", 4, priority="spider")
+    Http2Addon().update_settings(settings)
+    assert settings.getdict("DOWNLOAD_HANDLERS")["https"] == H2_HANDLER
+    assert settings.getint("CONCURRENT_REQUESTS_PER_DOMAIN") == 32
+    assert settings.getint("CONCURRENT_REQUESTS") == 32
+
+
+@pytest.fixture(scope="module")
+def crawl_stats(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Any]:
+    from tests.integration.h2server import run_crawl
+
+    result = tmp_path_factory.mktemp("h2") / "stats.json"
+    process = multiprocessing.get_context("spawn").Process(
+        target=run_crawl, args=(str(result),)
+    )
+    process.start()
+    process.join(timeout=60)
+    assert process.exitcode == 0
+    stats: dict[str, Any] = json.loads(Path(result).read_text(encoding="utf-8"))
+    return stats
+
+
+def test_pages_multiplexed_over_http2(crawl_stats: dict[str, Any]) -> None:
+    """모든 페이지가 HTTP/2로 받아지고 한 연결에서 여러 스트림이 동시 사용됨."""
+    from tests.integration.h2server import PAGES
+
+    assert crawl_stats["item_scraped_count"] == PAGES
+    assert crawl_stats["transfer/protocol/h2"] == PAGES
+
+    host = next(key for key in crawl_stats if key.endswith("/streams_peak"))
+    assert crawl_stats[host] > 1
+    assert crawl_stats[host.replace("streams_peak", "requests")] == PAGES
+
+
+def test_compressed_transfer_reported(crawl_stats: dict[str, Any]) -> None:
+    """br/zstd/gzip 협상 및 전송 대비 디코딩 바이트 기록."""
+    for encoding in ("br", "zstd", "gzip", "identity"):
+        assert crawl_stats[f"transfer/encoding/{encoding}"] == 6
+
+    assert crawl_stats["transfer/decoded_bytes"] > crawl_stats["transfer/wire_bytes"]
+    assert crawl_stats["transfer/compression_ratio"] > 2
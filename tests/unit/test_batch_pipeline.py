@@ -0,0 +1,130 @@
+"""배치 파이프라인 단위 테스트."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from scrapy import Spider
+from scrapy.exceptions import DropItem
+from scrapy.settings import Settings
+
+from pydoc_crawler.items import DocumentItem
+from pydoc_crawler.pipelines import (
+    BatchPipeline,
+    JsonLinesPipeline,
+    ValidationPipeline,
+)
+
+
+def _item(index: int, **overrides: Any) -> dict[str, Any]:
+    return {
+        "source": "python",
+        "version": "3.13",
+        "url": f"https://docs.python.org/3.13/library/page{index}.html",
+        "title": f"Page {index}",
+        "content_markdown": f"# Page {index}\n\n한글 본문",
+        "crawled_at": "2025-01-01T00:00:00",
+        **overrides,
+    }
+
+
+def _spider() -> Spider:
+    spider = Spider(name="python")
+    spider.settings = Settings()
+    return spider
+
+
+class RecordingPipeline(BatchPipeline):
+    def __init__(self, batch_size: int) -> None:
+        super().__init__(batch_size, max_delay=60)
+        self.batches: list[list[Any]] = []
+
+    def process_batch(self, items: list[Any], spider: Spider) -> list[Any]:
+        self.batches.append(items)
+        return [DropItem(item) if item < 0 else item * 10 for item in items]
+
+
+class TestBatchPipeline:
+    """BatchPipeline 테스트."""
+
+    def test_flush_on_size_and_close(self) -> None:
+        """배치 크기가 차거나 스파이더가 끝나면 처리하고 아이템별로 결과 전달."""
+        pipeline = RecordingPipeline(batch_size=3)
+        spider = _spider()
+        results: list[Any] = []
+
+        for value in (1, -2, 3, 4):
+            waiter = pipeline.process_item(value, spider)
+            waiter.addCallbacks(results.append, lambda f: results.append(f.type))
+        assert pipeline.batches == [[1, -2, 3]]
+        assert results == [10, DropItem, 30]
+
+        pipeline.close_spider(spider)
+        assert pipeline.batches == [[1, -2, 3], [4]]
+        assert results == [10, DropItem, 30, 40]
+
+    def test_unbatched(self) -> None:
+        """batch_size=1이면 바로 처리하고 예외를 그대로 발생."""
+        pipeline = RecordingPipeline(batch_size=1)
+        assert pipeline.process_item(2, _spider()) == 20
+        with pytest.raises(DropItem):
+            pipeline.process_item(-1, _spider())
+
+
+def test_validation_batch() -> None:
+    """배치 안의 중복 URL과 검증 실패는 해당 아이템만 실패."""
+    pipeline = ValidationPipeline()
+    duplicate = _item(1, url="https://docs.python.org/3.13/library/page1.html#top")
+    invalid = _item(2)
+    del invalid["title"]
+
+    results = pipeline.process_batch(
+        [_item(1), duplicate, invalid, _item(3)], _spider()
+    )
+
+    assert results[0] == DocumentItem(**_item(1)).model_dump(mode="json")
+    assert isinstance(results[1], DropItem)
+    assert isinstance(results[2], ValidationError)
+    assert results[3]["url"] == _item(3)["url"]
+
+
+def test_validation_batch_hashes_content() -> None:
+    """배치에서 계산한 본문 해시가 모델 계산 필드와 같고 키 순서도 유지."""
+    items = [_item(i, content_markdown="본문 " * i) for i in range(3)]
+
+    results = ValidationPipeline().process_batch(items, _spider())
+
+    expected = [DocumentItem(**item).model_dump(mode="json") for item in items]
+    assert [list(result.items()) for result in results] == [
+        list(record.items()) for record in expected
+    ]
+
+
+def test_jsonl_batch_matches_per_item(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """배치 쓰기 결과(출력/사이드카 인덱스)가 아이템별 쓰기와 동일."""
+    items = ValidationPipeline().process_batch([_item(i) for i in range(5)], _spider())
+    outputs = []
+    for batch_size in (1, 4):
+        data_dir = tmp_path / str(batch_size)
+        monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", data_dir)
+        pipeline = JsonLinesPipeline(batch_size=batch_size)
+        spider = _spider()
+        pipeline.open_spider(spider)
+        if batch_size == 1:
+            for item in items:
+                pipeline.process_item(item, spider)
+        else:
+            pipeline.process_batch(items[:4], spider)
+            pipeline.process_batch(items[4:], spider)
+        pipeline.close_spider(spider)
+        outputs.append(
+            [
+                (data_dir / name).read_bytes()
+                for name in ("python_output.jsonl", "python_output.jsonl.idx")
+            ]
+        )
+
+    assert outputs[0] == outputs[1]
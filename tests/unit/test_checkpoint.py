@@ -0,0 +1,136 @@
+"""재개 가능한 크롤링 체크포인트 단위 테스트."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+from scrapy.crawler import Crawler
+from scrapy.exceptions import DropItem
+from scrapy.settings import Settings
+
+from pydoc_crawler.checkpoint import CrawlCheckpoint
+from pydoc_crawler.jsonl_index import load_index
+from pydoc_crawler.pipelines import JsonLinesPipeline, ValidationPipeline
+from pydoc_crawler.spiders.python_spider import PythonDocsSpider
+
+
+def _item(index: int) -> dict[str, Any]:
+    return {
+        "source": "python",
+        "version": "3.13",
+        "url": f"https://docs.python.org/3.13/tutorial/page{index}.html",
+        "title": f"Page {index}",
+        "content_markdown": f"# Page {index}",
+    }
+
+
+def _spider(job_dir: Path) -> Spider:
+    spider = Spider(name="python")
+    spider.settings = Settings(
+        {"CRAWL_JOB_DIR": str(job_dir), "JOBDIR": str(job_dir / "python-3.13")}
+    )
+    return spider
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path / "data")
+    return tmp_path / "data"
+
+
+class TestResumableOutput:
+    """JSONL 이어쓰기 테스트."""
+
+    def _crawl(
+        self,
+        job_dir: Path,
+        indexes: range,
+        close: bool = True,
+        output_path: Path | None = None,
+    ) -> Any:
+        spider = _spider(job_dir)
+        validation = ValidationPipeline()
+        output = JsonLinesPipeline(checkpoint_interval=2, output_path=output_path)
+        validation.open_spider(spider)
+        output.open_spider(spider)
+
+        for index in indexes:
+            try:
+                item = validation.process_item(_item(index), spider)
+            except DropItem:
+                continue
+            output.process_item(item, spider)
+
+        if close:
+            output.close_spider(spider)
+        return output
+
+    def test_resume_appends_and_skips_seen(
+        self, data_dir: Path, tmp_path: Path
+    ) -> None:
+        """중단 후 재개 시 기존 출력 유지, 잘린 줄 제거, 중복 URL 제외."""
+        job_dir = tmp_path / "job"
+        interrupted = self._crawl(job_dir, range(5), close=False)
+
+        # 강제 종료 시뮬레이션: 버퍼를 비우고 마지막 줄을 중간에 자름
+        interrupted.file.write('{"url": "https://docs.python.org/3.13/tut')
+        interrupted.file.flush()
+        CrawlCheckpoint._instances.clear()
+
+        self._crawl(job_dir, range(3, 8))
+
+        lines = (data_dir / "python_output.jsonl").read_text().splitlines()
+        urls = [json.loads(line)["url"] for line in lines]
+
+        assert len(urls) == 8
+        assert len(set(urls)) == 8
+
+        # 사이드카 인덱스도 잘린 줄을 제외하고 이어쓴 문서까지 가리킴
+        entries = load_index(data_dir / "python_output.jsonl")
+        assert [entry.url for entry in entries] == urls
+
+    def test_resume_custom_output_path(self, data_dir: Path, tmp_path: Path) -> None:
+        """--output 경로(JSONL_OUTPUT_PATH)도 체크포인트 기준으로 이어쓰기."""
+        output_path = tmp_path / "out" / "docs.jsonl"
+        self._crawl(tmp_path / "job", range(3), close=False, output_path=output_path)
+        CrawlCheckpoint._instances.clear()
+
+        self._crawl(tmp_path / "job", range(5), output_path=output_path)
+
+        urls = [
+            json.loads(line)["url"] for line in output_path.read_text().splitlines()
+        ]
+        assert urls == [_item(i)["url"] for i in range(5)]
+        assert not (data_dir / "python_output.jsonl").exists()
+
+    def test_new_job_truncates_stale_output(
+        self, data_dir: Path, tmp_path: Path
+    ) -> None:
+        """새 작업 디렉토리면 이전 실행의 출력 파일을 비우고 시작."""
+        data_dir.mkdir(parents=True)
+        (data_dir / "python_output.jsonl").write_text('{"url": "stale"}\n')
+
+        self._crawl(tmp_path / "job", range(2))
+
+        lines = (data_dir / "python_output.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+
+
+class TestCrawlCheckpoint:
+    """CrawlCheckpoint 테스트."""
+
+    def test_finished_state_persists(self, tmp_path: Path) -> None:
+        """완료 표시가 디스크에 저장되어 다음 실행에서 유지."""
+        CrawlCheckpoint(tmp_path).mark_finished("python-3.12")
+
+        assert CrawlCheckpoint(tmp_path).is_finished("python-3.12")
+        assert not CrawlCheckpoint(tmp_path).is_finished("python-3.13")
+
+    def test_spider_sets_versioned_jobdir(self, tmp_path: Path) -> None:
+        """CRAWL_JOB_DIR 설정 시 스파이더가 버전별 JOBDIR 지정."""
+        crawler = Crawler(PythonDocsSpider, {"CRAWL_JOB_DIR": str(tmp_path)})
+        PythonDocsSpider.from_crawler(crawler, version="3.12")
+
+        assert crawler.settings.get("JOBDIR") == str(tmp_path / "python-3.12")
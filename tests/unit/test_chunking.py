@@ -0,0 +1,151 @@
+"""Markdown 청킹 단위 테스트."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+
+from pydoc_crawler.chunking import MarkdownChunker, estimate_tokens
+from pydoc_crawler.items import DocumentItem
+from pydoc_crawler.pipelines import ChunkingPipeline
+
+SAMPLE_MARKDOWN = """# Built-in Functions
+
+Intro paragraph.
+
+## abs(x)
+
+Return the absolute value.
+
+```python
+# not a heading
+abs(-1)
+```
+
+## all(iterable)
+
+Return True if all elements are true.
+"""
+
+
+def _document(content: str) -> dict[str, Any]:
+    item = DocumentItem(
+        source="python",
+        version="3.13",
+        url="https://docs.python.org/3.13/library/functions.html",
+        title="Built-in Functions",
+        content_markdown=content,
+    )
+    result: dict[str, Any] = item.model_dump(mode="json")
+    return result
+
+
+class TestMarkdownChunker:
+    """MarkdownChunker 테스트."""
+
+    def test_split_by_heading(self) -> None:
+        """헤딩 경로별로 청크가 나뉘는지 확인."""
+        sections = MarkdownChunker().split(SAMPLE_MARKDOWN)
+        paths = [path for path, _ in sections]
+
+        assert paths == [
+            ("Built-in Functions",),
+            ("Built-in Functions", "abs(x)"),
+            ("Built-in Functions", "all(iterable)"),
+        ]
+
+    def test_code_block_is_never_split(self) -> None:
+        """코드 블록 내부의 '#'는 헤딩으로 취급하지 않고 분할하지 않음."""
+        code = "```python\n" + "\n\n".join(f"x{i} = {i}" for i in range(200)) + "\n```"
+        markdown = f"# Title\n\nshort\n\n{code}\n\nafter"
+
+        texts = [text for _, text in MarkdownChunker(max_tokens=50).split(markdown)]
+
+        assert code in texts
+        assert all(text.count("```") % 2 == 0 for text in texts)
+
+    def test_large_section_respects_token_limit(self) -> None:
+        """큰 섹션은 문단 단위로 한도 내에서 분할."""
+        paragraphs = "\n\n".join("word " * 30 for _ in range(10))
+        chunks = MarkdownChunker(max_tokens=100).split(f"# Title\n\n{paragraphs}")
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(text) <= 100 for _, text in chunks)
+
+    def test_chunk_ids_are_stable(self) -> None:
+        """다른 섹션이 바뀌어도 나머지 청크 ID/해시는 유지."""
+        chunker = MarkdownChunker()
+        before = chunker.chunk(_document(SAMPLE_MARKDOWN))
+        after = chunker.chunk(
+            _document(SAMPLE_MARKDOWN.replace("absolute value", "magnitude"))
+        )
+
+        assert [c.id for c in before] == [c.id for c in after]
+        changed = [
+            b.id
+            for b, a in zip(before, after, strict=True)
+            if b.content_hash != a.content_hash
+        ]
+        assert len(changed) == 1
+
+
+class TestChunkingPipeline:
+    """ChunkingPipeline 증분 출력 테스트."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path)
+        return tmp_path
+
+    def _run(self, documents: list[dict[str, Any]]) -> None:
+        spider = Spider(name="python")
+        spider.version = "3.13"  # type: ignore[attr-defined]
+        pipeline = ChunkingPipeline()
+        pipeline.open_spider(spider)
+        for document in documents:
+            pipeline.process_item(document, spider)
+        pipeline.close_spider(spider)
+
+    def _read_chunks(
+        self, data_dir: Path, name: str = "python_3.13"
+    ) -> list[dict[str, Any]]:
+        lines = (data_dir / f"{name}_chunks.jsonl").read_text(encoding="utf-8")
+        return [json.loads(line) for line in lines.splitlines()]
+
+    def test_only_changed_chunks_are_reemitted(self, data_dir: Path) -> None:
+        """두 번째 실행에서는 바뀐 청크만 기록."""
+        self._run([_document(SAMPLE_MARKDOWN)])
+        assert len(self._read_chunks(data_dir)) == 3
+
+        self._run([_document(SAMPLE_MARKDOWN)])
+        assert self._read_chunks(data_dir) == []
+
+        changed = SAMPLE_MARKDOWN.replace("## all(iterable)\n\nReturn True", "")
+        self._run([_document(changed.replace("absolute value", "magnitude"))])
+        records = self._read_chunks(data_dir)
+
+        assert len([r for r in records if not r.get("deleted")]) == 1
+        assert len([r for r in records if r.get("deleted")]) == 1
+
+    def test_removed_pages_are_tombstoned(self, data_dir: Path) -> None:
+        """정상 종료된 전체 크롤링에서 보이지 않은 범위 안 문서는 tombstone."""
+        other = _document(SAMPLE_MARKDOWN)
+        other["id"] = "other"
+        other["url"] = "https://docs.python.org/3.13/tutorial/index.html"
+        self._run([_document(SAMPLE_MARKDOWN), other])
+
+        spider = Spider(name="python")
+        spider.version = "3.13"  # type: ignore[attr-defined]
+        spider.url_prefix = "https://docs.python.org/3.13/library/"  # type: ignore[attr-defined]
+        spider.full_crawl = True  # type: ignore[attr-defined]
+        for reason, deleted in (("closespider_itemcount", 0), ("finished", 3)):
+            pipeline = ChunkingPipeline()
+            pipeline.close_on_signal = True
+            pipeline.open_spider(spider)
+            pipeline.close_spider(spider)
+            pipeline.spider_closed(spider, reason)
+            records = self._read_chunks(data_dir, "python_3.13")
+            assert len(records) == deleted
+            assert all(r["deleted"] and r["document_id"] != "other" for r in records)
@@ -0,0 +1,131 @@
+"""코드 블록 추출 및 인덱스 단위 테스트."""
+
+from pathlib import Path
+from typing import Any
+
+from scrapy import Spider
+from scrapy.exceptions import DropItem
+from scrapy.http import HtmlResponse
+
+from pydoc_crawler.code_index import CodeIndex
+from pydoc_crawler.items import DocumentItem
+from pydoc_crawler.parsers import SphinxParser
+from pydoc_crawler.pipelines import CodeIndexPipeline
+
+HTML = b"""<html><body><div class="body">
+<h1>Tutorial</h1>
+<pre>print("intro")</pre>
+<h2>Shell</h2>
+<div class="highlight-bash"><pre>$ python -m venv .venv
+</pre></div>
+<h2>Asyncio</h2>
+<div class="highlight-python3"><pre><span class="k">import</span> asyncio</pre></div>
+</div></body></html>"""
+
+URL = "https://docs.python.org/3.13/tutorial/index.html"
+
+
+def _document() -> DocumentItem:
+    result = SphinxParser().parse(HtmlResponse(URL, body=HTML, encoding="utf-8"))
+    return DocumentItem(
+        source="python",
+        version="3.13",
+        url=URL,
+        title=result["title"],
+        content_markdown=result["content_markdown"],
+        code_blocks=result["code_blocks"],
+    )
+
+
+def test_parser_emits_code_blocks() -> None:
+    """Markdown 변환과 같은 과정에서 코드 블록 레코드 생성."""
+    blocks = _document().code_blocks
+
+    assert [(b.ordinal, b.language, b.heading) for b in blocks] == [
+        (0, "python", "Tutorial"),
+        (1, "bash", "Shell"),
+        (2, "python3", "Asyncio"),
+    ]
+    assert blocks[1].code == "$ python -m venv .venv"
+    assert blocks[2].code == "import asyncio"
+
+
+def test_code_block_heading_within_content() -> None:
+    """본문 영역 밖(사이드바 등)의 헤딩은 코드 블록 헤딩으로 쓰지 않음."""
+    html = b"""<html><body><div class="sphinxsidebar"><h3>Navigation</h3></div>
+<div class="body"><pre>print("intro")</pre><h2>Usage</h2><pre>run()</pre></div>
+</body></html>"""
+    result = SphinxParser().parse(HtmlResponse(URL, body=html, encoding="utf-8"))
+
+    assert [b["heading"] for b in result["code_blocks"]] == [None, "Usage"]
+
+
+def test_code_blocks_excluded_from_output() -> None:
+    """코드 블록은 JSONL 출력 dict에 포함되지 않음."""
+    assert "code_blocks" not in _document().model_dump(mode="json")
+
+
+def _scrape(pipeline: CodeIndexPipeline, spider: Spider, **overrides: Any) -> None:
+    """파이프라인 통과 후 item_scraped 신호까지 전달."""
+    document = _document()
+    assert pipeline.process_item(document, spider) is document
+    pipeline.item_scraped({**document.model_dump(mode="json"), **overrides}, spider)
+
+
+def test_pipeline_indexes_changed_documents(tmp_path: Path) -> None:
+    """변경된 문서만 코드 블록을 교체하고 조건별 조회 가능."""
+    pipeline = CodeIndexPipeline(index_path=tmp_path / "code.db")
+    spider = Spider(name="python")
+    pipeline.open_spider(spider)
+
+    _scrape(pipeline, spider)
+    _scrape(pipeline, spider)
+    pipeline.close_spider(spider)
+
+    assert pipeline.indexed_count == 1
+
+    index = CodeIndex(tmp_path / "code.db")
+    assert len(list(index.blocks())) == 3
+    shell = list(index.blocks(language="bash"))
+    assert shell[0]["url"] == URL
+    assert shell[0]["heading"] == "Shell"
+    assert [b["ordinal"] for b in index.blocks(contains="asyncio")] == [2]
+    assert list(index.blocks(version="3.12")) == []
+    index.close()
+
+
+def test_pipeline_skips_dropped_and_duplicate_documents(tmp_path: Path) -> None:
+    """버려진 문서와 유사 중복으로 표시된 문서는 인덱싱하지 않음."""
+    pipeline = CodeIndexPipeline(index_path=tmp_path / "code.db")
+    spider = Spider(name="python")
+    pipeline.open_spider(spider)
+
+    document = _document()
+    pipeline.process_item(document, spider)
+    pipeline.discard(document, spider, exception=DropItem("중복 URL"))
+    pipeline.item_scraped(document.model_dump(mode="json"), spider)
+    _scrape(pipeline, spider, duplicate_of="0" * 32)
+
+    assert pipeline.indexed_count == 0
+    assert pipeline.pending == {}
+    pipeline.close_spider(spider)
+
+
+def test_pipelines_share_database(tmp_path: Path) -> None:
+    """같은 DB를 쓰는 두 파이프라인이 번갈아 기록해도 잠금 대기 없음."""
+    path = tmp_path / "code.db"
+    spider = Spider(name="python")
+    pipelines = [CodeIndexPipeline(index_path=path) for _ in range(2)]
+    for pipeline in pipelines:
+        pipeline.open_spider(spider)
+
+    for version in ("3.12", "3.13"):
+        for number, pipeline in enumerate(pipelines):
+            url = URL.replace("3.13", version).replace("index", f"page{number}")
+            document = _document().model_copy(update={"version": version, "url": url})
+            pipeline.process_item(document, spider)
+            pipeline.item_scraped(document.model_dump(mode="json"), spider)
+
+    for pipeline in pipelines:
+        pipeline.close_spider(spider)
+    assert [p.indexed_count for p in pipelines] == [2, 2]
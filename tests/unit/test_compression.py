@@ -0,0 +1,162 @@
+"""본문 사전 압축 단위 테스트."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+from scrapy.settings import Settings
+
+from pydoc_crawler.compression import (
+    BodyCodec,
+    compress_jsonl,
+    dictionary_path_for,
+    train_dictionary,
+)
+from pydoc_crawler.jsonl_index import JsonlReader, iter_records
+from pydoc_crawler.pipelines import JsonLinesPipeline
+
+pytest.importorskip("zstandard")
+
+BOILERPLATE = """# {name}
+
+This page is part of the Python {version} documentation.
+
+## Functions
+
+.. function:: {name}(x)
+
+   Return the {name} of *x*. Raises :exc:`TypeError` if the argument
+   is not a number. See also :ref:`numeric-types` and :mod:`math`.
+
+```python
+>>> {name}({index})
+{index}
+```
+"""
+
+
+def _items(count: int = 300) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"{version}/f{i}",
+            "source": "python",
+            "version": version,
+            "url": f"https://docs.python.org/{version}/library/f{i}.html",
+            "title": f"f{i}",
+            "content_markdown": BOILERPLATE.format(
+                name=f"func{i}", version=version, index=i
+            ),
+        }
+        for i in range(count)
+        for version in ("3.12", "3.13")
+    ]
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    path = tmp_path / "python_output.jsonl"
+    path.write_text(
+        "".join(json.dumps(item) + "\n" for item in _items()), encoding="utf-8"
+    )
+    return path
+
+
+@pytest.fixture
+def dictionary() -> bytes:
+    return train_dictionary(
+        (item["content_markdown"] for item in _items()), dict_size=16 * 1024
+    )
+
+
+def test_dictionary_improves_ratio(corpus: Path, dictionary: bytes) -> None:
+    """학습 사전이 문서 단위 압축률을 높이고 복원은 무손실."""
+    plain = compress_jsonl([corpus], corpus.with_name("plain.jsonl"), BodyCodec())
+    trained = compress_jsonl(
+        [corpus], corpus.with_name("trained.jsonl"), BodyCodec(dictionary)
+    )
+
+    assert trained.documents == 600
+    assert trained.ratio > plain.ratio * 1.5
+    assert trained.decode_mb_per_sec > 0
+    assert dictionary_path_for(corpus.with_name("trained.jsonl")).exists()
+
+
+def test_readers_decompress_transparently(corpus: Path, dictionary: bytes) -> None:
+    """스트리밍/랜덤 액세스 리더 모두 원본 본문 반환."""
+    output = corpus.with_name("compressed.jsonl")
+    compress_jsonl([corpus], output, BodyCodec(dictionary))
+
+    record = json.loads(output.read_text(encoding="utf-8").splitlines()[0])
+    assert "content_markdown" not in record
+    assert record["content_dict_id"] == BodyCodec(dictionary).dict_id
+
+    original = _items()
+    assert list(iter_records(output)) == original
+    with JsonlReader(output) as reader:
+        assert reader.get("3.13/f7") == next(
+            item for item in original if item["id"] == "3.13/f7"
+        )
+
+
+def test_mismatched_dictionary(corpus: Path, dictionary: bytes) -> None:
+    """다른 사전으로 압축된 레코드는 오류."""
+    record = BodyCodec(dictionary).encode_record(_items(1)[0])
+
+    with pytest.raises(ValueError, match="사전 불일치"):
+        BodyCodec().decode_record(record)
+
+
+def test_pipeline_compresses_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dictionary: bytes
+) -> None:
+    """BODY_COMPRESSION 설정 시 JSONL 본문 압축 및 사전 사이드카 저장."""
+    monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path)
+    dict_path = tmp_path / "content.zdict"
+    dict_path.write_bytes(dictionary)
+    settings = Settings(
+        {"BODY_COMPRESSION": True, "BODY_COMPRESSION_DICT": str(dict_path)}
+    )
+
+    spider = Spider(name="python")
+    spider.settings = settings
+    pipeline = JsonLinesPipeline(codec=BodyCodec.from_settings(settings))
+    pipeline.open_spider(spider)
+    item = _items(1)[0]
+    assert pipeline.process_item(item, spider) is item
+    pipeline.close_spider(spider)
+
+    output = tmp_path / "python_output.jsonl"
+    assert "content_zstd" in output.read_text(encoding="utf-8")
+    with JsonlReader(output) as reader:
+        assert reader.get("3.12/f0") == item
+
+
+def test_resume_refuses_different_dictionary(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dictionary: bytes
+) -> None:
+    """재개 시 사전이 바뀌면 기존 사전을 덮어쓰지 않고 중단."""
+    monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path)
+    job_dir = tmp_path / "job"
+    spider = Spider(name="python")
+    spider.settings = Settings(
+        {"CRAWL_JOB_DIR": str(job_dir), "JOBDIR": str(job_dir / "python-3.13")}
+    )
+    output = tmp_path / "python_output.jsonl"
+
+    pipeline = JsonLinesPipeline(codec=BodyCodec(dictionary))
+    pipeline.open_spider(spider)
+    item = _items(1)[0]
+    pipeline.process_item(item, spider)
+    pipeline.close_spider(spider)
+
+    with pytest.raises(ValueError, match="사전 불일치"):
+        JsonLinesPipeline(codec=BodyCodec()).open_spider(spider)
+    assert dictionary_path_for(output).read_bytes() == dictionary
+
+    pipeline = JsonLinesPipeline(codec=BodyCodec(dictionary))
+    pipeline.open_spider(spider)
+    pipeline.close_spider(spider)
+    with JsonlReader(output) as reader:
+        assert reader.get("3.12/f0") == item
@@ -0,0 +1,270 @@
+"""감시(watch) 모드 단위 테스트."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+from scrapy.settings import Settings
+from twisted.internet import defer
+from twisted.web.test.requesthelper import DummyRequest
+
+from pydoc_crawler import warm
+from pydoc_crawler.daemon import (
+    CrawlDaemon,
+    StatusResource,
+    WatchTarget,
+    load_targets,
+)
+from pydoc_crawler.jsonl_index import JsonlReader
+from pydoc_crawler.pipelines import JsonLinesPipeline
+from pydoc_crawler.search import SearchIndex
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeStats:
+    def __init__(self, stats: dict[str, Any]) -> None:
+        self.stats = stats
+
+    def get_stats(self) -> dict[str, Any]:
+        return self.stats
+
+
+class FakeCrawler:
+    def __init__(self, spider: str) -> None:
+        self.spider = spider
+        self.stats = FakeStats({"finish_reason": "finished"})
+
+
+class FakeRunner:
+    """크롤링 요청을 기록하고, ``pending``이면 완료를 보류."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.pending: defer.Deferred[None] | None = None
+
+    def create_crawler(self, spider: str) -> FakeCrawler:
+        return FakeCrawler(spider)
+
+    def crawl(self, crawler: FakeCrawler, **kwargs: Any) -> defer.Deferred[None]:
+        self.calls.append((crawler.spider, kwargs))
+        crawler.stats.stats["item_scraped_count"] = 3
+        self.pending = defer.Deferred()
+        return self.pending
+
+
+def test_load_targets_from_settings() -> None:
+    """설정의 대상 필터링 및 주기 덮어쓰기."""
+    settings = Settings(
+        {
+            "WATCH_TARGETS": [
+                {"version": "3.13", "interval_hours": 6},
+                {"version": "3.12", "interval_hours": 24},
+            ]
+        }
+    )
+
+    assert [(t.version, t.interval) for t in load_targets(settings)] == [
+        ("3.13", 6 * 3600),
+        ("3.12", 24 * 3600),
+    ]
+    targets = load_targets(settings, versions=["3.12", "3.9"], interval_hours=1)
+    assert [(t.version, t.interval) for t in targets] == [
+        ("3.12", 3600),
+        ("3.9", 3600),
+    ]
+
+
+def test_load_targets_spider() -> None:
+    """스파이더 필터와, 설정에 없는 버전의 스파이더 지정."""
+    settings = Settings(
+        {
+            "WATCH_SPIDER": "fastapi",
+            "WATCH_TARGETS": [
+                {"spider": "python", "version": "3.13"},
+                {"version": "0.115"},
+            ],
+        }
+    )
+
+    assert [t.key for t in load_targets(settings)] == ["python-3.13", "fastapi-0.115"]
+    targets = load_targets(settings, versions=["3.13", "3.12"], spider="python")
+    assert [t.key for t in targets] == ["python-3.13", "python-3.12"]
+
+
+def test_daemon_runs_due_targets_sequentially() -> None:
+    """한 번에 하나씩, 주기가 된 대상만 재수집 모드로 실행."""
+    clock = FakeClock()
+    runner = FakeRunner()
+    daemon = CrawlDaemon(
+        runner,
+        [WatchTarget("python", "3.13", 60), WatchTarget("python", "3.12", 600)],
+        clock=clock,
+    )
+
+    daemon.tick()
+    assert runner.calls == [("python", {"version": "3.13", "refresh": True})]
+    assert daemon.tick() is None  # 실행 중에는 새 크롤링 시작 안 함
+
+    clock.now += 5
+    assert runner.pending is not None
+    runner.pending.callback(None)
+    first = daemon.targets[0]
+    assert first.runs == 1
+    assert first.next_run == 1065
+    assert first.last_duration == 5
+    assert first.last_stats == {"finish_reason": "finished", "item_scraped_count": 3}
+
+    daemon.tick()
+    runner.pending.callback(None)
+    assert [call[1]["version"] for call in runner.calls] == ["3.13", "3.12"]
+
+    assert daemon.tick() is None  # 다음 주기 전
+    clock.now += 60
+    daemon.tick()
+    assert runner.calls[-1][1]["version"] == "3.13"
+
+
+def test_failed_crawl_is_rescheduled() -> None:
+    """크롤링 오류도 기록 후 다음 주기에 다시 예약."""
+    runner = FakeRunner()
+    daemon = CrawlDaemon(runner, [WatchTarget("python", "3.13", 60)], clock=FakeClock())
+
+    daemon.tick()
+    assert runner.pending is not None
+    runner.pending.errback(RuntimeError("boom"))
+
+    target = daemon.targets[0]
+    assert target.last_result == "error: boom"
+    assert daemon.running is None
+    assert target.next_run == 1060
+
+
+def test_crawler_creation_error_keeps_loop() -> None:
+    """크롤러 생성 예외는 실패로 기록하고 다음 대상 예약은 계속."""
+
+    class BrokenRunner(FakeRunner):
+        def create_crawler(self, spider: str) -> FakeCrawler:
+            if spider == "missing":
+                raise KeyError(f"Spider not found: {spider}")
+            return super().create_crawler(spider)
+
+    runner = BrokenRunner()
+    daemon = CrawlDaemon(
+        runner,
+        [WatchTarget("missing", "1.0", 60), WatchTarget("python", "3.13", 60)],
+        clock=FakeClock(),
+    )
+
+    assert daemon.tick() is None
+    broken = daemon.targets[0]
+    assert broken.last_result == "error: 'Spider not found: missing'"
+    assert broken.next_run == 1060
+    assert daemon.running is None
+
+    daemon.tick()
+    assert runner.calls == [("python", {"version": "3.13", "refresh": True})]
+
+
+def test_refresh_ticks_merge_into_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """재수집 실행은 출력을 비우지 않고 바뀐 페이지만 기존 출력에 병합."""
+    monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path)
+
+    def page(name: str, body: str) -> dict[str, Any]:
+        url = f"https://docs.python.org/3.13/tutorial/{name}.html"
+        return {
+            "id": name,
+            "source": "python",
+            "version": "3.13",
+            "url": url,
+            "title": name,
+            "content_markdown": body,
+        }
+
+    class PipelineRunner(FakeRunner):
+        """틱마다 정해진 페이지를 실제 JsonLinesPipeline으로 기록."""
+
+        ticks = [
+            [page("index", "목차"), page("appetite", "처음")],
+            [page("appetite", "수정"), page("interpreter", "새 페이지")],
+        ]
+
+        def crawl(self, crawler: FakeCrawler, **kwargs: Any) -> defer.Deferred[None]:
+            self.calls.append((crawler.spider, kwargs))
+            spider = Spider(name=crawler.spider, **kwargs)
+            spider.settings = Settings()
+            pipeline = JsonLinesPipeline()
+            pipeline.open_spider(spider)
+            for item in self.ticks[len(self.calls) - 1]:
+                pipeline.process_item(item, spider)
+            pipeline.close_spider(spider)
+            return defer.succeed(None)
+
+    clock = FakeClock()
+    daemon = CrawlDaemon(
+        PipelineRunner(), [WatchTarget("python", "3.13", 60)], clock=clock
+    )
+    daemon.tick()
+    clock.now += 60
+    daemon.tick()
+
+    output = tmp_path / "python_3.13_output.jsonl"
+    with JsonlReader(output) as reader:
+        assert len(reader) == 3
+        assert [doc["content_markdown"] for doc in reader.iter()] == [
+            "목차",
+            "수정",
+            "새 페이지",
+        ]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "python_3.13_output.jsonl",
+        "python_3.13_output.jsonl.idx",
+    ]
+
+
+def test_status_endpoint() -> None:
+    """상태 리소스는 대상별 상태를 JSON으로 반환."""
+    daemon = CrawlDaemon(
+        FakeRunner(), [WatchTarget("python", "3.13", 60)], clock=FakeClock()
+    )
+    daemon.tick()
+
+    request = DummyRequest([b""])
+    body = json.loads(StatusResource(daemon).render_GET(request))
+
+    assert body["running"] == "python-3.13"
+    assert body["targets"][0]["version"] == "3.13"
+    assert request.responseHeaders.getRawHeaders(b"Content-Type") == [
+        b"application/json; charset=utf-8"
+    ]
+
+
+def test_warm_store_reused(tmp_path: Path) -> None:
+    """공유 저장소는 실행 간 같은 연결을 재사용하고 종료 시 닫음."""
+    path = tmp_path / "search.db"
+    try:
+        first = warm.open_store(SearchIndex, path, shared=True)
+        warm.release_store(first, shared=True)
+        assert warm.open_store(SearchIndex, path, shared=True) is first
+        assert warm.get_state("dedup:python", list) is warm.get_state(
+            "dedup:python", list
+        )
+    finally:
+        warm.clear()
+
+    assert warm.open_store(SearchIndex, path, shared=True) is not first
+    warm.clear()
+
+    unshared = warm.open_store(SearchIndex, path)
+    assert unshared is not warm.open_store(SearchIndex, path)
+    warm.release_store(unshared)
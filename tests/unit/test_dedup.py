@@ -0,0 +1,162 @@
+"""유사 중복 탐지 단위 테스트."""
+
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+from scrapy.exceptions import DropItem
+
+np = pytest.importorskip("numpy")
+
+from pydoc_crawler.dedup import MinHasher, find_duplicates  # noqa: E402
+from pydoc_crawler.items import DocumentItem  # noqa: E402
+from pydoc_crawler.pipelines import DedupPipeline  # noqa: E402
+
+
+def _corpus(size: int = 40, words: int = 300) -> list[str]:
+    rng = random.Random(0)
+    vocabulary = [f"word{i}" for i in range(3000)]
+    return [" ".join(rng.choices(vocabulary, k=words)) for _ in range(size)]
+
+
+def _document(version: str, content: str) -> dict[str, Any]:
+    item = DocumentItem(
+        source="python",
+        version=version,
+        url=f"https://docs.python.org/{version}/library/functions.html",
+        title="Built-in Functions",
+        content_markdown=content,
+    )
+    result: dict[str, Any] = item.model_dump(mode="json")
+    return result
+
+
+class TestMinHasher:
+    """MinHasher 테스트."""
+
+    def test_batched_signatures_match_single(self) -> None:
+        """배치 계산 결과가 문서별 계산과 동일."""
+        hasher = MinHasher(num_perm=64)
+        texts = _corpus(size=10)
+
+        batched = hasher.signatures(texts)
+        single = np.vstack([hasher.signatures([text]) for text in texts])
+
+        assert np.array_equal(batched, single)
+
+    def test_similarity_estimate(self) -> None:
+        """거의 같은 문서는 높은 추정 유사도, 다른 문서는 낮은 유사도."""
+        base, other = _corpus(size=2)
+        near = base.replace(base.split()[10], "Python 3.12 banner", 1)
+
+        signatures = MinHasher().signatures([base, near, other])
+
+        assert np.mean(signatures[0] == signatures[1]) > 0.8
+        assert np.mean(signatures[0] == signatures[2]) < 0.1
+
+
+class TestFindDuplicates:
+    """find_duplicates 테스트."""
+
+    def test_clusters_near_duplicates(self) -> None:
+        """버전 배너만 다른 문서를 하나의 클러스터로 묶음."""
+        texts = _corpus()
+        near = [text.replace(text.split()[5], "version 3.12", 1) for text in texts[:5]]
+        ids = [f"doc{i}" for i in range(len(texts) + len(near))]
+        sizes = [len(text) for text in texts + near]
+
+        report = find_duplicates(
+            ids, MinHasher().signatures(texts + near), sizes, threshold=0.8
+        )
+
+        assert report.duplicate_count == 5
+        assert {cluster.representative for cluster in report.clusters} == {
+            f"doc{i}" for i in range(5)
+        }
+        assert report.bytes_saved == sum(sizes[len(texts) :])
+
+    def test_empty_documents_are_not_duplicates(self) -> None:
+        """셔글이 없는 문서끼리는 중복으로 보지 않음."""
+        report = find_duplicates(["a", "b"], MinHasher().signatures(["", ""]))
+
+        assert report.duplicate_count == 0
+
+
+class TestDedupPipeline:
+    """DedupPipeline 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def data_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path)
+        return tmp_path
+
+    def test_mark_mode(self, data_dir: Path) -> None:
+        """mark 모드는 duplicate_of 필드 추가 후 보고서 기록."""
+        spider = Spider(name="python")
+        text = _corpus(size=1)[0]
+        pipeline = DedupPipeline(threshold=0.8)
+
+        first = pipeline.process_item(_document("3.13", text), spider)
+        second = pipeline.process_item(
+            _document("3.12", text.replace(text.split()[0], "3.12", 1)), spider
+        )
+        pipeline.close_spider(spider)
+
+        assert "duplicate_of" not in first
+        assert second["duplicate_of"] == first["id"]
+        assert (data_dir / "python_dedup_report.json").exists()
+
+    def test_drop_mode(self) -> None:
+        """drop 모드는 중복 문서를 DropItem으로 제거."""
+        spider = Spider(name="python")
+        text = _corpus(size=1)[0]
+        pipeline = DedupPipeline(mode="drop")
+
+        pipeline.process_item(_document("3.13", text), spider)
+        with pytest.raises(DropItem):
+            pipeline.process_item(_document("3.12", text), spider)
+
+    def test_batch_hashed_in_one_call(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """배치 서명은 한 번에 계산하고, 배치 안에서도 먼저 온 문서가 대표."""
+        spider = Spider(name="python")
+        texts = _corpus(size=2)
+        pipeline = DedupPipeline(threshold=0.8, batch_size=8)
+        calls: list[int] = []
+        signatures = pipeline.hasher.signatures
+
+        def counting(batch: list[str]) -> Any:
+            calls.append(len(batch))
+            return signatures(batch)
+
+        monkeypatch.setattr(pipeline.hasher, "signatures", counting)
+        first, second, other = pipeline.process_batch(
+            [
+                _document("3.13", texts[0]),
+                _document("3.12", texts[0]),
+                _document("3.11", texts[1]),
+            ],
+            spider,
+        )
+
+        assert calls == [3]
+        assert second["duplicate_of"] == first["id"]
+        assert "duplicate_of" not in other
+
+    def test_changed_document_replaces_signature(self) -> None:
+        """다시 수집된 문서의 내용이 바뀌면 예전 서명을 교체."""
+        spider = Spider(name="python")
+        old, new = _corpus(size=2)
+        pipeline = DedupPipeline(threshold=0.8)
+
+        pipeline.process_item(_document("3.13", old), spider)
+        pipeline.process_item(_document("3.13", new), spider)
+
+        assert len(pipeline.index.signatures) == 1
+        # 예전 내용의 사본은 더 이상 중복이 아니고, 새 내용의 사본은 중복
+        assert "duplicate_of" not in pipeline.process_item(
+            _document("3.12", old), spider
+        )
+        copy = pipeline.process_item(_document("3.11", new), spider)
+        assert copy["duplicate_of"] == _document("3.13", new)["id"]
@@ -0,0 +1,162 @@
+"""JSONL 사이드카 인덱스 및 리더 단위 테스트."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+from scrapy.settings import Settings
+
+from pydoc_crawler.jsonl_index import (
+    JsonlReader,
+    delta_path_for,
+    index_path_for,
+    load_index,
+    repair_index,
+)
+from pydoc_crawler.pipelines import JsonLinesPipeline
+
+
+def _item(index: int, version: str = "3.13") -> dict[str, Any]:
+    return {
+        "id": f"id{index}",
+        "source": "python",
+        "version": version,
+        "url": f"https://docs.python.org/{version}/tutorial/page{index}.html",
+        "title": f"페이지 {index}",
+        "content_markdown": f"# 페이지 {index}",
+    }
+
+
+@pytest.fixture
+def output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """JsonLinesPipeline으로 기록한 출력 (3.13 3개, 3.12 2개)."""
+    monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path)
+    spider = Spider(name="python")
+    spider.settings = Settings()
+    pipeline = JsonLinesPipeline()
+    pipeline.open_spider(spider)
+    for i in range(3):
+        pipeline.process_item(_item(i), spider)
+    for i in range(3, 5):
+        pipeline.process_item(_item(i, "3.12"), spider)
+    pipeline.close_spider(spider)
+    return tmp_path / "python_output.jsonl"
+
+
+def test_pipeline_writes_index(output: Path) -> None:
+    """인덱스 오프셋/길이가 실제 줄 위치와 일치 (멀티바이트 포함)."""
+    data = output.read_bytes()
+    entries = load_index(output)
+
+    assert len(entries) == 5
+    for entry in entries:
+        line = data[entry.offset : entry.end]
+        assert line.endswith(b"\n")
+        assert json.loads(line)["url"] == entry.url
+    assert entries[-1].end == len(data)
+
+
+def test_concurrent_versions_keep_separate_outputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """--all-versions처럼 동시에 도는 버전별 크롤러는 각자 출력/인덱스를 기록."""
+    monkeypatch.setattr("pydoc_crawler.settings.DATA_DIR", tmp_path)
+    crawls = []
+    for version in ("3.12", "3.13"):
+        spider = Spider(name="python", version=version)
+        spider.settings = Settings()
+        pipeline = JsonLinesPipeline()
+        pipeline.open_spider(spider)
+        crawls.append((version, spider, pipeline))
+
+    # 두 크롤러의 아이템이 번갈아 도착
+    for i in range(4):
+        for version, spider, pipeline in crawls:
+            pipeline.process_item(_item(i, version) | {"id": f"{version}-{i}"}, spider)
+    for _, spider, pipeline in crawls:
+        pipeline.close_spider(spider)
+
+    for version, _, _ in crawls:
+        with JsonlReader(tmp_path / f"python_{version}_output.jsonl") as reader:
+            assert len(reader) == 4
+            for i in range(4):
+                doc = reader.get(f"{version}-{i}")
+                assert doc is not None
+                assert doc["version"] == version
+                assert reader.get_by_url(_item(i, version)["url"]) == doc
+
+
+@pytest.mark.parametrize(
+    "partial", [{"changed_urls": ["page1.html"]}, {"refresh": True}]
+)
+def test_partial_crawl_merges_into_output(
+    output: Path, partial: dict[str, Any]
+) -> None:
+    """--changed/--refresh 실행은 출력을 비우지 않고 같은 URL의 문서만 교체."""
+    spider = Spider(name="python", **partial)
+    spider.settings = Settings()
+    pipeline = JsonLinesPipeline()
+    pipeline.open_spider(spider)
+    pipeline.process_item(_item(1) | {"title": "바뀐 페이지"}, spider)
+    pipeline.process_item(_item(9), spider)
+    pipeline.close_spider(spider)
+
+    with JsonlReader(output) as reader:
+        assert [doc["id"] for doc in reader.iter()] == [
+            "id0",
+            "id2",
+            "id3",
+            "id4",
+            "id1",
+            "id9",
+        ]
+        doc = reader.get("id1")
+        assert doc is not None
+        assert doc["title"] == "바뀐 페이지"
+    assert not delta_path_for(output).exists()
+
+
+class TestJsonlReader:
+    """JsonlReader 테스트."""
+
+    def test_lookup(self, output: Path) -> None:
+        """ID/URL로 해당 문서만 조회."""
+        with JsonlReader(output) as reader:
+            assert len(reader) == 5
+            doc = reader.get_by_url("https://docs.python.org/3.12/tutorial/page4.html")
+            assert doc is not None
+            assert doc["title"] == "페이지 4"
+            assert reader.get("id1") == _item(1)
+            assert reader.get("missing") is None
+
+    def test_filtered_stream(self, output: Path) -> None:
+        """조건에 맞는 문서만 파일 순서대로 스트리밍."""
+        with JsonlReader(output) as reader:
+            assert [d["id"] for d in reader.iter(version="3.12")] == ["id3", "id4"]
+            assert [d["id"] for d in reader.iter(ids=["id2", "id0"])] == [
+                "id0",
+                "id2",
+            ]
+
+    def test_builds_missing_index(self, output: Path) -> None:
+        """인덱스가 없는 파일(피드 출력 등)은 한 번 스캔해 생성."""
+        index_path_for(output).unlink()
+
+        with JsonlReader(output) as reader:
+            assert reader.get("id3") == _item(3, "3.12")
+        assert len(load_index(output)) == 5
+
+
+def test_repair_index_drops_stale_and_adds_tail(output: Path) -> None:
+    """파일보다 긴 항목은 버리고, 인덱스에 없는 뒷부분 줄은 추가."""
+    index_path = index_path_for(output)
+    lines = index_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    index_path.write_text("".join(lines[:2]), encoding="utf-8")
+
+    assert [entry.id for entry in repair_index(output)] == [f"id{i}" for i in range(5)]
+
+    data = output.read_bytes()
+    output.write_bytes(data[: load_index(output)[3].end])
+    assert [entry.id for entry in repair_index(output)] == [f"id{i}" for i in range(4)]
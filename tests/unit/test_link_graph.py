@@ -0,0 +1,130 @@
+"""링크 그래프(역링크 인덱스) 단위 테스트."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from scrapy.crawler import Crawler
+from scrapy.http import HtmlResponse, Request
+from scrapy.statscollectors import MemoryStatsCollector
+
+from pydoc_crawler.link_graph import LinkGraph
+from pydoc_crawler.spiders.python_spider import PythonDocsSpider
+
+BASE = "https://docs.python.org/3.13/tutorial"
+
+
+def _spider(graph_path: Path, **kwargs: Any) -> PythonDocsSpider:
+    crawler = Crawler(
+        PythonDocsSpider,
+        {"LINK_GRAPH_ENABLED": True, "LINK_GRAPH_PATH": str(graph_path)},
+    )
+    crawler.stats = MemoryStatsCollector(crawler)
+    spider: PythonDocsSpider = PythonDocsSpider.from_crawler(crawler, **kwargs)
+    return spider
+
+
+def _page(name: str, *targets: str) -> HtmlResponse:
+    links = "".join(f'<a href="{target}">{target} 링크</a>' for target in targets)
+    return HtmlResponse(
+        url=f"{BASE}/{name}",
+        body=f"<html><body>{links}</body></html>".encode(),
+        encoding="utf-8",
+        request=Request(f"{BASE}/{name}"),
+    )
+
+
+class TestLinkGraph:
+    """LinkGraph 테스트."""
+
+    def test_in_links_and_dependents(self, tmp_path: Path) -> None:
+        """대상별 역링크 조회, 변경 페이지 자신은 이웃에서 제외."""
+        graph = LinkGraph(tmp_path / "links.db")
+        graph.add("a", "c", "C로")
+        graph.add("b", "c")
+        graph.add("c", "a", "A로")
+        graph.add("c", "c")
+
+        assert graph.in_links("c") == [("a", "C로"), ("b", None)]
+        assert graph.out_links("c") == [("a", "A로")]
+        assert graph.dependents(["c"]) == {"a", "b"}
+        assert graph.dependents(["a", "c"]) == {"b"}
+        assert graph.dependents(["unknown"]) == set()
+        assert graph.stats() == {"urls": 3, "links": 3}
+
+    def test_clear_links(self, tmp_path: Path) -> None:
+        """다시 수집한 페이지의 이전 링크만 교체."""
+        graph = LinkGraph(tmp_path / "links.db")
+        graph.add("a", "b")
+        graph.add("c", "b")
+        graph.close()
+
+        graph = LinkGraph(tmp_path / "links.db")
+        graph.clear_links("a")
+        graph.add("a", "d")
+
+        assert graph.in_links("b") == [("c", None)]
+        assert graph.in_links("d") == [("a", None)]
+
+
+class TestSpiderLinks:
+    """PythonDocsSpider 링크 기록 및 대상 수집 테스트."""
+
+    def test_records_rule_links(self, tmp_path: Path) -> None:
+        """규칙이 따라가는 링크만 앵커 텍스트와 함께 정규화된 URL로 기록."""
+        spider = _spider(tmp_path / "links.db")
+        response = _page("index.html", "controlflow.html", "../library/os.html")
+        requests = list(spider._requests_to_follow(response))
+        back = _page("controlflow.html", "index.html")
+        requests += spider._requests_to_follow(back)
+        spider.closed("finished")
+
+        assert [request.url for request in requests] == [
+            f"{BASE}/controlflow.html",
+            f"{BASE}/index.html",
+        ]
+        graph = LinkGraph(tmp_path / "links.db")
+        assert graph.in_links(f"{BASE}/controlflow.html") == [
+            (f"{BASE}/", "controlflow.html 링크")
+        ]
+        assert graph.in_links(f"{BASE}/") == [
+            (f"{BASE}/controlflow.html", "index.html 링크")
+        ]
+
+    def test_spiders_share_graph_database(self, tmp_path: Path) -> None:
+        """같은 DB를 쓰는 두 스파이더가 응답을 번갈아 처리해도 잠금 대기 없음."""
+        path = tmp_path / "links.db"
+        spiders = [_spider(path), _spider(path)]
+
+        for name in ("index.html", "controlflow.html"):
+            for spider in spiders:
+                next(spider._requests_to_follow(_page(name, "errors.html")))
+
+        graph = LinkGraph(path)
+        assert [source for source, _ in graph.in_links(f"{BASE}/errors.html")] == [
+            f"{BASE}/",
+            f"{BASE}/controlflow.html",
+        ]
+        graph.close()
+
+    def test_changed_pages_and_in_link_neighbors(self, tmp_path: Path) -> None:
+        """변경 페이지와 이를 링크하는 페이지만 요청하고 다른 링크는 따라가지 않음."""
+        graph = LinkGraph(tmp_path / "links.db")
+        graph.add(f"{BASE}/", f"{BASE}/controlflow.html")
+        graph.add(f"{BASE}/introduction.html", f"{BASE}/controlflow.html")
+        graph.add(f"{BASE}/", f"{BASE}/errors.html")
+        graph.close()
+
+        spider = _spider(tmp_path / "links.db", changed="controlflow.html#for")
+
+        async def collect() -> list[str]:
+            return [request.url async for request in spider.start()]
+
+        assert asyncio.run(collect()) == [
+            f"{BASE}/",
+            f"{BASE}/controlflow.html",
+            f"{BASE}/introduction.html",
+        ]
+        response = _page("index.html", "errors.html", "controlflow.html")
+        assert list(spider._requests_to_follow(response)) == [None, None]
+        assert spider.crawler.stats.get_value("linkgraph/skipped") == 1
@@ -0,0 +1,82 @@
+"""메모리 예산/측정 단위 테스트."""
+
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+from twisted.internet import defer
+
+from pydoc_crawler.memory import MemoryBudget, PeakMemoryTracker
+from pydoc_crawler.middlewares import (
+    MemoryBudgetDownloaderMiddleware,
+    MemoryBudgetSpiderMiddleware,
+)
+
+
+def _response(url: str, size: int) -> HtmlResponse:
+    request = Request(url)
+    return HtmlResponse(url, body=b"x" * size, request=request)
+
+
+def test_budget_wakes_waiters_when_released() -> None:
+    """상한 도달 시 대기, 해제되면 대기 중인 요청 진행."""
+    budget = MemoryBudget(limit=100)
+    first = budget.reserve(60)
+    assert budget.wait().called
+
+    second = budget.reserve(60)
+    waiter = budget.wait()
+    assert budget.exhausted
+    assert not waiter.called
+
+    first.release()
+    first.release()  # 중복 해제는 무시
+    assert waiter.called
+    assert budget.in_flight == 60
+    assert budget.peak == 120
+
+    second.release()
+    assert budget.in_flight == 0
+
+
+def test_unlimited_budget_never_blocks() -> None:
+    budget = MemoryBudget(limit=0)
+    budget.reserve(10**9)
+    assert budget.wait().called
+
+
+def test_middlewares_apply_backpressure() -> None:
+    """응답 본문이 파싱 완료 전까지 예산을 차지하고, 초과 시 새 요청 대기."""
+    crawler = get_crawler(settings_dict={"MEMORY_INFLIGHT_BYTES": 1000})
+    crawler.stats.open_spider()
+    downloader = MemoryBudgetDownloaderMiddleware.from_crawler(crawler)
+    spider_mw = MemoryBudgetSpiderMiddleware()
+
+    response = _response("https://docs.python.org/3.13/library/stdtypes.html", 1500)
+    downloader.process_response(response.request, response)
+    assert downloader.budget.in_flight == 1500
+
+    blocked = defer.ensureDeferred(
+        downloader.process_request(Request("https://docs.python.org/3.13/x.html"))
+    )
+    assert not blocked.called
+    assert crawler.stats.get_value("memory/backpressure_waits") == 1
+
+    output = spider_mw.process_spider_output(response, iter(["item"]))
+    assert list(output) == ["item"]
+    assert downloader.budget.in_flight == 0
+    assert blocked.called
+    assert crawler.stats.get_value("memory/inflight_peak_bytes") == 1500
+
+
+def test_peak_tracker_reports_heaviest_pages() -> None:
+    """페이지별 최대 메모리를 측정하고 상위 페이지만 보관."""
+    tracker = PeakMemoryTracker(top=2)
+    for url, size in [("small", 1024), ("large", 4 * 1024 * 1024), ("mid", 10**6)]:
+        with tracker.measure(url):
+            data = bytearray(size)
+            del data
+    tracker.stop()
+
+    report = tracker.report()
+    assert report["pages"] == 3
+    assert [page["url"] for page in report["top_pages"]] == ["large", "mid"]
+    assert report["max_peak_bytes"] >= 4 * 1024 * 1024
@@ -0,0 +1,140 @@
+"""Parquet 내보내기 단위 테스트."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+
+from pydoc_crawler.items import DocumentItem
+from pydoc_crawler.parquet import ParquetDatasetWriter, export_jsonl
+from pydoc_crawler.pipelines import ParquetExportPipeline
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _item(index: int, version: str = "3.13") -> dict[str, Any]:
+    item = DocumentItem(
+        source="python",
+        version=version,
+        url=f"https://docs.python.org/{version}/tutorial/page{index}.html",
+        title=f"Page {index}",
+        content_markdown=f"# Page {index}\n\n" + "body " * 50,
+    )
+    result: dict[str, Any] = item.model_dump(mode="json")
+    return result
+
+
+class TestParquetDatasetWriter:
+    """ParquetDatasetWriter 테스트."""
+
+    def test_partitions_and_schema(self, tmp_path: Path) -> None:
+        """source/version 파티션별 파일, source/version은 사전 인코딩."""
+        writer = ParquetDatasetWriter(tmp_path, row_group_rows=4)
+        for i in range(10):
+            writer.write(_item(i, "3.13"))
+        for i in range(3):
+            writer.write(_item(i, "3.12"))
+        stats = writer.close()
+
+        assert stats.rows == 13
+        assert len(stats.files) == 2
+
+        parquet_file = pq.ParquetFile(
+            tmp_path / "python" / "3.13" / "part-00000.parquet"
+        )
+        assert parquet_file.metadata.num_rows == 10
+        assert parquet_file.metadata.num_row_groups == 3  # 4 + 4 + 2
+        assert parquet_file.schema_arrow.field("version").type == pa.dictionary(
+            pa.int32(), pa.string()
+        )
+        column = parquet_file.metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+
+        table = pq.read_table(tmp_path / "python" / "3.12")
+        assert table.column("title").to_pylist() == ["Page 0", "Page 1", "Page 2"]
+
+    def test_buffer_limit_flushes_row_groups(self, tmp_path: Path) -> None:
+        """전체 버퍼가 상한을 넘으면 행 수와 무관하게 행 그룹 기록."""
+        writer = ParquetDatasetWriter(
+            tmp_path, row_group_rows=1000, max_buffer_bytes=600
+        )
+        for i in range(5):
+            writer.write(_item(i))
+            assert writer.buffered_bytes <= 600
+        stats = writer.close()
+
+        assert stats.row_groups >= 3
+
+    def test_appends_new_part(self, tmp_path: Path) -> None:
+        """기존 파트 파일은 덮어쓰지 않음."""
+        for _ in range(2):
+            writer = ParquetDatasetWriter(tmp_path, partition=False)
+            writer.write(_item(0))
+            writer.close()
+
+        assert sorted(p.name for p in tmp_path.glob("*.parquet")) == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+        ]
+
+    def test_new_part_after_highest_index(self, tmp_path: Path) -> None:
+        """앞 번호 파트가 지워져도 마지막 파트 다음 번호로 기록."""
+        for _ in range(2):
+            writer = ParquetDatasetWriter(tmp_path, partition=False)
+            writer.write(_item(0))
+            writer.close()
+        (tmp_path / "part-00000.parquet").unlink()
+
+        writer = ParquetDatasetWriter(tmp_path, partition=False)
+        writer.write(_item(1))
+        writer.close()
+
+        assert sorted(p.name for p in tmp_path.glob("*.parquet")) == [
+            "part-00001.parquet",
+            "part-00002.parquet",
+        ]
+        assert pq.read_table(tmp_path / "part-00001.parquet").num_rows == 1
+
+    def test_sanitized_keys_share_partition(self, tmp_path: Path) -> None:
+        """디렉토리 이름이 같아지는 버전은 한 파트 파일에 함께 기록."""
+        writer = ParquetDatasetWriter(tmp_path)
+        writer.write(_item(0, version="3.13/dev"))
+        writer.write(_item(1, version="3.13:dev"))
+        stats = writer.close()
+
+        assert stats.files == [
+            str(tmp_path / "python" / "3.13_dev" / "part-00000.parquet")
+        ]
+        table = pq.read_table(stats.files[0])
+        assert table.column("version").to_pylist() == ["3.13/dev", "3.13:dev"]
+
+
+def test_export_jsonl(tmp_path: Path) -> None:
+    """JSONL 출력에서 Parquet으로 변환 (행 내용 보존)."""
+    source = tmp_path / "python_output.jsonl"
+    items = [_item(i) for i in range(3)]
+    source.write_text(
+        "".join(json.dumps(item) + "\n" for item in items), encoding="utf-8"
+    )
+
+    export_jsonl([source], ParquetDatasetWriter(tmp_path / "parquet"))
+
+    rows = pq.read_table(tmp_path / "parquet" / "python" / "3.13").to_pylist()
+    assert [row["id"] for row in rows] == [item["id"] for item in items]
+    assert rows[0]["content_markdown"] == items[0]["content_markdown"]
+
+
+def test_pipeline(tmp_path: Path) -> None:
+    """ParquetExportPipeline은 크롤링 종료 시 파일을 닫음."""
+    pipeline = ParquetExportPipeline(root=str(tmp_path))
+    spider = Spider(name="python")
+
+    pipeline.open_spider(spider)
+    item = _item(0)
+    assert pipeline.process_item(item, spider) is item
+    pipeline.close_spider(spider)
+
+    assert pq.read_table(tmp_path / "python" / "3.13").num_rows == 1
@@ -0,0 +1,114 @@
+"""문서 엔진 감지 및 파서 레지스트리 단위 테스트."""
+
+from scrapy.http import HtmlResponse
+
+from pydoc_crawler.parsers import (
+    MkDocsParser,
+    ParserRegistry,
+    SphinxParser,
+    detect_engine,
+)
+
+SPHINX_HTML = b"""<html><head>
+<meta name="generator" content="Docutils 0.21: https://docutils.sourceforge.io/" />
+<title>Tutorial &#8212; Python 3.13 documentation</title>
+<script src="_static/documentation_options.js"></script>
+</head><body>
+<div class="sphinxsidebar"><p>sidebar</p></div>
+<div class="body">
+<h1>Tutorial<a class="headerlink" href="#">\xc2\xb6</a></h1>
+<div class="highlight-python3"><pre>print("hi")</pre></div>
+</div></body></html>"""
+
+MKDOCS_HTML = b"""<html><head>
+<meta name="generator" content="mkdocs-1.6.0, mkdocs-material-9.5.0">
+<title>First Steps - FastAPI</title>
+</head><body>
+<header class="md-header" data-md-component="header">header</header>
+<div class="md-content"><article class="md-content__inner">
+<a class="md-content__button" href="#">Edit</a>
+<h1>First Steps</h1>
+<div class="language-python highlight"><pre><code>app = FastAPI()</code></pre></div>
+</article></div></body></html>"""
+
+
+def _response(body: bytes, headers: dict[str, str] | None = None) -> HtmlResponse:
+    return HtmlResponse(
+        url="https://example.com/page.html",
+        body=body,
+        headers=headers,
+        encoding="utf-8",
+    )
+
+
+class TestDetectEngine:
+    """detect_engine 테스트."""
+
+    def test_generator_meta(self) -> None:
+        """generator meta 태그로 MkDocs 감지."""
+        assert detect_engine({}, MKDOCS_HTML) == "mkdocs"
+
+    def test_markers_fallback(self) -> None:
+        """generator가 엔진을 밝히지 않으면 Sphinx 흔적으로 감지."""
+        assert detect_engine({}, SPHINX_HTML) == "sphinx"
+
+    def test_header(self) -> None:
+        """X-Generator 헤더 우선."""
+        headers = _response(b"<html></html>", {"X-Generator": "MkDocs"}).headers
+        assert detect_engine(headers, b"<html></html>") == "mkdocs"
+
+    def test_unknown(self) -> None:
+        """흔적이 없으면 None."""
+        assert detect_engine({}, b"<html><body>plain</body></html>") is None
+
+    def test_engine_name_in_text_is_not_a_marker(self) -> None:
+        """본문의 엔진 이름이나 일반 정적 경로만으로는 감지하지 않음."""
+        body = b'<link href="_static/site.css"><p>Migrating from mkdocs</p>'
+        assert detect_engine({}, body) is None
+
+
+class TestParserRegistry:
+    """ParserRegistry 테스트."""
+
+    def test_dispatch(self) -> None:
+        """감지된 엔진의 파서로 파싱."""
+        registry = ParserRegistry()
+
+        sphinx = registry.parse(_response(SPHINX_HTML))
+        mkdocs = registry.parse(_response(MKDOCS_HTML))
+
+        assert sphinx["engine"] == "sphinx"
+        assert sphinx["title"] == "Tutorial"
+        assert "```python3" in sphinx["content_markdown"]
+        assert "sidebar" not in sphinx["content_markdown"]
+
+        assert mkdocs["engine"] == "mkdocs"
+        assert mkdocs["title"] == "First Steps"
+        assert "```python\napp = FastAPI()" in mkdocs["content_markdown"]
+        assert "Edit" not in mkdocs["content_markdown"]
+
+    def test_default_engine(self) -> None:
+        """감지 실패 시 기본 엔진 사용."""
+        registry = ParserRegistry()
+        response = _response(b"<html><body><main><h1>T</h1></main></body></html>")
+
+        assert registry.detect(response) == "sphinx"
+        assert isinstance(registry.parser_for(response), SphinxParser)
+
+    def test_sphinx_output_unchanged(self) -> None:
+        """레지스트리 경유 결과가 SphinxParser 직접 호출과 동일."""
+        response = _response(SPHINX_HTML)
+        result = ParserRegistry().parse(response)
+        result.pop("engine")
+
+        assert result == SphinxParser().parse(response)
+
+    def test_title_separator(self) -> None:
+        """<title> fallback 시 엔진별 구분자 사용."""
+        html = (
+            b"<html><head><title>Page - Site</title></head>"
+            b"<body><main>x</main></body></html>"
+        )
+        result = MkDocsParser().parse(_response(html))
+
+        assert result["title"] == "Page"
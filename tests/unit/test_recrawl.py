@@ -0,0 +1,140 @@
+"""변경 이력 기반 재수집 스케줄러 단위 테스트."""
+
+import time
+from pathlib import Path
+
+import pytest
+from scrapy import Spider
+from scrapy.crawler import Crawler
+from scrapy.http import Request
+from scrapy.statscollectors import MemoryStatsCollector
+
+from pydoc_crawler.link_graph import LinkGraph
+from pydoc_crawler.pipelines import RecrawlHistoryPipeline
+from pydoc_crawler.recrawl import DAY, RecrawlHistory, RecrawlPolicy
+from pydoc_crawler.spiders.python_spider import PythonDocsSpider
+
+BASE = "https://docs.python.org/3.13/tutorial"
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> RecrawlHistory:
+    """어제까지 30일간 매일 확인한 이력: volatile은 매번 변경, stable은 변경 없음."""
+    history = RecrawlHistory(tmp_path / "recrawl.db")
+    start = time.time() - 30 * DAY
+    for day in range(30):
+        now = start + day * DAY
+        history.record(f"{BASE}/volatile.html", f"hash{day}", now=now)
+        history.record(f"{BASE}/stable.html", "same", now=now)
+        history.record(f"{BASE}/index.html", "same", now=now)
+        history.record(f"{BASE}/toc.html", "same", now=now)
+    history.commit()
+    return history
+
+
+class TestRecrawlHistory:
+    """RecrawlHistory 테스트."""
+
+    def test_record_status(self, tmp_path: Path) -> None:
+        """new/unchanged/changed 상태 반환."""
+        history = RecrawlHistory(tmp_path / "recrawl.db")
+
+        assert history.record("u", "a", now=0) == "new"
+        assert history.record("u", "a", now=DAY) == "unchanged"
+        assert history.record("u", "b", now=2 * DAY) == "changed"
+
+        page = history.get("u")
+        assert page is not None
+        assert (page.checks, page.changes) == (3, 1)
+
+    def test_volatile_pages_are_prioritized(self, history: RecrawlHistory) -> None:
+        """자주 바뀌는 페이지는 재방문 대상이고 안정 페이지보다 우선순위가 높음."""
+        plan = history.plan(RecrawlPolicy(), prefix=BASE)
+        volatile = plan[f"{BASE}/volatile.html"]
+        stable = plan[f"{BASE}/stable.html"]
+
+        assert volatile.due
+        assert not stable.due
+        assert volatile.priority > stable.priority
+        assert stable.interval > volatile.interval
+
+    def test_plan_filters_by_prefix(self, history: RecrawlHistory) -> None:
+        """다른 섹션의 URL은 계획에 포함하지 않음."""
+        plan = history.plan(RecrawlPolicy(), prefix=f"{BASE}/vol")
+
+        assert list(plan) == [f"{BASE}/volatile.html"]
+        assert history.plan(RecrawlPolicy(), prefix="https://example.com/") == {}
+
+
+class TestSpiderScheduling:
+    """PythonDocsSpider 재수집 모드 요청 스케줄링 테스트."""
+
+    def _spider(self, history_path: Path, budget: int = 0) -> PythonDocsSpider:
+        crawler = Crawler(
+            PythonDocsSpider,
+            {
+                "RECRAWL_HISTORY_PATH": str(history_path),
+                "RECRAWL_REQUEST_BUDGET": budget,
+                "RECRAWL_HUB_MIN_LINKS": 3,
+                "LINK_GRAPH_ENABLED": True,
+                "LINK_GRAPH_PATH": str(history_path.parent / "links.db"),
+            },
+        )
+        crawler.stats = MemoryStatsCollector(crawler)
+        spider: PythonDocsSpider = PythonDocsSpider.from_crawler(crawler, refresh="1")
+        return spider
+
+    def test_stable_pages_are_skipped(
+        self, history: RecrawlHistory, tmp_path: Path
+    ) -> None:
+        """재방문 시점이 아닌 안정 페이지는 요청하지 않고, 새 페이지는 최우선."""
+        spider = self._spider(tmp_path / "recrawl.db")
+
+        volatile = spider.schedule_request(Request(f"{BASE}/volatile.html"), None)
+        assert volatile is not None
+        assert spider.schedule_request(Request(f"{BASE}/stable.html"), None) is None
+        new = spider.schedule_request(Request(f"{BASE}/new.html"), None)
+        assert new is not None
+        assert new.priority == 100
+
+    def test_request_budget(self, tmp_path: Path) -> None:
+        """예산을 넘는 요청은 제외."""
+        spider = self._spider(tmp_path / "empty.db", budget=2)
+
+        scheduled = [
+            spider.schedule_request(Request(f"{BASE}/page{i}.html"), None)
+            for i in range(4)
+        ]
+
+        assert sum(request is not None for request in scheduled) == 2
+
+    def test_stable_hub_pages_are_visited(
+        self, history: RecrawlHistory, tmp_path: Path
+    ) -> None:
+        """안정 페이지라도 index나 링크가 많은 목차 페이지는 방문."""
+        graph = LinkGraph(tmp_path / "links.db")
+        for name in ("a", "b", "c"):
+            graph.add(f"{BASE}/toc.html", f"{BASE}/{name}.html")
+        graph.close()
+        spider = self._spider(tmp_path / "recrawl.db")
+
+        for name in ("index.html", "toc.html"):
+            assert spider.schedule_request(Request(f"{BASE}/{name}"), None)
+        assert spider.schedule_request(Request(f"{BASE}/stable.html"), None) is None
+        assert spider.crawler.stats.get_value("recrawl/hub") == 2
+
+
+def test_history_pipelines_share_database(tmp_path: Path) -> None:
+    """같은 DB를 쓰는 두 크롤러의 이력 파이프라인이 번갈아 기록해도 잠기지 않음."""
+    spider = Spider(name="python")
+    pipelines = [RecrawlHistoryPipeline(tmp_path / "recrawl.db") for _ in range(2)]
+    for pipeline in pipelines:
+        pipeline.open_spider(spider)
+
+    for i in range(4):
+        item = {"url": f"{BASE}/p{i}.html", "content_hash": "h"}
+        pipelines[i % 2].process_item(item, spider)
+
+    for pipeline in pipelines:
+        pipeline.close_spider(spider)
+    assert len(RecrawlHistory(tmp_path / "recrawl.db").all()) == 4
@@ -0,0 +1,128 @@
+"""실행 성능 보고서 단위 테스트."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pydoc_crawler.cli import run_report
+from pydoc_crawler.run_report import RssSampler, RunHistory, RunSummary, compare_runs
+
+
+def _stats(**overrides: Any) -> dict[str, Any]:
+    return {
+        "elapsed_time_seconds": 50.0,
+        "finish_reason": "finished",
+        "downloader/response_count": 100,
+        "downloader/response_bytes": 4_000_000,
+        "downloader/response_status_count/304": 10,
+        "httpcache/hit": 30,
+        "httpcache/miss": 70,
+        "item_scraped_count": 90,
+        "recrawl/changed": 5,
+        "recrawl/changed/python/3.13": 5,
+        "recrawl/unchanged/python/3.13": 80,
+        "recrawl/new/python/3.12": 5,
+        **overrides,
+    }
+
+
+def _summary(**overrides: Any) -> RunSummary:
+    return RunSummary.from_stats(
+        _stats(**overrides),
+        spider="python",
+        version="3.13",
+        parse_latencies=[i / 1000 for i in range(1, 101)],
+        peak_rss=200 * 1024 * 1024,
+    )
+
+
+def test_summary_from_stats() -> None:
+    """통계에서 처리량, 비율, 지연 백분위수, source/version별 변경 수 계산."""
+    summary = _summary()
+
+    assert summary.pages_per_sec == 2.0
+    assert summary.cache_hit_rate == 0.3
+    assert summary.not_modified_rate == 0.1
+    assert (summary.parse_p50_ms, summary.parse_p95_ms, summary.parse_p99_ms) == (
+        50.0,
+        95.0,
+        99.0,
+    )
+    assert summary.item_changes == {
+        "python/3.13": {"new": 0, "changed": 5, "unchanged": 80},
+        "python/3.12": {"new": 5, "changed": 0, "unchanged": 0},
+    }
+
+
+def test_history_roundtrip(tmp_path: Path) -> None:
+    """기록한 요약을 그대로 읽고, 최근 실행부터 필터링 조회."""
+    history = RunHistory(tmp_path / "runs.db")
+    first = _summary()
+    history.add(first)
+    other = RunSummary.from_stats(_stats(), spider="python", version="3.12")
+    history.add(other)
+
+    assert history.get(first.id or 0) == first
+    assert [run.id for run in history.runs(version="3.13")] == [first.id]
+    assert [run.id for run in history.runs()] == [other.id, first.id]
+    assert history.runs(before=first.id) == []
+    history.close()
+
+
+def test_compare_runs_flags_regressions() -> None:
+    """처리량 감소와 최대 RSS 증가만 기준 중앙값 대비 허용치를 넘으면 회귀."""
+    baselines = [_summary(elapsed_time_seconds=s) for s in (48.0, 50.0, 80.0)]
+    current = _summary(elapsed_time_seconds=70.0)
+    current.peak_rss_bytes = 260 * 1024 * 1024
+
+    regressions = {r.metric: r for r in compare_runs(current, baselines)}
+
+    assert set(regressions) == {"pages_per_sec", "peak_rss_bytes"}
+    assert regressions["pages_per_sec"].baseline == 2.0
+    assert regressions["peak_rss_bytes"].change == pytest.approx(0.3)
+    assert compare_runs(_summary(), baselines) == []
+    assert compare_runs(current, []) == []
+
+
+def test_compare_runs_partial_thresholds() -> None:
+    """일부만 지정한 허용치는 기본값 위에 덮어씀."""
+    baselines = [_summary(elapsed_time_seconds=50.0)]
+    current = _summary(elapsed_time_seconds=55.0)
+    current.peak_rss_bytes = 260 * 1024 * 1024
+
+    regressions = compare_runs(current, baselines, {"throughput_drop": 0.05})
+
+    assert [r.metric for r in regressions] == ["pages_per_sec", "peak_rss_bytes"]
+
+
+def test_rss_sampler_is_per_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    """실행마다 새 측정기가 그 실행 동안의 최대 RSS만 보고."""
+    readings = iter([300, 500, 400, 200, 250])
+    monkeypatch.setattr(
+        "pydoc_crawler.run_report.current_rss_bytes", lambda: next(readings)
+    )
+
+    first = RssSampler()
+    first.sample()
+    first.sample()
+    assert first.stop() == 500
+
+    second = RssSampler()
+    second.sample()
+    assert second.stop() == 250
+
+
+def test_report_command(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """report 명령은 최근 실행을 이전 실행과 비교하고 회귀가 있으면 1 반환."""
+    path = tmp_path / "runs.db"
+    history = RunHistory(path)
+    for elapsed in (50.0, 52.0, 100.0):
+        history.add(_summary(elapsed_time_seconds=elapsed))
+    history.close()
+
+    assert run_report(["--history", str(path)]) == 1
+    assert "회귀: pages_per_sec" in capsys.readouterr().out
+
+    assert run_report(["2", "--history", str(path)]) == 0
+    assert "기준: 실행 #1" in capsys.readouterr().out
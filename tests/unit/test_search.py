@@ -0,0 +1,166 @@
+"""FTS5 검색 인덱스 단위 테스트."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+
+from pydoc_crawler.chunking import MarkdownChunker
+from pydoc_crawler.items import DocumentItem
+from pydoc_crawler.pipelines import SearchIndexPipeline
+from pydoc_crawler.search import SearchIndex, to_match_expression
+
+
+def _document(version: str, path: str, title: str, content: str) -> dict[str, Any]:
+    item = DocumentItem(
+        source="python",
+        version=version,
+        url=f"https://docs.python.org/{version}/{path}",
+        title=title,
+        content_markdown=content,
+    )
+    result: dict[str, Any] = item.model_dump(mode="json")
+    return result
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> SearchIndex:
+    index = SearchIndex(tmp_path / "search.db")
+    index.upsert(
+        _document(
+            "3.13",
+            "library/functions.html",
+            "Built-in Functions",
+            "# Built-in Functions\n\n## abs(x)\n\nReturn the absolute value.",
+        )
+    )
+    index.upsert(
+        _document(
+            "3.12",
+            "library/functions.html",
+            "Built-in Functions",
+            "# Built-in Functions\n\n## abs(x)\n\nReturn the absolute value.",
+        )
+    )
+    index.upsert(
+        _document(
+            "3.13",
+            "tutorial/classes.html",
+            "Classes",
+            "# Classes\n\nClasses provide a means of bundling data.",
+        )
+    )
+    return index
+
+
+class TestSearchIndex:
+    """SearchIndex 테스트."""
+
+    def test_search_returns_snippet(self, index: SearchIndex) -> None:
+        """검색어가 강조된 스니펫 반환."""
+        hits = index.search("absolute")
+
+        assert len(hits) == 2
+        assert "[absolute]" in hits[0].snippet
+
+    def test_version_filter(self, index: SearchIndex) -> None:
+        """버전 필터 적용."""
+        hits = index.search("absolute", version="3.12")
+
+        assert [hit.version for hit in hits] == ["3.12"]
+
+    def test_title_match_ranks_first(self, index: SearchIndex) -> None:
+        """제목 일치가 본문 일치보다 높은 순위."""
+        hits = index.search("classes")
+
+        assert hits[0].title == "Classes"
+
+    def test_unchanged_document_is_skipped(self, index: SearchIndex) -> None:
+        """content_hash가 같으면 다시 인덱싱하지 않음."""
+        document = _document(
+            "3.13",
+            "tutorial/classes.html",
+            "Classes",
+            "# Classes\n\nClasses provide a means of bundling data.",
+        )
+        assert index.upsert(document) is False
+
+        document = _document(
+            "3.13",
+            "tutorial/classes.html",
+            "Classes",
+            "# Classes\n\nInheritance is supported.",
+        )
+        assert index.upsert(document) is True
+        assert index.search("bundling") == []
+        assert len(index.search("inheritance")) == 1
+
+    def test_unchanged_document_costs_one_statement(self, index: SearchIndex) -> None:
+        """최신 문서 확인과 갱신을 문장 하나로 처리."""
+        document = _document(
+            "3.13",
+            "tutorial/classes.html",
+            "Classes",
+            "# Classes\n\nClasses provide a means of bundling data.",
+        )
+        index.commit()
+        statements: list[str] = []
+        index.conn.set_trace_callback(statements.append)
+
+        assert index.upsert(document) is False
+        assert [s.split()[0] for s in statements if s.strip() != "BEGIN"] == ["INSERT"]
+
+    def test_chunk_search(self, index: SearchIndex) -> None:
+        """청크 인덱스 검색 시 헤딩 경로 포함."""
+        document = _document(
+            "3.13",
+            "library/stdtypes.html",
+            "Built-in Types",
+            "# Built-in Types\n\n## Truth Value Testing\n\nAny object can be tested.",
+        )
+        index.upsert(document, MarkdownChunker())
+
+        hits = index.search("tested", chunks=True)
+
+        assert hits[0].heading == "Built-in Types > Truth Value Testing"
+
+    def test_special_characters_are_quoted(self, index: SearchIndex) -> None:
+        """FTS5 문법 문자가 포함된 검색어도 오류 없이 검색."""
+        assert to_match_expression('abs(x) "y"') == '"abs(x)" """y"""'
+        assert index.search("abs(x)")
+
+
+class TestSearchIndexPipeline:
+    """SearchIndexPipeline 테스트."""
+
+    def test_concurrent_crawlers_share_database(self, tmp_path: Path) -> None:
+        """같은 DB를 쓰는 두 크롤러의 파이프라인이 번갈아 써도 잠기지 않음."""
+        spider = Spider(name="python")
+        pipelines = [SearchIndexPipeline(tmp_path / "search.db") for _ in range(2)]
+        for pipeline in pipelines:
+            pipeline.open_spider(spider)
+
+        for i, version in enumerate(("3.12", "3.13") * 2):
+            document = _document(version, f"p{i}.html", f"Page {i}", f"본문 {i}")
+            pipelines[i % 2].process_item(document, spider)
+
+        for pipeline in pipelines:
+            pipeline.close_spider(spider)
+        assert len(SearchIndex(tmp_path / "search.db").search("본문", limit=10)) == 4
+
+    def test_chunks_indexed_for_unchanged_documents(self, tmp_path: Path) -> None:
+        """청크 인덱싱을 나중에 켜면 변경 없는 문서도 청크를 인덱싱."""
+        spider = Spider(name="python")
+        document = _document(
+            "3.13", "tutorial/classes.html", "Classes", "# Classes\n\n## Scopes\n\nx"
+        )
+        for index_chunks in (False, True, True):
+            pipeline = SearchIndexPipeline(tmp_path / "s.db", index_chunks=index_chunks)
+            pipeline.open_spider(spider)
+            pipeline.process_item(document, spider)
+            pipeline.close_spider(spider)
+
+        assert pipeline.skipped_count == 1
+        hits = SearchIndex(tmp_path / "s.db").search("scopes", chunks=True)
+        assert [hit.heading for hit in hits] == ["Classes > Scopes"]
@@ -0,0 +1,127 @@
+"""증분(streaming) 파싱 단위 테스트."""
+
+import gzip
+from typing import Any, ClassVar
+
+import pytest
+from scrapy import Request
+from scrapy.http import Headers, HtmlResponse
+from scrapy.utils.test import get_crawler
+
+from pydoc_crawler.middlewares import STREAM_META_KEY, StreamingParseMiddleware
+from pydoc_crawler.parsers import BaseDocParser, ParserRegistry
+from pydoc_crawler.parsers.streaming import (
+    StreamingDocument,
+    StreamingUnsupportedError,
+    supports,
+)
+from tests.unit.test_parsers import MKDOCS_HTML, SPHINX_HTML
+
+
+def _sphinx_page(sections: int = 40) -> bytes:
+    """섹션/코드 블록/블록 사이 텍스트가 섞인 큰 Sphinx 페이지."""
+    body = "".join(
+        f'<section id="s{i}"><h2>Section {i}<a class="headerlink" href="#">¶</a></h2>'
+        f"<p>Text with <code>code_{i}</code> and *stars*.</p> loose tail {i}"
+        f'<div class="highlight-python3"><div class="highlight"><pre>x = {i}\n'
+        f"print(x)</pre></div></div>"
+        f'<section id="s{i}-sub">intro text<ul><li>one</li><li>two</li></ul>'
+        f"</section> after sub</section>"
+        for i in range(sections)
+    )
+    return (
+        '<html><head><meta name="generator" content="Sphinx"><title>Big — Docs'
+        '</title></head><body><div class="sphinxsidebar"><h3>Nav</h3></div>'
+        '<div class="document"><div class="body"><section id="top">'
+        f'<h1>Big Page<a class="headerlink" href="#">¶</a></h1>{body}'
+        '</section></div></div><div class="footer"><p class="last-updated">'
+        "Last updated on Jan 01, 2025</p></div></body></html>"
+    ).encode()
+
+
+def _stream(
+    body: bytes, chunk: int, headers: dict[str, str] | None = None
+) -> dict[str, Any]:
+    headers = {"Content-Type": "text/html; charset=utf-8", **(headers or {})}
+    document = StreamingDocument(ParserRegistry(), Headers(headers))
+    for start in range(0, len(body), chunk):
+        document.feed(body[start : start + chunk])
+    return document.finish()
+
+
+def _parse(body: bytes) -> dict[str, Any]:
+    response = HtmlResponse(url="https://example.com/", body=body, encoding="utf-8")
+    return ParserRegistry().parse(response)
+
+
+class TestStreamingDocument:
+    """StreamingDocument 테스트."""
+
+    @pytest.mark.parametrize("chunk", [1, 97, 4096, 1 << 20])
+    def test_same_as_full_parse(self, chunk: int) -> None:
+        """조각 크기와 관계없이 일반 파싱과 같은 결과."""
+        body = _sphinx_page()
+        assert _stream(body, chunk) == _parse(body)
+
+    @pytest.mark.parametrize("html", [SPHINX_HTML, MKDOCS_HTML])
+    def test_engines(self, html: bytes) -> None:
+        """엔진별 최우선 본문 선택자 (MkDocs는 후보 안쪽의 article)."""
+        assert _stream(html, 64) == _parse(html)
+
+    def test_lower_priority_candidate(self) -> None:
+        """최우선 선택자가 없으면 다음 후보 전체를 변환."""
+        body = _sphinx_page(3).replace(b'class="body"', b'class="bodyless"')
+        assert _stream(body, 128) == _parse(body)
+
+    def test_gzip_chunks(self) -> None:
+        """압축된 조각을 증분 해제."""
+        body = _sphinx_page()
+        result = _stream(gzip.compress(body), 512, {"Content-Encoding": "gzip"})
+        assert result == _parse(body)
+
+    def test_blocks_emitted_during_download(self) -> None:
+        """다운로드가 끝나기 전에 닫힌 블록부터 변환."""
+        body = _sphinx_page(200)
+        document = StreamingDocument(ParserRegistry(), Headers({}))
+        document.feed(body[: len(body) // 2])
+        assert document.parts
+        assert document.parts[0] == "# Big Page"
+
+    def test_unsupported(self) -> None:
+        """결합자 선택자와 알 수 없는 압축은 스트리밍하지 않음."""
+
+        class NestedParser(BaseDocParser):
+            ENGINE = "nested"
+            CONTENT_SELECTORS: ClassVar[list[str]] = ["div.wrap > article"]
+
+        assert not supports(NestedParser())
+        assert supports(ParserRegistry().parsers["sphinx"])
+        with pytest.raises(StreamingUnsupportedError):
+            StreamingDocument(ParserRegistry(), Headers({"Content-Encoding": "lzma"}))
+
+
+def test_middleware_drops_inconsistent_stream() -> None:
+    """디코딩 크기가 응답 본문과 다르거나 캐시 응답이면 일반 파싱으로."""
+    crawler = get_crawler(settings_dict={"STREAMING_PARSE": True})
+    crawler.spider = type("Spider", (), {"parsers": ParserRegistry()})()
+    middleware = StreamingParseMiddleware.from_crawler(crawler)
+
+    body = _sphinx_page(3)
+    request = Request("https://example.com/")
+    headers = Headers({"Content-Type": "text/html"})
+    middleware.headers_received(headers, -1, request)
+    middleware.bytes_received(body, request)
+    response = HtmlResponse(request.url, body=body, request=request)
+    middleware.process_response(request, response)
+    assert STREAM_META_KEY in request.meta
+
+    middleware.headers_received(headers, -1, request)
+    middleware.bytes_received(body[:100], request)
+    middleware.process_response(request, response)
+    assert STREAM_META_KEY not in request.meta
+
+    middleware.headers_received(headers, len(body), request)
+    middleware.bytes_received(body, request)
+    cached = HtmlResponse(request.url, body=body, request=request, flags=["cached"])
+    middleware.process_response(request, cached)
+    assert STREAM_META_KEY not in request.meta
@@ -0,0 +1,41 @@
+"""전송량/스트림 통계 단위 테스트."""
+
+from types import SimpleNamespace
+
+from scrapy.http import Request, Response
+from scrapy.utils.test import get_crawler
+
+from pydoc_crawler.transfer import TransferStatsExtension
+
+HOST = "docs.python.org"
+
+
+def test_streams_counted_from_transferring_requests() -> None:
+    """대기열 요청은 빼고 전송 중인 요청만 세며, 응답마다 한 번만 집계."""
+    crawler = get_crawler()
+    slot = SimpleNamespace(transferring=set())
+    crawler.engine = SimpleNamespace(  # type: ignore[assignment]
+        downloader=SimpleNamespace(slots={HOST: slot})
+    )
+    extension = TransferStatsExtension.from_crawler(crawler)
+
+    requests = [
+        Request(f"https://{HOST}/{i}.html", meta={"download_slot": HOST})
+        for i in range(3)
+    ]
+    slot.transferring.update(requests[:2])  # 세 번째 요청은 슬롯 대기열
+    for request in requests[:2]:
+        # 리다이렉트 응답도 다운로드 시점에 집계되고 따로 끝낼 필요 없음
+        extension.response_downloaded(
+            Response(request.url, status=301, body=b"x" * 10), request
+        )
+        slot.transferring.discard(request)
+    slot.transferring.add(requests[2])
+    extension.response_downloaded(Response(requests[2].url, body=b""), requests[2])
+
+    extension.spider_closed()
+    stats = crawler.stats.get_stats()
+    assert stats[f"transfer/connection/{HOST}/requests"] == 3
+    assert stats[f"transfer/connection/{HOST}/streams_peak"] == 2
+    assert stats[f"transfer/connection/{HOST}/streams_mean"] == 1.33
+    assert stats["transfer/wire_bytes"] == 20
@@ -0,0 +1,137 @@
+"""URL 정규화 및 요청 지문 단위 테스트."""
+
+import pytest
+from scrapy import Spider
+from scrapy.crawler import Crawler
+from scrapy.dupefilters import RFPDupeFilter
+from scrapy.exceptions import DropItem
+from scrapy.http import HtmlResponse, Request
+from scrapy.statscollectors import MemoryStatsCollector
+
+from pydoc_crawler.middlewares import CanonicalRedirectMiddleware
+from pydoc_crawler.pipelines import ValidationPipeline
+from pydoc_crawler.urls import (
+    CanonicalRequestFingerprinter,
+    UrlCanonicalizer,
+    canonicalize_url,
+)
+
+BASE = "https://docs.python.org/3.13/tutorial"
+ALIASES = {"https://docs.python.org/3/": "https://docs.python.org/3.13/"}
+
+
+def _crawler() -> Crawler:
+    crawler = Crawler(Spider, {"URL_ALIASES": ALIASES})
+    crawler.stats = MemoryStatsCollector(crawler)
+    return crawler
+
+
+class TestCanonicalizeUrl:
+    """canonicalize_url 테스트."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            f"{BASE}/index.html",
+            f"{BASE}/",
+            f"{BASE}/#contents",
+            f"{BASE}/index.html?highlight=loop",
+            "HTTPS://Docs.Python.org:443/3.13/tutorial/index.html",
+            "https://docs.python.org/3/tutorial/index.html",
+        ],
+    )
+    def test_variants(self, url: str) -> None:
+        """같은 문서의 URL 변형은 같은 정규형."""
+        assert canonicalize_url(url, ALIASES) == f"{BASE}/"
+
+    def test_distinct_pages(self) -> None:
+        """다른 문서는 구분."""
+        assert canonicalize_url(f"{BASE}/classes.html#a") == f"{BASE}/classes.html"
+        assert canonicalize_url(f"{BASE}/classes.html") != canonicalize_url(
+            f"{BASE}/modules.html"
+        )
+
+    def test_keep_query(self) -> None:
+        """keep_query면 정렬된 쿼리 유지."""
+        canonicalize = UrlCanonicalizer(keep_query=True)
+
+        assert canonicalize(f"{BASE}/x.html?b=2&a=1") == f"{BASE}/x.html?a=1&b=2"
+
+    def test_version_alias_only_prefix(self) -> None:
+        """별칭은 접두사에만 적용 (3.12 등 다른 버전은 그대로)."""
+        url = "https://docs.python.org/3.12/tutorial/"
+
+        assert canonicalize_url(url, ALIASES) == url
+
+
+class TestCanonicalRequestFingerprinter:
+    """CanonicalRequestFingerprinter / dupefilter 연동 테스트."""
+
+    def test_dupefilter(self) -> None:
+        """URL 변형은 스케줄링 단계에서 한 번만 통과."""
+        fingerprinter = CanonicalRequestFingerprinter(_crawler())
+        dupefilter = RFPDupeFilter(fingerprinter=fingerprinter)
+
+        seen = [
+            dupefilter.request_seen(Request(url))
+            for url in (
+                f"{BASE}/index.html",
+                f"{BASE}/",
+                f"{BASE}/#x",
+                "https://docs.python.org/3/tutorial/index.html?q=1",
+                f"{BASE}/classes.html",
+            )
+        ]
+
+        assert seen == [False, True, True, True, False]
+
+    def test_canonical_url_matches_default_fingerprint(self) -> None:
+        """이미 정규형인 URL은 Scrapy 기본 지문과 동일 (기존 HTTP 캐시 유지)."""
+        from scrapy.utils.request import fingerprint
+
+        request = Request(f"{BASE}/classes.html")
+
+        assert CanonicalRequestFingerprinter().fingerprint(request) == fingerprint(
+            request
+        )
+
+
+class TestCanonicalRedirectMiddleware:
+    """CanonicalRedirectMiddleware 테스트."""
+
+    def _redirect(self, source: str, target: str) -> Request:
+        crawler = _crawler()
+        middleware = CanonicalRedirectMiddleware.from_crawler(crawler)
+        response = HtmlResponse(source, status=302, headers={"Location": target})
+        result = middleware.process_response(Request(source), response)
+        assert isinstance(result, Request)
+        return result
+
+    def test_alias_redirect_bypasses_filter(self) -> None:
+        """정규형이 같은 대상으로의 리다이렉트는 필터를 건너뜀."""
+        redirected = self._redirect(
+            "https://docs.python.org/3/tutorial/x.html", f"{BASE}/x.html"
+        )
+
+        assert redirected.dont_filter
+
+    def test_other_redirect_is_filtered(self) -> None:
+        """정규형이 다른 대상은 dupefilter를 거침."""
+        redirected = self._redirect(f"{BASE}/old.html", f"{BASE}/new.html")
+
+        assert not redirected.dont_filter
+
+
+def test_validation_uses_canonical_url() -> None:
+    """ValidationPipeline은 정규화된 URL 기준으로 중복 제거."""
+    pipeline = ValidationPipeline()
+    item = {
+        "source": "python",
+        "version": "3.13",
+        "title": "Tutorial",
+        "content_markdown": "# Tutorial",
+    }
+
+    pipeline.process_item({**item, "url": f"{BASE}/index.html"}, Spider("python"))
+    with pytest.raises(DropItem):
+        pipeline.process_item({**item, "url": f"{BASE}/#top"}, Spider("python"))